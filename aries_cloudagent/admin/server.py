@@ -21,6 +21,8 @@ from aiohttp_apispec import (
 
 from marshmallow import fields
 
+from ..anoncreds.worker_pool import CryptoWorkerPool
+from ..cache.base import BaseCache
 from ..config.injection_context import InjectionContext
 from ..config.logging import context_wallet_id
 from ..core.event_bus import Event, EventBus
@@ -85,6 +87,17 @@ class AdminStatusSchema(OpenAPISchema):
     conductor = fields.Dict(
         required=False, metadata={"description": "Conductor statistics"}
     )
+    cache = fields.Dict(required=False, metadata={"description": "Cache statistics"})
+    event_bus = fields.Dict(
+        required=False, metadata={"description": "Event dispatch statistics"}
+    )
+    crypto_workers = fields.Dict(
+        required=False, metadata={"description": "Crypto worker pool statistics"}
+    )
+    multitenant = fields.Dict(
+        required=False,
+        metadata={"description": "Multitenant lookup and profile cache statistics"},
+    )
 
 
 class AdminResetSchema(OpenAPISchema):
@@ -695,6 +708,19 @@ class AdminServer(BaseAdminServer):
             status["timing"] = collector.results
         if self.conductor_stats:
             status["conductor"] = await self.conductor_stats()
+        cache = self.context.inject_or(BaseCache)
+        cache_stats = cache and cache.stats()
+        if cache_stats:
+            status["cache"] = cache_stats
+        event_bus = self.context.inject_or(EventBus)
+        if event_bus:
+            status["event_bus"] = event_bus.stats()
+        crypto_pool = self.context.inject_or(CryptoWorkerPool)
+        if crypto_pool:
+            status["crypto_workers"] = crypto_pool.stats()
+        multitenant_mgr = self.context.inject_or(BaseMultitenantManager)
+        if multitenant_mgr:
+            status["multitenant"] = multitenant_mgr.stats()
         return web.json_response(status)
 
     @docs(tags=["server"], summary="Reset statistics")
@@ -712,6 +738,18 @@ class AdminServer(BaseAdminServer):
         collector = self.context.inject_or(Collector)
         if collector:
             collector.reset()
+        cache = self.context.inject_or(BaseCache)
+        if cache:
+            cache.reset_stats()
+        event_bus = self.context.inject_or(EventBus)
+        if event_bus:
+            event_bus.reset_stats()
+        crypto_pool = self.context.inject_or(CryptoWorkerPool)
+        if crypto_pool:
+            crypto_pool.reset_stats()
+        multitenant_mgr = self.context.inject_or(BaseMultitenantManager)
+        if multitenant_mgr:
+            multitenant_mgr.reset_stats()
         return web.json_response({})
 
     async def redirect_handler(self, request: web.BaseRequest):
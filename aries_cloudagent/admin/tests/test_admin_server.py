@@ -7,12 +7,17 @@ from unittest import IsolatedAsyncioTestCase
 from aiohttp import ClientSession, DummyCookieJar, TCPConnector, web
 from aiohttp.test_utils import unused_port
 
+from ...anoncreds.worker_pool import CryptoWorkerPool
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
 from ...config.default_context import DefaultContextBuilder
 from ...config.injection_context import InjectionContext
 from ...core.event_bus import Event
 from ...core.in_memory import InMemoryProfile
 from ...core.protocol_registry import ProtocolRegistry
 from ...core.goal_code_registry import GoalCodeRegistry
+from ...multitenant.base import BaseMultitenantManager
+from ...multitenant.manager import MultitenantManager
 from ...utils.stats import Collector
 from ...utils.task_queue import TaskQueue
 
@@ -421,6 +426,41 @@ class TestAdminServer(IsolatedAsyncioTestCase):
                 "localhost:8123/def",
             ]
 
+    async def test_status_cache_stats(self):
+        settings = {
+            "admin.admin_insecure_mode": True,
+        }
+        context = InjectionContext()
+        cache = InMemoryCache(max_entries=1)
+        context.injector.bind_instance(BaseCache, cache)
+        context.injector.bind_instance(CryptoWorkerPool, CryptoWorkerPool(2))
+        multitenant_mgr = MultitenantManager(InMemoryProfile.test_profile())
+        context.injector.bind_instance(BaseMultitenantManager, multitenant_mgr)
+        server = self.get_admin_server(settings, context)
+        await server.start()
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("b")
+
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/status", headers={}
+        ) as response:
+            assert response.status == 200
+            result = await response.json()
+            assert result["cache"]["entries"] == 1
+            assert result["cache"]["hits"] == 1
+            assert result["cache"]["evictions"] == 1
+            assert result["crypto_workers"]["workers"] == 2
+            assert result["multitenant"]["profiles"]["capacity"] == 100
+
+        async with self.client_session.post(
+            f"http://127.0.0.1:{self.port}/status/reset", headers={}
+        ) as response:
+            assert response.status == 200
+        assert cache.stats()["hits"] == 0
+        assert multitenant_mgr.stats()["profiles"]["misses"] == 0
+        await server.stop()
+
     async def test_visit_shutting_down(self):
         settings = {
             "admin.admin_insecure_mode": True,
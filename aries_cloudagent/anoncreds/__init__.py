@@ -10,6 +10,16 @@ LOGGER = logging.getLogger(__name__)
 
 async def setup(context: InjectionContext):
     """Set up default resolvers."""
+    from .revocation import RevocationIndexAllocator
+
+    # Shared reservation of credential revocation indexes for issuance
+    context.injector.bind_instance(
+        RevocationIndexAllocator,
+        RevocationIndexAllocator(
+            context.settings.get_int("anoncreds.revocation_index_block")
+        ),
+    )
+
     registry = context.inject_or(AnonCredsRegistry)
     if not registry:
         LOGGER.error("No AnonCredsRegistry instance found in context!!!")
@@ -5,7 +5,9 @@ import json
 import logging
 import re
 import uuid
-from typing import Dict, Optional, Sequence, Tuple, Union
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from anoncreds import (
     AnoncredsError,
@@ -24,15 +26,71 @@ from ..askar.profile_anon import AskarAnoncredsProfile
 from ..core.error import BaseError
 from ..core.profile import Profile
 from ..ledger.base import BaseLedger
+from ..storage.error import StorageSearchError
+from ..storage.in_memory import tag_query_match
 from ..wallet.error import WalletNotFoundError
 from .error_messages import ANONCREDS_PROFILE_REQUIRED_MSG
 from .models.anoncreds_cred_def import CredDef
+from .worker_pool import run_crypto
 
 LOGGER = logging.getLogger(__name__)
 
 CATEGORY_CREDENTIAL = "credential"
 CATEGORY_MASTER_SECRET = "master_secret"
 
+CRED_INFO_CACHE_SIZE = 1000
+
+# parsed credential info by credential id, least recent first, kept for each
+# profile instance and released along with it
+_CRED_INFO_CACHES: "WeakKeyDictionary[Profile, OrderedDict[str, dict]]" = (
+    WeakKeyDictionary()
+)
+
+
+def create_presentation_in_worker(
+    presentation_request: dict,
+    credentials: Dict[str, str],
+    attributes: Sequence[tuple],
+    predicates: Sequence[tuple],
+    self_attest: dict,
+    link_secret: str,
+    schemas: dict,
+    cred_defs: dict,
+) -> str:
+    """Create a presentation, returning it as JSON.
+
+    May run in a worker process, so only plain values are passed in and out.
+    Requested attributes are given as (credential id, referent, revealed,
+    timestamp, revocation state) and requested predicates as (credential id,
+    referent, timestamp, revocation state).
+    """
+    creds = {cred_id: Credential.load(cred) for cred_id, cred in credentials.items()}
+    present_creds = PresentCredentials()
+    for cred_id, reft, reveal, timestamp, rev_state in attributes:
+        present_creds.add_attributes(
+            creds[cred_id],
+            reft,
+            reveal=reveal,
+            timestamp=timestamp,
+            rev_state=rev_state,
+        )
+    for cred_id, reft, timestamp, rev_state in predicates:
+        present_creds.add_predicates(
+            creds[cred_id],
+            reft,
+            timestamp=timestamp,
+            rev_state=rev_state,
+        )
+    presentation = Presentation.create(
+        presentation_request,
+        present_creds,
+        self_attest,
+        link_secret,
+        schemas,
+        cred_defs,
+    )
+    return presentation.to_json()
+
 
 def _make_cred_info(cred_id, cred: Credential):
     cred_info = cred.to_dict()  # not secure!
@@ -47,6 +105,22 @@ def _make_cred_info(cred_id, cred: Credential):
     }
 
 
+def _load_cred_info(profile: Profile, cred_id: str, raw_value: bytes) -> dict:
+    """Parse a stored credential into its info, reusing recently parsed results."""
+    cache = _CRED_INFO_CACHES.get(profile)
+    if cache is None:
+        cache = _CRED_INFO_CACHES[profile] = OrderedDict()
+    cred_info = cache.get(cred_id)
+    if cred_info is None:
+        cred_info = _make_cred_info(cred_id, Credential.load(raw_value))
+        cache[cred_id] = cred_info
+        if len(cache) > CRED_INFO_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(cred_id)
+    return {**cred_info, "attrs": dict(cred_info["attrs"])}
+
+
 def _normalize_attr_name(name: str) -> str:
     return name.replace(" ", "")
 
@@ -357,8 +431,7 @@ class AnonCredsHolder:
                 self.profile.settings.get("wallet.askar_profile"),
             )
             async for row in rows:
-                cred = Credential.load(row.raw_value)
-                result.append(_make_cred_info(row.name, cred))
+                result.append(_load_cred_info(self.profile, row.name, row.raw_value))
         except AskarError as err:
             raise AnonCredsHolderError("Error retrieving credentials") from err
         except AnoncredsError as err:
@@ -392,8 +465,7 @@ class AnonCredsHolder:
             )
         extra_query = extra_query or {}
 
-        creds = {}
-
+        filters = {}
         for reft in referents:
             names = set()
             if reft in presentation_request["requested_attributes"]:
@@ -422,32 +494,94 @@ class AnonCredsHolder:
                 tag_filter = {"$and": [tag_filter] + restr}
             if extra_query:
                 tag_filter = {"$and": [tag_filter, extra_query]}
+            filters[reft] = tag_filter
+
+        interval = presentation_request.get("non_revoked")
+        creds = None
+        if len(filters) > 1:
+            try:
+                creds = await self._match_referents_combined(
+                    filters, start, count, interval
+                )
+            except StorageSearchError as err:
+                LOGGER.debug("Matching credentials per referent: %s", err)
 
-            rows = self.profile.store.scan(
-                CATEGORY_CREDENTIAL,
-                tag_filter,
-                start,
-                count,
-                self.profile.settings.get("wallet.askar_profile"),
-            )
-            async for row in rows:
-                if row.name in creds:
-                    creds[row.name]["presentation_referents"].add(reft)
-                else:
-                    cred_info = _make_cred_info(
-                        row.name, Credential.load(row.raw_value)
-                    )
-                    creds[row.name] = {
-                        "cred_info": cred_info,
-                        "interval": presentation_request.get("non_revoked"),
-                        "presentation_referents": {reft},
-                    }
+        if creds is None:
+            creds = {}
+            for reft, tag_filter in filters.items():
+                rows = self.profile.store.scan(
+                    CATEGORY_CREDENTIAL,
+                    tag_filter,
+                    start,
+                    count,
+                    self.profile.settings.get("wallet.askar_profile"),
+                )
+                async for row in rows:
+                    if row.name in creds:
+                        creds[row.name]["presentation_referents"].add(reft)
+                    else:
+                        creds[row.name] = {
+                            "cred_info": _load_cred_info(
+                                self.profile, row.name, row.raw_value
+                            ),
+                            "interval": interval,
+                            "presentation_referents": {reft},
+                        }
 
         for cred in creds.values():
             cred["presentation_referents"] = list(cred["presentation_referents"])
 
         return list(creds.values())
 
+    async def _match_referents_combined(
+        self,
+        filters: Dict[str, dict],
+        start: int,
+        count: int,
+        interval: Optional[dict],
+    ) -> dict:
+        """Match credentials to several referents with a single store scan.
+
+        One scan is made for credentials matching any referent's tag filter, and
+        each row is assigned to its referents by evaluating the filters against
+        its tags. Each referent is paged by `start` and `count` as if it had been
+        scanned separately.
+
+        Raises:
+            StorageSearchError: if a tag filter cannot be evaluated in memory
+
+        """
+        skip = dict.fromkeys(filters, start or 0)
+        remaining = dict.fromkeys(filters, count)
+        creds = {}
+        rows = self.profile.store.scan(
+            CATEGORY_CREDENTIAL,
+            {"$or": list(filters.values())},
+            None,
+            None,
+            self.profile.settings.get("wallet.askar_profile"),
+        )
+        async for row in rows:
+            refts = set()
+            for reft, tag_filter in filters.items():
+                if remaining[reft] == 0 or not tag_query_match(row.tags, tag_filter):
+                    continue
+                if skip[reft]:
+                    skip[reft] -= 1
+                    continue
+                refts.add(reft)
+                if remaining[reft] is not None:
+                    remaining[reft] -= 1
+            if refts:
+                creds[row.name] = {
+                    "cred_info": _load_cred_info(self.profile, row.name, row.raw_value),
+                    "interval": interval,
+                    "presentation_referents": refts,
+                }
+            if not any(remaining.values()) and None not in remaining.values():
+                break
+        return creds
+
     async def get_credential(self, credential_id: str) -> str:
         """Get a credential stored in the wallet.
 
@@ -519,6 +653,11 @@ class AnonCredsHolder:
                 pass
             else:
                 raise AnonCredsHolderError("Error deleting credential") from err
+        finally:
+            # after the removal, so that a concurrent lookup cannot cache it again
+            cache = _CRED_INFO_CACHES.get(self.profile)
+            if cache is not None:
+                cache.pop(credential_id, None)
 
     async def get_mime_type(
         self, credential_id: str, attr: str = None
@@ -588,7 +727,7 @@ class AnonCredsHolder:
             return timestamp, rev_state
 
         self_attest = requested_credentials.get("self_attested_attributes") or {}
-        present_creds = PresentCredentials()
+        attributes: List[tuple] = []
         req_attrs = requested_credentials.get("requested_attributes") or {}
         for reft, detail in req_attrs.items():
             cred_id = detail["cred_id"]
@@ -596,13 +735,8 @@ class AnonCredsHolder:
                 # NOTE: could be optimized if multiple creds are requested
                 creds[cred_id] = await self._get_credential(cred_id)
             timestamp, rev_state = get_rev_state(cred_id, detail)
-            present_creds.add_attributes(
-                creds[cred_id],
-                reft,
-                reveal=detail["revealed"],
-                timestamp=timestamp,
-                rev_state=rev_state,
-            )
+            attributes.append((cred_id, reft, detail["revealed"], timestamp, rev_state))
+        predicates: List[tuple] = []
         req_preds = requested_credentials.get("requested_predicates") or {}
         for reft, detail in req_preds.items():
             cred_id = detail["cred_id"]
@@ -610,36 +744,32 @@ class AnonCredsHolder:
                 # NOTE: could be optimized if multiple creds are requested
                 creds[cred_id] = await self._get_credential(cred_id)
             timestamp, rev_state = get_rev_state(cred_id, detail)
-            present_creds.add_predicates(
-                creds[cred_id],
-                reft,
-                timestamp=timestamp,
-                rev_state=rev_state,
-            )
+            predicates.append((cred_id, reft, timestamp, rev_state))
 
         try:
             secret = await self.get_master_secret()
-            presentation = await asyncio.get_event_loop().run_in_executor(
-                None,
-                Presentation.create,
+            return await run_crypto(
+                self.profile,
+                "create_presentation",
+                create_presentation_in_worker,
                 presentation_request,
-                present_creds,
+                {cred_id: cred.to_json() for cred_id, cred in creds.items()},
+                attributes,
+                predicates,
                 self_attest,
                 secret,
                 {
-                    schema_id: schema.to_native()
+                    schema_id: schema.serialize()
                     for schema_id, schema in schemas.items()
                 },
                 {
-                    cred_def_id: cred_def.to_native()
+                    cred_def_id: cred_def.serialize()
                     for cred_def_id, cred_def in credential_definitions.items()
                 },
             )
         except AnoncredsError as err:
             raise AnonCredsHolderError("Error creating presentation") from err
 
-        return presentation.to_json()
-
     async def create_revocation_state(
         self,
         cred_rev_id: str,
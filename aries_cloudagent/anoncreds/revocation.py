@@ -8,7 +8,7 @@ import logging
 import os
 import time
 from pathlib import Path
-from typing import List, NamedTuple, Optional, Sequence, Tuple
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 from urllib.parse import urlparse
 from uuid import uuid4
 
@@ -21,7 +21,7 @@ from anoncreds import (
     RevocationRegistryDefinitionPrivate,
     RevocationStatusList,
 )
-from aries_askar.error import AskarError
+from aries_askar.error import AskarError, AskarErrorCode
 from requests import RequestException, Session
 
 from aries_cloudagent.anoncreds.models.anoncreds_cred_def import CredDef
@@ -51,6 +51,7 @@ from .models.anoncreds_revocation import (
 )
 from .registry import AnonCredsRegistry
 from .util import indy_client_dir
+from .worker_pool import run_crypto
 
 LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +59,7 @@ CATEGORY_REV_LIST = "revocation_list"
 CATEGORY_REV_REG_DEF = "revocation_reg_def"
 CATEGORY_REV_REG_DEF_PRIVATE = "revocation_reg_def_private"
 CATEGORY_REV_REG_ISSUER = "revocation_reg_def_issuer"
+CATEGORY_REV_INDEX = "revocation_index"
 STATE_REVOCATION_POSTED = "posted"
 STATE_REVOCATION_PENDING = "pending"
 REV_REG_DEF_STATE_ACTIVE = "active"
@@ -80,6 +82,151 @@ class RevokeResult(NamedTuple):
     failed: Optional[Sequence[str]] = None
 
 
+def create_credential_in_worker(
+    cred_def: str,
+    cred_def_private: str,
+    credential_offer: dict,
+    credential_request: dict,
+    raw_values: dict,
+    revocation: Optional[tuple] = None,
+) -> str:
+    """Create a credential, returning it as JSON.
+
+    May run in a worker process, so only plain values are passed in and out.
+    The revocation details are the revocation registry definition, its private
+    part, the revocation list and the credential's index.
+    """
+    credential = Credential.create(
+        cred_def,
+        cred_def_private,
+        credential_offer,
+        credential_request,
+        raw_values,
+        None,
+        CredentialRevocationConfig(*revocation) if revocation else None,
+    )
+    return credential.to_json()
+
+
+class RevocationIndexAllocator:
+    """Reserve blocks of credential revocation indexes for issuance.
+
+    The next unreserved index of each revocation registry is kept in a small
+    record of its own, so issuing a credential does not rewrite the revocation
+    list. Indexes are reserved from that record in blocks and handed out from
+    memory, so agent instances sharing a wallet only contend once per block.
+    Any indexes left in a block when the agent stops are never issued.
+    """
+
+    DEFAULT_BLOCK_SIZE = 1
+
+    def __init__(self, block_size: int = None):
+        """Initialize a `RevocationIndexAllocator` instance.
+
+        Args:
+            block_size: the number of indexes to reserve at a time
+
+        """
+        self.block_size = block_size or self.DEFAULT_BLOCK_SIZE
+        # looks like { (profile name, rev reg def id): [next index, end index] }
+        self._blocks: Dict[Tuple[str, str], List[int]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._final: Set[Tuple[str, str]] = set()
+
+    async def reserve(
+        self, profile: Profile, rev_reg_def_id: str, max_cred_num: int
+    ) -> int:
+        """Reserve the next credential revocation index for a registry.
+
+        Raises:
+            AnonCredsRevocationRegistryFullError: if no indexes remain
+
+        """
+        key = (profile.name, rev_reg_def_id)
+        block = self._blocks.get(key)
+        if not block:
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                block = self._blocks.get(key)
+                if not block:
+                    block = self._blocks[key] = await self._lease(
+                        profile, rev_reg_def_id, max_cred_num
+                    )
+        index = block[0]
+        block[0] += 1
+        if block[0] >= block[1]:
+            del self._blocks[key]
+        # the last index issued before rotating the registry is one less than
+        # max_cred_num, see AnonCredsRevocation.create_credential
+        if index >= max_cred_num - 1:
+            self._final.add(key)
+        return index
+
+    async def _lease(
+        self, profile: Profile, rev_reg_def_id: str, max_cred_num: int
+    ) -> List[int]:
+        """Reserve a block of indexes in the stored counter for a registry."""
+        for attempt in range(2):
+            counter = None
+            try:
+                async with profile.transaction() as txn:
+                    counter = await txn.handle.fetch(
+                        CATEGORY_REV_INDEX, rev_reg_def_id, for_update=True
+                    )
+                    if counter:
+                        start = counter.value_json["next_index"]
+                    else:
+                        # start from the index recorded in the revocation list
+                        rev_list = await txn.handle.fetch(
+                            CATEGORY_REV_LIST, rev_reg_def_id
+                        )
+                        if not rev_list:
+                            raise AnonCredsRevocationError(
+                                "Revocation registry not found"
+                            )
+                        start = rev_list.value_json["next_index"]
+                    if start > max_cred_num:
+                        raise AnonCredsRevocationRegistryFullError(
+                            "Revocation registry is full"
+                        )
+                    end = min(start + self.block_size, max_cred_num + 1)
+                    if counter:
+                        await txn.handle.replace(
+                            CATEGORY_REV_INDEX,
+                            rev_reg_def_id,
+                            value_json={"next_index": end},
+                        )
+                    else:
+                        await txn.handle.insert(
+                            CATEGORY_REV_INDEX,
+                            rev_reg_def_id,
+                            value_json={"next_index": end},
+                        )
+                    await txn.commit()
+            except AskarError as err:
+                if err.code == AskarErrorCode.DUPLICATE and not attempt:
+                    # another instance stored the counter first
+                    continue
+                raise AnonCredsRevocationError(
+                    "Error updating revocation registry index"
+                ) from err
+            return [start, end]
+
+    def take_final(self, profile: Profile, rev_reg_def_id: str) -> bool:
+        """Check once whether the last index of a registry was reserved here."""
+        key = (profile.name, rev_reg_def_id)
+        if key in self._final:
+            self._final.discard(key)
+            return True
+        return False
+
+    def retire(self, profile: Profile, rev_reg_def_id: str):
+        """Forget the reserved indexes of a registry which is no longer in use."""
+        key = (profile.name, rev_reg_def_id)
+        self._blocks.pop(key, None)
+        self._locks.pop(key, None)
+        self._final.discard(key)
+
+
 class AnonCredsRevocation:
     """Revocation registry operations manager."""
 
@@ -105,6 +252,10 @@ class AnonCredsRevocation:
         event_bus = self.profile.inject(EventBus)
         await event_bus.notify(self.profile, event)
 
+    def _index_allocator(self) -> RevocationIndexAllocator:
+        """Get the revocation index allocator."""
+        return self.profile.inject(RevocationIndexAllocator)
+
     async def _finish_registration(
         self,
         txn: AskarAnoncredsProfileSession,
@@ -745,65 +896,76 @@ class AnonCredsRevocation:
     # Registry Management
 
     async def handle_full_registry(self, rev_reg_def_id: str):
-        """Update the registry status and start the next registry generation."""
-        async with self.profile.session() as session:
-            active_rev_reg_def = await session.handle.fetch(
-                CATEGORY_REV_REG_DEF, rev_reg_def_id
-            )
-            if active_rev_reg_def:
-                # ok, we have an active rev reg.
-                # find the backup/fallover rev reg (finished and not active)
-                rev_reg_defs = await session.handle.fetch_all(
-                    CATEGORY_REV_REG_DEF,
-                    {
-                        "active": json.dumps(False),
-                        "cred_def_id": active_rev_reg_def.value_json["credDefId"],
-                        "state": RevRegDefState.STATE_FINISHED,
-                    },
-                    limit=1,
-                )
-                if len(rev_reg_defs):
-                    backup_rev_reg_def_id = rev_reg_defs[0].name
-                else:
-                    # attempted to create and register here but fails in practical usage.
-                    # the indexes and list do not get set properly (timing issue?)
-                    # if max cred num = 4 for instance, will get
-                    # Revocation status list does not have the index 4
-                    # in _create_credential calling Credential.create
-                    raise AnonCredsRevocationError(
-                        "Error handling full registry. No backup registry available."
-                    )
+        """Update the registry status and start the next registry generation.
 
-        # set the backup to active...
-        if backup_rev_reg_def_id:
-            await self.set_active_registry(backup_rev_reg_def_id)
+        Does nothing if the registry is no longer active, as when it has
+        already been replaced by another instance or an earlier attempt.
+        """
+        async with self.profile.transaction() as txn:
+            active_rev_reg_def = await txn.handle.fetch(
+                CATEGORY_REV_REG_DEF, rev_reg_def_id, for_update=True
+            )
+            if not active_rev_reg_def or active_rev_reg_def.tags.get(
+                "active"
+            ) != json.dumps(True):
+                self._index_allocator().retire(self.profile, rev_reg_def_id)
+                return
 
-            async with self.profile.transaction() as txn:
-                # re-fetch the old active (it's been updated), we need to mark as full
-                active_rev_reg_def = await txn.handle.fetch(
-                    CATEGORY_REV_REG_DEF, rev_reg_def_id, for_update=True
-                )
-                tags = active_rev_reg_def.tags
-                tags["state"] = RevRegDefState.STATE_FULL
-                await txn.handle.replace(
-                    CATEGORY_REV_REG_DEF,
-                    active_rev_reg_def.name,
-                    active_rev_reg_def.value,
-                    tags,
+            # find the backup/fallover rev reg (finished and not active)
+            rev_reg_defs = await txn.handle.fetch_all(
+                CATEGORY_REV_REG_DEF,
+                {
+                    "active": json.dumps(False),
+                    "cred_def_id": active_rev_reg_def.value_json["credDefId"],
+                    "state": RevRegDefState.STATE_FINISHED,
+                },
+                limit=1,
+                for_update=True,
+            )
+            if not rev_reg_defs:
+                # attempted to create and register here but fails in practical usage.
+                # the indexes and list do not get set properly (timing issue?)
+                # if max cred num = 4 for instance, will get
+                # Revocation status list does not have the index 4
+                # in _create_credential calling Credential.create
+                raise AnonCredsRevocationError(
+                    "Error handling full registry. No backup registry available."
                 )
-                await txn.commit()
+            backup_rev_reg_def = rev_reg_defs[0]
+            backup_rev_reg_def_id = backup_rev_reg_def.name
 
-            # create our next fallover/backup
-            backup_reg = await self.create_and_register_revocation_registry_definition(
-                issuer_id=active_rev_reg_def.value_json["issuerId"],
-                cred_def_id=active_rev_reg_def.value_json["credDefId"],
-                registry_type=active_rev_reg_def.value_json["revocDefType"],
-                tag=str(uuid4()),
-                max_cred_num=active_rev_reg_def.value_json["value"]["maxCredNum"],
+            # mark the old active as full, and set the backup to active
+            tags = active_rev_reg_def.tags
+            tags["active"] = json.dumps(False)
+            tags["state"] = RevRegDefState.STATE_FULL
+            await txn.handle.replace(
+                CATEGORY_REV_REG_DEF,
+                active_rev_reg_def.name,
+                active_rev_reg_def.value,
+                tags,
             )
-            LOGGER.info(f"previous rev_reg_def_id = {rev_reg_def_id}")
-            LOGGER.info(f"current rev_reg_def_id = {backup_rev_reg_def_id}")
-            LOGGER.info(f"backup reg = {backup_reg}")
+            tags = backup_rev_reg_def.tags
+            tags["active"] = json.dumps(True)
+            await txn.handle.replace(
+                CATEGORY_REV_REG_DEF,
+                backup_rev_reg_def_id,
+                backup_rev_reg_def.value,
+                tags,
+            )
+            await txn.commit()
+        self._index_allocator().retire(self.profile, rev_reg_def_id)
+
+        # create our next fallover/backup
+        backup_reg = await self.create_and_register_revocation_registry_definition(
+            issuer_id=active_rev_reg_def.value_json["issuerId"],
+            cred_def_id=active_rev_reg_def.value_json["credDefId"],
+            registry_type=active_rev_reg_def.value_json["revocDefType"],
+            tag=str(uuid4()),
+            max_cred_num=active_rev_reg_def.value_json["value"]["maxCredNum"],
+        )
+        LOGGER.info(f"previous rev_reg_def_id = {rev_reg_def_id}")
+        LOGGER.info(f"current rev_reg_def_id = {backup_rev_reg_def_id}")
+        LOGGER.info(f"backup reg = {backup_reg}")
 
     async def decommission_registry(self, cred_def_id: str):
         """Decommission post-init registries and start the next registry generation."""
@@ -847,7 +1009,15 @@ class AnonCredsRevocation:
                         rec.value,
                         tags,
                     )
+                    # no more indexes are reserved from a decommissioned registry
+                    if await txn.handle.fetch(
+                        CATEGORY_REV_INDEX, rec.name, for_update=True
+                    ):
+                        await txn.handle.remove(CATEGORY_REV_INDEX, rec.name)
             await txn.commit()
+        for rec in recs:
+            if rec.name != new_reg.rev_reg_def_id:
+                self._index_allocator().retire(self.profile, rec.name)
         # create a second one for backup, don't make it active
         backup_reg = await self.create_and_register_revocation_registry_definition(
             issuer_id=active_reg.rev_reg_def.issuer_id,
@@ -938,89 +1108,75 @@ class AnonCredsRevocation:
 
         if rev_reg_def_id and tails_file_path:
             try:
-                async with self.profile.transaction() as txn:
-                    rev_list = await txn.handle.fetch(CATEGORY_REV_LIST, rev_reg_def_id)
-                    rev_reg_def = await txn.handle.fetch(
+                async with self.profile.session() as session:
+                    rev_list = await session.handle.fetch(
+                        CATEGORY_REV_LIST, rev_reg_def_id
+                    )
+                    rev_reg_def = await session.handle.fetch(
                         CATEGORY_REV_REG_DEF, rev_reg_def_id
                     )
-                    rev_key = await txn.handle.fetch(
+                    rev_key = await session.handle.fetch(
                         CATEGORY_REV_REG_DEF_PRIVATE, rev_reg_def_id
                     )
-                    if not rev_list:
-                        raise AnonCredsRevocationError("Revocation registry not found")
-                    if not rev_reg_def:
-                        raise AnonCredsRevocationError(
-                            "Revocation registry definition not found"
-                        )
-                    if not rev_key:
-                        raise AnonCredsRevocationError(
-                            "Revocation registry definition private data not found"
-                        )
-                    # NOTE: we increment the index ahead of time to keep the
-                    # transaction short. The revocation registry itself will NOT
-                    # be updated because we always use ISSUANCE_BY_DEFAULT.
-                    # If something goes wrong later, the index will be skipped.
-                    # FIXME - double check issuance type in case of upgraded wallet?
-                    rev_info = rev_list.value_json
-                    rev_info_tags = rev_list.tags
-                    rev_reg_index = rev_info["next_index"]
-                    try:
-                        rev_reg_def = RevocationRegistryDefinition.load(
-                            rev_reg_def.raw_value
-                        )
-                        rev_list = RevocationStatusList.load(rev_info["rev_list"])
-                    except AnoncredsError as err:
-                        raise AnonCredsRevocationError(
-                            "Error loading revocation registry definition"
-                        ) from err
-                    if rev_reg_index > rev_reg_def.max_cred_num:
-                        raise AnonCredsRevocationRegistryFullError(
-                            "Revocation registry is full"
-                        )
-                    rev_info["next_index"] = rev_reg_index + 1
-                    await txn.handle.replace(
-                        CATEGORY_REV_LIST,
-                        rev_reg_def_id,
-                        value_json=rev_info,
-                        tags=rev_info_tags,
-                    )
-                    await txn.commit()
             except AskarError as err:
                 raise AnonCredsRevocationError(
-                    "Error updating revocation registry index"
+                    "Error retrieving revocation registry"
                 ) from err
+            if not rev_list:
+                raise AnonCredsRevocationError("Revocation registry not found")
+            if not rev_reg_def:
+                raise AnonCredsRevocationError(
+                    "Revocation registry definition not found"
+                )
+            if not rev_key:
+                raise AnonCredsRevocationError(
+                    "Revocation registry definition private data not found"
+                )
+            try:
+                max_cred_num = RevocationRegistryDefinition.load(
+                    rev_reg_def.raw_value
+                ).max_cred_num
+            except AnoncredsError as err:
+                raise AnonCredsRevocationError(
+                    "Error loading revocation registry definition"
+                ) from err
+            # NOTE: the index is reserved ahead of time. The revocation registry
+            # itself will NOT be updated because we always use ISSUANCE_BY_DEFAULT.
+            # If something goes wrong later, the index will be skipped.
+            # FIXME - double check issuance type in case of upgraded wallet?
+            rev_reg_index = await self._index_allocator().reserve(
+                self.profile, rev_reg_def_id, max_cred_num
+            )
 
-            # rev_info["next_index"] is 1 based but getting from
+            # the reserved index is 1 based but getting from
             # rev_list is zero based...
-            revoc = CredentialRevocationConfig(
-                rev_reg_def,
+            revoc = (
+                rev_reg_def.raw_value,
                 rev_key.raw_value,
-                rev_list,
+                rev_list.value_json["rev_list"],
                 rev_reg_index,
             )
             credential_revocation_id = str(rev_reg_index)
         else:
             revoc = None
             credential_revocation_id = None
-            rev_list = None
 
         try:
-            credential = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: Credential.create(
-                    cred_def.raw_value,
-                    cred_def_private.raw_value,
-                    credential_offer,
-                    credential_request,
-                    raw_values,
-                    None,
-                    revoc,
-                ),
+            credential_json = await run_crypto(
+                self.profile,
+                "create_credential",
+                create_credential_in_worker,
+                cred_def.raw_value,
+                cred_def_private.raw_value,
+                credential_offer,
+                credential_request,
+                raw_values,
+                revoc,
             )
         except AnoncredsError as err:
             raise AnonCredsRevocationError("Error creating credential") from err
 
-        return credential.to_json(), credential_revocation_id
+        return credential_json, credential_revocation_id
 
     async def create_credential(
         self,
@@ -1088,18 +1244,19 @@ class AnonCredsRevocation:
                     tails_file_path,
                 )
             except AnonCredsRevocationRegistryFullError:
-                # unlucky, another instance filled the registry first
+                # another instance filled the registry first, or the registry
+                # was not replaced when its last indexes were reserved
+                await self.handle_full_registry(rev_reg_def_id)
                 continue
 
             # cred rev id is zero based
             # max cred num is one based
             # however, if we wait until max cred num is reached, we are too late.
-            if rev_reg_def_result:
-                if (
-                    rev_reg_def_result.rev_reg_def.value.max_cred_num
-                    <= int(cred_rev_id) + 1
-                ):
-                    await self.handle_full_registry(rev_reg_def_id)
+            # The instance reserving the last index to issue rotates the registry.
+            if rev_reg_def_result and self._index_allocator().take_final(
+                self.profile, rev_reg_def_id
+            ):
+                await self.handle_full_registry(rev_reg_def_id)
 
             return cred_json, cred_rev_id, rev_reg_def_id
 
@@ -1179,6 +1336,9 @@ class AnonCredsRevocation:
                     cred_def_entry = await session.handle.fetch(
                         CATEGORY_CRED_DEF, rev_reg_def_entry.value_json["credDefId"]
                     )
+                    rev_index_entry = await session.handle.fetch(
+                        CATEGORY_REV_INDEX, revoc_reg_id
+                    )
             except AskarError as err:
                 raise AnonCredsRevocationError(
                     f"Error retrieving cred def {rev_reg_def_entry.value_json['credDefId']}"  # noqa: E501
@@ -1204,6 +1364,11 @@ class AnonCredsRevocation:
             failed_crids = set()
             max_cred_num = rev_reg_def.value.max_cred_num
             rev_info = rev_list_entry.value_json
+            next_index = (
+                rev_index_entry.value_json["next_index"]
+                if rev_index_entry
+                else rev_info["next_index"]
+            )
             cred_revoc_ids = (rev_info["pending"] or []) + (additional_crids or [])
             rev_list = RevList.deserialize(rev_info["rev_list"])
 
@@ -1216,7 +1381,7 @@ class AnonCredsRevocation:
                         rev_id,
                     )
                     failed_crids.add(rev_id)
-                elif rev_id >= rev_info["next_index"]:
+                elif rev_id >= next_index:
                     LOGGER.warning(
                         "Skipping requested credential revocation"
                         "on rev reg id %s, cred rev id=%s not yet issued",
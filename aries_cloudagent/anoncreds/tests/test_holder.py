@@ -105,6 +105,26 @@ class MockCredScan:
         raise StopAsyncIteration
 
 
+class MockTaggedScan:
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.rows:
+            return self.rows.pop(0)
+        raise StopAsyncIteration
+
+
+class MockTaggedRow:
+    def __init__(self, cred_id, **attrs):
+        self.name = cred_id
+        self.raw_value = MOCK_CRED
+        self.tags = {f"attr::{attr}::value": value for attr, value in attrs.items()}
+
+
 class MockMimeTypeRecord:
     value_json = {"mime-type": "mime-type"}
 
@@ -366,6 +386,88 @@ class TestAnonCredsHolder(IsolatedAsyncioTestCase):
                 mock_pres_req, "not-found-ref", start=0, count=10
             )
 
+    async def test_get_credentials_for_presentation_request_combined(self):
+        rows = [
+            MockTaggedRow("cred-0", name="Alice", age="30"),
+            MockTaggedRow("cred-1", name="Bob"),
+            MockTaggedRow("cred-2", age="40"),
+            MockTaggedRow("cred-3", name="Carol", age="50"),
+        ]
+        self.profile.store = mock.Mock()
+        self.profile.store.scan = mock.Mock(
+            side_effect=lambda *args: MockTaggedScan(rows)
+        )
+        pres_req = {
+            "requested_attributes": {
+                "name_ref": {"name": "name"},
+                "alice_ref": {
+                    "name": "name",
+                    "restrictions": [{"attr::name::value": "Alice"}],
+                },
+            },
+            "requested_predicates": {
+                "age_ref": {"name": "age", "p_type": ">=", "p_value": 18},
+            },
+        }
+        result = await self.holder.get_credentials_for_presentation_request_by_referent(
+            pres_req, None, start=0, count=10
+        )
+        self.profile.store.scan.assert_called_once()
+        assert "$or" in self.profile.store.scan.call_args.args[1]
+        by_id = {
+            cred["cred_info"]["referent"]: set(cred["presentation_referents"])
+            for cred in result
+        }
+        assert by_id == {
+            "cred-0": {"name_ref", "alice_ref", "age_ref"},
+            "cred-1": {"name_ref"},
+            "cred-2": {"age_ref"},
+            "cred-3": {"name_ref", "age_ref"},
+        }
+
+        # each referent is paged separately
+        result = await self.holder.get_credentials_for_presentation_request_by_referent(
+            pres_req, ["name_ref", "age_ref"], start=1, count=1
+        )
+        by_id = {
+            cred["cred_info"]["referent"]: set(cred["presentation_referents"])
+            for cred in result
+        }
+        assert by_id == {"cred-1": {"name_ref"}, "cred-2": {"age_ref"}}
+
+        # filters which cannot be evaluated in memory are scanned separately
+        self.profile.store.scan.reset_mock()
+        pres_req["requested_attributes"]["name_ref"]["restrictions"] = [
+            {"attr::name::value": {"$like": "A%"}}
+        ]
+        await self.holder.get_credentials_for_presentation_request_by_referent(
+            pres_req, None, start=0, count=10
+        )
+        assert self.profile.store.scan.call_count == 4
+
+    def test_load_cred_info_cache(self):
+        other_profile = InMemoryProfile.test_profile()
+        with mock.patch.object(
+            test_module, "CRED_INFO_CACHE_SIZE", 2
+        ), mock.patch.object(
+            test_module.Credential, "load", wraps=test_module.Credential.load
+        ) as load:
+            first = test_module._load_cred_info(self.profile, "cred-0", MOCK_CRED)
+            first["attrs"]["first_name"] = "changed"
+            again = test_module._load_cred_info(self.profile, "cred-0", MOCK_CRED)
+            assert again["attrs"]["first_name"] == "Alice"
+            assert load.call_count == 1
+            test_module._load_cred_info(self.profile, "cred-1", MOCK_CRED)
+            test_module._load_cred_info(self.profile, "cred-2", MOCK_CRED)
+            assert list(test_module._CRED_INFO_CACHES[self.profile]) == [
+                "cred-1",
+                "cred-2",
+            ]
+            # profiles do not share cached credentials
+            test_module._load_cred_info(other_profile, "cred-1", MOCK_CRED)
+            assert load.call_count == 4
+            assert list(test_module._CRED_INFO_CACHES[other_profile]) == ["cred-1"]
+
     @mock.patch.object(InMemoryProfileSession, "handle")
     async def test_get_credential(self, mock_handle):
         mock_handle.fetch = mock.CoroutineMock(side_effect=[MockCredEntry(), None])
@@ -410,7 +512,9 @@ class TestAnonCredsHolder(IsolatedAsyncioTestCase):
                 AskarError(AskarErrorCode.UNEXPECTED, "test"),
             ]
         )
+        test_module._load_cred_info(self.profile, "cred-id", MOCK_CRED)
         await self.holder.delete_credential("cred-id")
+        assert "cred-id" not in test_module._CRED_INFO_CACHES[self.profile]
 
         mock_handle.remove.call_args_list[0].args == ("credential", "cred-id")
         mock_handle.remove.call_args_list[0].args == ("attribute-mime-types", "cred-id")
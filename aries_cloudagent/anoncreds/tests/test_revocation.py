@@ -1,3 +1,4 @@
+import asyncio
 import http
 import json
 import os
@@ -130,6 +131,10 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             },
             profile_class=AskarAnoncredsProfile,
         )
+        self.profile.context.injector.bind_instance(
+            test_module.RevocationIndexAllocator,
+            test_module.RevocationIndexAllocator(),
+        )
         self.revocation = test_module.AnonCredsRevocation(self.profile)
 
     async def test_init(self):
@@ -881,34 +886,34 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             await self.revocation.upload_tails_file(rev_reg_def)
 
     @mock.patch.object(InMemoryProfileSession, "handle")
-    @mock.patch.object(
-        test_module.AnonCredsRevocation, "set_active_registry", return_value=None
-    )
     @mock.patch.object(
         test_module.AnonCredsRevocation,
         "create_and_register_revocation_registry_definition",
         return_value="backup",
     )
-    async def test_handle_full_registry(
-        self, mock_create_and_register, mock_set_active_registry, mock_handle
-    ):
-        mock_handle.fetch = mock.CoroutineMock(return_value=MockRevRegDefEntry())
-        mock_handle.fetch_all = mock.CoroutineMock(
-            return_value=[
-                MockRevRegDefEntry(),
-                MockRevRegDefEntry(),
-            ]
-        )
+    async def test_handle_full_registry(self, mock_create_and_register, mock_handle):
+        active = MockRevRegDefEntry("test-rev-reg-def-id")
+        active.tags = {"state": RevRegDefState.STATE_FINISHED, "active": "true"}
+        backup = MockRevRegDefEntry("backup-rev-reg-def-id")
+        backup.tags = {"state": RevRegDefState.STATE_FINISHED, "active": "false"}
+        mock_handle.fetch = mock.CoroutineMock(return_value=active)
+        mock_handle.fetch_all = mock.CoroutineMock(return_value=[backup])
         mock_handle.replace = mock.CoroutineMock(return_value=None)
 
         await self.revocation.handle_full_registry("test-rev-reg-def-id")
         assert mock_create_and_register.called
-        assert mock_set_active_registry.called
-        assert mock_handle.fetch.call_count == 2
-        assert mock_handle.fetch_all.called
-        assert mock_handle.replace.called
+        assert active.tags == {"state": RevRegDefState.STATE_FULL, "active": "false"}
+        assert backup.tags["active"] == "true"
+        assert mock_handle.replace.call_count == 2
+
+        # already replaced: nothing to do
+        mock_create_and_register.reset_mock()
+        await self.revocation.handle_full_registry("test-rev-reg-def-id")
+        assert mock_handle.fetch_all.call_count == 1
+        assert not mock_create_and_register.called
 
         # no backup registry available
+        active.tags["active"] = "true"
         mock_handle.fetch_all = mock.CoroutineMock(return_value=[])
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await self.revocation.handle_full_registry("test-rev-reg-def-id")
@@ -963,8 +968,14 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
         )
         self.revocation.set_active_registry = mock.CoroutineMock(return_value=None)
         mock_handle.replace = mock.CoroutineMock(return_value=None)
+        # only the first registry has issued credentials
+        mock_handle.fetch = mock.CoroutineMock(side_effect=[MockEntry(), None])
+        mock_handle.remove = mock.CoroutineMock(return_value=None)
 
         result = await self.revocation.decommission_registry("test-rev-reg-def-id")
+        mock_handle.remove.assert_awaited_once_with(
+            test_module.CATEGORY_REV_INDEX, "active-reg-reg"
+        )
 
         assert isinstance(result, list)
         assert len(result) == 2
@@ -1116,17 +1127,22 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
                 MockEntry(
                     value_json={
                         "rev_list": rev_list.serialize(),
-                        "next_index": 0,
+                        "next_index": 1,
                     }
                 ),
                 MockEntry(raw_value=rev_reg_def.serialize()),
                 MockEntry(),
+                MockEntry(value_json={"next_index": 1}),
             ]
         )
         await call_test_func()
         assert mock_create.called
-        assert mock_handle.replace.called
-        assert mock_handle.fetch.call_count == 5
+        assert mock_handle.fetch.call_count == 6
+        mock_handle.replace.assert_called_once_with(
+            test_module.CATEGORY_REV_INDEX,
+            "test-rev-reg-def-id",
+            value_json={"next_index": 2},
+        )
 
         # revocation registry is full
         mock_handle.fetch = mock.CoroutineMock(
@@ -1136,16 +1152,114 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
                 MockEntry(
                     value_json={
                         "rev_list": rev_list.serialize(),
-                        "next_index": 101,
+                        "next_index": 1,
                     }
                 ),
                 MockEntry(raw_value=rev_reg_def.serialize()),
                 MockEntry(),
+                MockEntry(value_json={"next_index": 101}),
             ]
         )
-        with self.assertRaises(test_module.AnonCredsRevocationError):
+        with self.assertRaises(test_module.AnonCredsRevocationRegistryFullError):
             await call_test_func()
 
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    async def test_reserve_revocation_index_block(self, mock_handle):
+        allocator = test_module.RevocationIndexAllocator(block_size=3)
+        mock_handle.fetch = mock.CoroutineMock(
+            side_effect=[None, MockEntry(value_json={"next_index": 97})]
+        )
+        mock_handle.insert = mock.CoroutineMock(return_value=None)
+
+        assert await allocator.reserve(self.profile, "rev-reg-id", 100) == 97
+        mock_handle.insert.assert_called_once_with(
+            test_module.CATEGORY_REV_INDEX,
+            "rev-reg-id",
+            value_json={"next_index": 100},
+        )
+        assert not allocator.take_final(self.profile, "rev-reg-id")
+        # the rest of the block is handed out without storage access
+        assert await allocator.reserve(self.profile, "rev-reg-id", 100) == 98
+        assert not allocator.take_final(self.profile, "rev-reg-id")
+        assert await allocator.reserve(self.profile, "rev-reg-id", 100) == 99
+        assert mock_handle.fetch.call_count == 2
+        # the registry is rotated once the last index before max_cred_num is used
+        assert allocator.take_final(self.profile, "rev-reg-id")
+        assert not allocator.take_final(self.profile, "rev-reg-id")
+
+        mock_handle.fetch = mock.CoroutineMock(
+            return_value=MockEntry(value_json={"next_index": 100})
+        )
+        mock_handle.replace = mock.CoroutineMock(return_value=None)
+        assert await allocator.reserve(self.profile, "rev-reg-id", 100) == 100
+        mock_handle.replace.assert_called_once_with(
+            test_module.CATEGORY_REV_INDEX,
+            "rev-reg-id",
+            value_json={"next_index": 101},
+        )
+
+        mock_handle.fetch = mock.CoroutineMock(
+            return_value=MockEntry(value_json={"next_index": 101})
+        )
+        with self.assertRaises(test_module.AnonCredsRevocationRegistryFullError):
+            await allocator.reserve(self.profile, "rev-reg-id", 100)
+
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    async def test_reserve_revocation_index_retire(self, mock_handle):
+        allocator = test_module.RevocationIndexAllocator(block_size=10)
+        mock_handle.fetch = mock.CoroutineMock(
+            return_value=MockEntry(value_json={"next_index": 1})
+        )
+        mock_handle.replace = mock.CoroutineMock(return_value=None)
+
+        assert await allocator.reserve(self.profile, "rev-reg-id", 100) == 1
+        assert allocator._blocks and allocator._locks
+        allocator.retire(self.profile, "rev-reg-id")
+        assert not allocator._blocks and not allocator._locks
+
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    async def test_reserve_revocation_index_concurrent(self, mock_handle):
+        allocator = test_module.RevocationIndexAllocator(block_size=10)
+        mock_handle.fetch = mock.CoroutineMock(
+            return_value=MockEntry(value_json={"next_index": 1})
+        )
+        mock_handle.replace = mock.CoroutineMock(return_value=None)
+
+        indexes = await asyncio.gather(
+            *(allocator.reserve(self.profile, "rev-reg-id", 100) for _ in range(5))
+        )
+        assert sorted(indexes) == [1, 2, 3, 4, 5]
+        assert mock_handle.replace.call_count == 1
+        assert not allocator.take_final(self.profile, "rev-reg-id")
+
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    async def test_reserve_revocation_index_x(self, mock_handle):
+        allocator = test_module.RevocationIndexAllocator()
+        # another instance stored the counter first
+        mock_handle.fetch = mock.CoroutineMock(
+            side_effect=[
+                None,
+                MockEntry(value_json={"next_index": 1}),
+                MockEntry(value_json={"next_index": 2}),
+            ]
+        )
+        mock_handle.insert = mock.CoroutineMock(
+            side_effect=AskarError(AskarErrorCode.DUPLICATE, "test")
+        )
+        mock_handle.replace = mock.CoroutineMock(return_value=None)
+        assert await allocator.reserve(self.profile, "rev-reg-id", 100) == 2
+
+        mock_handle.fetch = mock.CoroutineMock(
+            side_effect=AskarError(AskarErrorCode.UNEXPECTED, "test")
+        )
+        with self.assertRaises(test_module.AnonCredsRevocationError):
+            await allocator.reserve(self.profile, "rev-reg-id", 100)
+
+        # no revocation list
+        mock_handle.fetch = mock.CoroutineMock(return_value=None)
+        with self.assertRaises(test_module.AnonCredsRevocationError):
+            await allocator.reserve(self.profile, "rev-reg-id", 100)
+
     @mock.patch.object(
         AnonCredsIssuer, "cred_def_supports_revocation", return_value=True
     )
@@ -1180,24 +1294,31 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             )
         )
 
+        self.revocation.handle_full_registry = mock.CoroutineMock()
         # Test private funtion seperately - very large
         self.revocation._create_credential = mock.CoroutineMock(
-            return_value=({"cred": "cred"}, 98)
+            side_effect=[
+                test_module.AnonCredsRevocationRegistryFullError("full"),
+                ({"cred": "cred"}, 98),
+            ]
         )
 
-        result = await self.revocation.create_credential(
-            credential_offer={
-                "schema_id": "CsQY9MGeD3CQP4EyuVFo5m:2:MYCO Biomarker:0.0.3",
-                "cred_def_id": "CsQY9MGeD3CQP4EyuVFo5m:3:CL:14951:MYCO_Biomarker",
-                "key_correctness_proof": {},
-                "nonce": "nonce",
-            },
-            credential_request={},
-            credential_values={},
-        )
+        with mock.patch.object(test_module.asyncio, "sleep", mock.CoroutineMock()):
+            result = await self.revocation.create_credential(
+                credential_offer={
+                    "schema_id": "CsQY9MGeD3CQP4EyuVFo5m:2:MYCO Biomarker:0.0.3",
+                    "cred_def_id": "CsQY9MGeD3CQP4EyuVFo5m:3:CL:14951:MYCO_Biomarker",
+                    "key_correctness_proof": {},
+                    "nonce": "nonce",
+                },
+                credential_request={},
+                credential_values={},
+            )
 
         assert isinstance(result, tuple)
         assert mock_supports_revocation.call_count == 1
+        # the full registry is replaced before retrying
+        self.revocation.handle_full_registry.assert_awaited_with("active-reg-reg")
 
     @mock.patch.object(InMemoryProfileSession, "handle")
     @mock.patch.object(RevList, "to_native")
@@ -1271,6 +1392,8 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
                 MockEntry(),
                 # cred def
                 MockEntry(),
+                # rev index counter
+                MockEntry(value_json={"next_index": 4}),
                 # updated rev list entry
                 MockEntry(
                     value_json={
@@ -1288,7 +1411,7 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             revoc_reg_id="test-rev-reg-id",
         )
 
-        assert mock_handle.fetch.call_count == 5
+        assert mock_handle.fetch.call_count == 6
         assert mock_handle.replace.called
         assert mock_rev_list_from_native.called
         assert mock_rev_list_to_native.called
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from copy import deepcopy
 from unittest import IsolatedAsyncioTestCase
 
@@ -21,6 +23,7 @@ from aries_cloudagent.anoncreds.models.anoncreds_schema import (
     AnonCredsSchema,
     GetSchemaResult,
 )
+from aries_cloudagent.anoncreds.worker_pool import CryptoWorkerPool
 from aries_cloudagent.askar.profile_anon import AskarAnoncredsProfile
 from aries_cloudagent.core.in_memory.profile import (
     InMemoryProfile,
@@ -37,6 +40,82 @@ from .mock_objects import (
 )
 
 
+class StubRegistry:
+    """Registry answering every lookup after a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = []
+
+    async def _lookup(self, *args):
+        self.calls.append(args)
+        await asyncio.sleep(self.latency)
+
+    async def get_schema(self, profile, schema_id):
+        await self._lookup("schema", schema_id)
+        return GetSchemaResult(
+            schema_id=schema_id,
+            schema=AnonCredsSchema(
+                issuer_id="issuer-id",
+                name="schema-name",
+                version="1.0",
+                attr_names=["attr1", "attr2"],
+            ),
+            schema_metadata={},
+            resolution_metadata={},
+        )
+
+    async def get_credential_definition(self, profile, cred_def_id):
+        await self._lookup("cred_def", cred_def_id)
+        return GetCredDefResult(
+            credential_definition_id=cred_def_id,
+            credential_definition=CredDef(
+                issuer_id="did:indy:sovrin:SGrjRL82Y9ZZbzhUDXokvQ",
+                schema_id="schema-id",
+                tag="tag",
+                type="CL",
+                value=CredDefValue(
+                    primary=CredDefValuePrimary("n", "s", {}, "rctxt", "z")
+                ),
+            ),
+            credential_definition_metadata={},
+            resolution_metadata={},
+        )
+
+    async def get_revocation_registry_definition(self, profile, rev_reg_id):
+        await self._lookup("rev_reg_def", rev_reg_id)
+        return GetRevRegDefResult(
+            revocation_registry_id=rev_reg_id,
+            revocation_registry=RevRegDef(
+                issuer_id="issuer-id",
+                cred_def_id="cred-def-id",
+                type="CL_ACCUM",
+                tag="tag",
+                value=RevRegDefValue(
+                    public_keys={},
+                    max_cred_num=1000,
+                    tails_hash="tails-hash",
+                    tails_location="tails-location",
+                ),
+            ),
+            resolution_metadata={},
+            revocation_registry_metadata={},
+        )
+
+    async def get_revocation_list(self, profile, rev_reg_id, timestamp):
+        await self._lookup("rev_list", rev_reg_id, timestamp)
+        return GetRevListResult(
+            revocation_list=RevList(
+                issuer_id="issuer-id",
+                rev_reg_def_id=rev_reg_id,
+                revocation_list=[],
+                current_accumulator=f"accum-{timestamp}",
+            ),
+            resolution_metadata={},
+            revocation_registry_metadata={},
+        )
+
+
 @pytest.mark.anoncreds
 class TestAnonCredsVerifier(IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
@@ -67,6 +146,47 @@ class TestAnonCredsVerifier(IsolatedAsyncioTestCase):
             non_revoked_req, MOCK_PRES, MOCK_CRED_DEFS
         )
 
+    async def test_non_revoc_intervals_irrevocable(self):
+        irrevocable = deepcopy(MOCK_CRED_DEFS)
+        for cred_def in irrevocable.values():
+            cred_def["value"].pop("revocation", None)
+        pres_req = deepcopy(MOCK_PRES_REQ)
+        pres_req["non_revoked"] = {"from": 1, "to": 2}
+        pres_req["requested_attributes"]["consent_attrs"]["non_revoked"] = {
+            "from": 1,
+            "to": 2,
+        }
+
+        msgs = self.verifier.non_revoc_intervals(pres_req, MOCK_PRES, irrevocable)
+        assert test_module.PresVerifyMsg.RMV_GLOBAL_NON_REVOC_INTERVAL in msgs
+        assert "non_revoked" not in pres_req
+        assert "non_revoked" not in pres_req["requested_attributes"]["consent_attrs"]
+
+    def test_verify_in_worker_error(self):
+        verified, error = test_module.verify_in_worker(
+            {"bad": "presentation"}, MOCK_PRES_REQ, {}, {}, {}, []
+        )
+        assert verified is False
+        assert error
+
+    async def test_verify_in_worker_process(self):
+        pool = CryptoWorkerPool(1, processes=True)
+        try:
+            verified, error = await pool.run(
+                "verify_presentation",
+                test_module.verify_in_worker,
+                {"bad": "presentation"},
+                MOCK_PRES_REQ,
+                {},
+                {},
+                {},
+                [],
+            )
+        finally:
+            pool.shutdown()
+        assert verified is False
+        assert error
+
     async def test_check_timestamps_with_names(self):
         self.profile.inject = mock.Mock(
             return_value=mock.MagicMock(
@@ -590,6 +710,61 @@ class TestAnonCredsVerifier(IsolatedAsyncioTestCase):
         assert isinstance(result, tuple)
         assert len(result) == 4
 
+    async def test_process_pres_identifiers_prefetch(self):
+        registry = StubRegistry(latency=0.05)
+        self.profile.inject = mock.Mock(return_value=registry)
+        identifiers = [
+            {
+                "schema_id": f"schema-{i % 3}",
+                "cred_def_id": f"cred-def-{i}",
+                "rev_reg_id": f"rev-reg-{i}",
+                "timestamp": 1234567890,
+            }
+            for i in range(5)
+        ]
+        identifiers.append(dict(identifiers[0]))
+
+        start = time.perf_counter()
+        schemas, cred_defs, rev_reg_defs, rev_lists = (
+            await self.verifier.process_pres_identifiers(identifiers)
+        )
+        elapsed = time.perf_counter() - start
+
+        # 3 schemas, 5 cred defs, 5 rev reg defs, 5 rev lists: one lookup each
+        assert len(registry.calls) == 18
+        assert len(set(registry.calls)) == 18
+        # a serial fetch takes 18 * latency
+        assert elapsed < 0.5
+        assert list(schemas) == ["schema-0", "schema-1", "schema-2"]
+        assert list(cred_defs) == [f"cred-def-{i}" for i in range(5)]
+        assert list(rev_reg_defs) == [f"rev-reg-{i}" for i in range(5)]
+        assert rev_lists["rev-reg-0"][1234567890]["currentAccumulator"] == (
+            "accum-1234567890"
+        )
+
+    async def test_process_pres_identifiers_shared(self):
+        registry = StubRegistry(latency=0.05)
+        self.profile.inject = mock.Mock(return_value=registry)
+        identifiers = [{"schema_id": "schema-id", "cred_def_id": "cred-def-id"}]
+        results = await asyncio.gather(
+            *(self.verifier.process_pres_identifiers(identifiers) for _ in range(3))
+        )
+        assert results[0] == results[1] == results[2]
+        assert len(registry.calls) == 2
+        assert not test_module._IN_FLIGHT
+
+    async def test_fetch_shared_error(self):
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("not found")
+
+        with self.assertRaises(ValueError):
+            await asyncio.gather(
+                test_module.fetch_shared(("key",), fail),
+                test_module.fetch_shared(("key",), fail),
+            )
+        assert not test_module._IN_FLIGHT
+
     async def test_verify_presentation(self):
         self.profile.inject = mock.Mock(
             return_value=mock.MagicMock(
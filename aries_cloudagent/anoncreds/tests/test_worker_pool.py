@@ -0,0 +1,58 @@
+import threading
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+from anoncreds import AnoncredsError, Schema
+
+from ...core.in_memory.profile import InMemoryProfile
+from ..worker_pool import CryptoWorkerPool, run_crypto
+
+
+@pytest.mark.anoncreds
+class TestCryptoWorkerPool(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pool = CryptoWorkerPool(2)
+
+    async def asyncTearDown(self):
+        self.pool.shutdown()
+
+    async def test_run(self):
+        name = await self.pool.run("op", lambda: threading.current_thread().name)
+        assert name.startswith("crypto")
+        assert await self.pool.run("op", max, 1, 3) == 3
+
+        stats = self.pool.stats()
+        assert stats["workers"] == 2
+        assert stats["processes"] is False
+        assert stats["pending"] == 0
+        assert stats["max_pending"] == 1
+        assert stats["operations"]["count"] == {"op:queue_wait": 2, "op:run": 2}
+
+        self.pool.reset_stats()
+        assert self.pool.stats()["operations"]["count"] == {}
+        assert self.pool.stats()["max_pending"] == 0
+
+    async def test_run_error(self):
+        with self.assertRaises(AnoncredsError):
+            await self.pool.run("op", Schema.load, "{}")
+        with self.assertRaises(ZeroDivisionError):
+            await self.pool.run("op", divmod, 1, 0)
+
+    async def test_run_processes(self):
+        pool = CryptoWorkerPool(1, processes=True)
+        try:
+            assert await pool.run("op", max, 1, 3) == 3
+            # anoncreds errors are raised again in the caller
+            with self.assertRaises(AnoncredsError):
+                await pool.run("op", Schema.load, "{}")
+        finally:
+            pool.shutdown()
+        assert pool.stats()["operations"]["count"]["op:run"] == 2
+
+    async def test_run_crypto(self):
+        profile = InMemoryProfile.test_profile()
+        assert await run_crypto(profile, "op", max, 1, 3) == 3
+
+        profile.context.injector.bind_instance(CryptoWorkerPool, self.pool)
+        assert await run_crypto(profile, "op", max, 1, 3) == 3
+        assert self.pool.stats()["operations"]["count"]["op:run"] == 1
@@ -4,7 +4,7 @@ import asyncio
 import logging
 from enum import Enum
 from time import time
-from typing import List, Mapping, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 
 from anoncreds import AnoncredsError, Presentation
 
@@ -13,9 +13,50 @@ from ..indy.models.xform import indy_proof_req2non_revoc_intervals
 from ..messaging.util import canon, encode
 from .models.anoncreds_cred_def import GetCredDefResult
 from .registry import AnonCredsRegistry
+from .worker_pool import run_crypto
 
 LOGGER = logging.getLogger(__name__)
 
+PREFETCH_CONCURRENCY = 10
+
+# registry lookups in progress, shared by concurrent verifications
+_IN_FLIGHT: Dict[tuple, asyncio.Future] = {}
+
+
+async def fetch_shared(key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Await a registry lookup, sharing a lookup already in progress for the key.
+
+    Cancelling one waiter does not cancel the lookup for the others.
+    """
+    future = _IN_FLIGHT.get(key)
+    if not future:
+        future = asyncio.ensure_future(fetch())
+        _IN_FLIGHT[key] = future
+        future.add_done_callback(lambda _: _IN_FLIGHT.pop(key, None))
+    return await asyncio.shield(future)
+
+
+def verify_in_worker(
+    pres: dict,
+    pres_req: dict,
+    schemas: dict,
+    cred_defs: dict,
+    rev_reg_defs: dict,
+    rev_lists: list,
+) -> Tuple[bool, Optional[str]]:
+    """Verify a presentation, returning the result and any error message.
+
+    May run in a worker process, so only plain values are passed in and out.
+    """
+    try:
+        presentation = Presentation.load(pres)
+        return (
+            presentation.verify(pres_req, schemas, cred_defs, rev_reg_defs, rev_lists),
+            None,
+        )
+    except AnoncredsError as err:
+        return (False, str(err))
+
 
 class PresVerifyMsg(str, Enum):
     """Credential verification codes."""
@@ -125,15 +166,24 @@ class AnonCredsVerifier:
         LOGGER.debug(f">>> got non-revoc intervals: {non_revoc_intervals}")
 
         # timestamp for irrevocable credential
-        cred_defs: List[GetCredDefResult] = []
+        anoncreds_registry = profile.inject(AnonCredsRegistry)
+        cred_defs: List[GetCredDefResult] = await asyncio.gather(
+            *(
+                fetch_shared(
+                    (profile.name, "cred_def", ident["cred_def_id"]),
+                    lambda cred_def_id=ident["cred_def_id"]: (
+                        anoncreds_registry.get_credential_definition(
+                            profile, cred_def_id
+                        )
+                    ),
+                )
+                for ident in pres["identifiers"]
+            )
+        )
         for index, ident in enumerate(pres["identifiers"]):
             LOGGER.debug(f">>> got (index, ident): ({index},{ident})")
             cred_def_id = ident["cred_def_id"]
-            anoncreds_registry = profile.inject(AnonCredsRegistry)
-            cred_def_result = await anoncreds_registry.get_credential_definition(
-                profile, cred_def_id
-            )
-            cred_defs.append(cred_def_result)
+            cred_def_result = cred_defs[index]
             if ident.get("timestamp"):
                 if not cred_def_result.credential_definition.value.revocation:
                     raise ValueError(
@@ -377,57 +427,82 @@ class AnonCredsVerifier:
         self,
         identifiers: list,
     ) -> Tuple[dict, dict, dict, dict]:
-        """Return schemas, cred_defs, rev_reg_defs, rev_lists."""
-        schema_ids = []
-        cred_def_ids = []
+        """Return schemas, cred_defs, rev_reg_defs, rev_lists.
 
-        schemas = {}
-        cred_defs = {}
-        rev_reg_defs = {}
-        rev_lists = {}
+        Each distinct artifact is fetched once, with up to `PREFETCH_CONCURRENCY`
+        registry lookups running at a time. Lookups already in progress for a
+        concurrent verification are shared rather than repeated.
+        """
+        anoncreds_registry = self.profile.inject(AnonCredsRegistry)
+        semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+        async def fetch(kind: str, lookup: Callable, *args):
+            async with semaphore:
+                return await fetch_shared(
+                    (self.profile.name, kind, *args),
+                    lambda: lookup(self.profile, *args),
+                )
 
+        # collect the distinct artifacts, in order of first appearance
+        schema_ids = {}
+        cred_def_ids = {}
+        rev_reg_ids = {}
+        rev_list_keys = {}
         for identifier in identifiers:
-            schema_ids.append(identifier["schema_id"])
-            cred_def_ids.append(identifier["cred_def_id"])
-
-            anoncreds_registry = self.profile.inject(AnonCredsRegistry)
-            # Build schemas for anoncreds
-            if identifier["schema_id"] not in schemas:
-                schemas[identifier["schema_id"]] = (
-                    await anoncreds_registry.get_schema(
-                        self.profile, identifier["schema_id"]
-                    )
-                ).schema.serialize()
-            if identifier["cred_def_id"] not in cred_defs:
-                cred_defs[identifier["cred_def_id"]] = (
-                    await anoncreds_registry.get_credential_definition(
-                        self.profile, identifier["cred_def_id"]
-                    )
-                ).credential_definition.serialize()
-
+            schema_ids[identifier["schema_id"]] = None
+            cred_def_ids[identifier["cred_def_id"]] = None
             if identifier.get("rev_reg_id"):
-                if identifier["rev_reg_id"] not in rev_reg_defs:
-                    rev_reg_defs[identifier["rev_reg_id"]] = (
-                        await anoncreds_registry.get_revocation_registry_definition(
-                            self.profile, identifier["rev_reg_id"]
-                        )
-                    ).revocation_registry.serialize()
-
+                rev_reg_ids[identifier["rev_reg_id"]] = None
                 if identifier.get("timestamp"):
-                    rev_lists.setdefault(identifier["rev_reg_id"], {})
-
-                    if (
-                        identifier["timestamp"]
-                        not in rev_lists[identifier["rev_reg_id"]]
-                    ):
-                        result = await anoncreds_registry.get_revocation_list(
-                            self.profile,
-                            identifier["rev_reg_id"],
-                            identifier["timestamp"],
-                        )
-                        rev_lists[identifier["rev_reg_id"]][
-                            identifier["timestamp"]
-                        ] = result.revocation_list.serialize()
+                    rev_list_keys[
+                        (identifier["rev_reg_id"], identifier["timestamp"])
+                    ] = None
+
+        results = await asyncio.gather(
+            *(
+                fetch("schema", anoncreds_registry.get_schema, schema_id)
+                for schema_id in schema_ids
+            ),
+            *(
+                fetch("cred_def", anoncreds_registry.get_credential_definition, cd_id)
+                for cd_id in cred_def_ids
+            ),
+            *(
+                fetch(
+                    "rev_reg_def",
+                    anoncreds_registry.get_revocation_registry_definition,
+                    rev_reg_id,
+                )
+                for rev_reg_id in rev_reg_ids
+            ),
+            *(
+                fetch(
+                    "rev_list",
+                    anoncreds_registry.get_revocation_list,
+                    rev_reg_id,
+                    timestamp,
+                )
+                for (rev_reg_id, timestamp) in rev_list_keys
+            ),
+        )
+        results = iter(results)
+
+        schemas = {
+            schema_id: next(results).schema.serialize() for schema_id in schema_ids
+        }
+        cred_defs = {
+            cd_id: next(results).credential_definition.serialize()
+            for cd_id in cred_def_ids
+        }
+        rev_reg_defs = {
+            rev_reg_id: next(results).revocation_registry.serialize()
+            for rev_reg_id in rev_reg_ids
+        }
+        rev_lists = {}
+        for rev_reg_id, timestamp in rev_list_keys:
+            rev_lists.setdefault(rev_reg_id, {})[timestamp] = next(
+                results
+            ).revocation_list.serialize()
         return (
             schemas,
             cred_defs,
@@ -471,28 +546,26 @@ class AnonCredsVerifier:
             )
             return (False, msgs)
 
-        try:
-            presentation = Presentation.load(pres)
-            verified = await asyncio.get_event_loop().run_in_executor(
-                None,
-                presentation.verify,
-                pres_req,
-                schemas,
-                credential_definitions,
-                rev_reg_defs,
-                [
-                    rev_list
-                    for timestamp_to_list in rev_lists.values()
-                    for rev_list in timestamp_to_list.values()
-                ],
-            )
-        except AnoncredsError as err:
-            s = str(err)
-            msgs.append(f"{PresVerifyMsg.PRES_VERIFY_ERROR.value}::{s}")
-            LOGGER.exception(
+        verified, error = await run_crypto(
+            self.profile,
+            "verify_presentation",
+            verify_in_worker,
+            pres,
+            pres_req,
+            schemas,
+            credential_definitions,
+            rev_reg_defs,
+            [
+                rev_list
+                for timestamp_to_list in rev_lists.values()
+                for rev_list in timestamp_to_list.values()
+            ],
+        )
+        if error:
+            msgs.append(f"{PresVerifyMsg.PRES_VERIFY_ERROR.value}::{error}")
+            LOGGER.error(
                 f"Validation of presentation on nonce={pres_req['nonce']} "
-                "failed with error"
+                f"failed with error: {error}"
             )
-            verified = False
 
         return (verified, msgs)
@@ -0,0 +1,139 @@
+"""Dedicated worker pool for anoncreds cryptographic operations."""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+from anoncreds import AnoncredsError
+
+from ..core.profile import Profile
+from ..utils.stats import Stats
+
+
+def _run_timed(
+    fn: Callable, args: tuple, portable_errors: bool
+) -> Tuple[float, float, Any, Optional[tuple]]:
+    """Run an operation in a worker, returning its start time and duration.
+
+    Anoncreds errors cannot be pickled, so when running in a worker process
+    they are returned as plain values and raised again by the caller.
+    """
+    start = time.monotonic()
+    try:
+        result = fn(*args)
+    except AnoncredsError as err:
+        if not portable_errors:
+            raise
+        return (
+            start,
+            time.monotonic() - start,
+            None,
+            (err.code, err.args[0], err.extra),
+        )
+    return (start, time.monotonic() - start, result, None)
+
+
+class CryptoWorkerPool:
+    """Run CPU-bound anoncreds operations on a pool of their own.
+
+    Keeping issuance, proof creation and verification off the event loop's
+    default executor means a burst of these operations does not delay other
+    blocking work, such as ledger or JSON-LD processing.
+
+    Workers are threads by default. With worker processes, only module-level
+    functions taking and returning plain values may be submitted. The time
+    each operation waits for a worker and the time it runs are recorded under
+    the operation name.
+    """
+
+    def __init__(self, workers: int = None, processes: bool = False):
+        """Initialize a `CryptoWorkerPool` instance.
+
+        Args:
+            workers: the number of workers, defaulting to the number of CPUs
+            processes: use worker processes rather than threads
+
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.processes = processes
+        self._executor: Executor = None
+        self._pending = 0
+        self.reset_stats()
+
+    @property
+    def executor(self) -> Executor:
+        """Accessor for the executor, started on first use."""
+        if not self._executor:
+            if self.processes:
+                self._executor = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="crypto"
+                )
+        return self._executor
+
+    async def run(self, operation: str, fn: Callable, *args) -> Any:
+        """Run an operation on a worker and return the result.
+
+        Args:
+            operation: the operation name under which timings are recorded
+            fn: the function to call
+            args: the positional arguments to the function
+
+        """
+        submitted = time.monotonic()
+        self._pending += 1
+        self._max_pending = max(self._max_pending, self._pending)
+        try:
+            (
+                start,
+                duration,
+                result,
+                error,
+            ) = await asyncio.get_event_loop().run_in_executor(
+                self.executor, _run_timed, fn, args, self.processes
+            )
+        finally:
+            self._pending -= 1
+        self._stats.log(f"{operation}:queue_wait", max(start - submitted, 0.0))
+        self._stats.log(f"{operation}:run", duration)
+        if error:
+            raise AnoncredsError(*error)
+        return result
+
+    def shutdown(self):
+        """Stop the workers once any running operations are complete."""
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """Return the pool size, queue depth and operation timings."""
+        return {
+            "workers": self.workers,
+            "processes": self.processes,
+            "pending": self._pending,
+            "max_pending": self._max_pending,
+            "operations": self._stats.extract(),
+        }
+
+    def reset_stats(self):
+        """Reset the operation timings."""
+        self._stats = Stats()
+        self._max_pending = self._pending
+
+
+async def run_crypto(profile: Profile, operation: str, fn: Callable, *args) -> Any:
+    """Run an operation on the crypto worker pool for a profile.
+
+    The event loop's default executor is used when no pool is configured.
+    """
+    pool = profile.inject_or(CryptoWorkerPool)
+    if pool:
+        return await pool.run(operation, fn, *args)
+    return await asyncio.get_event_loop().run_in_executor(None, fn, *args)
@@ -56,6 +56,13 @@ class BaseCache(ABC):
     async def flush(self):
         """Remove all items from the cache."""
 
+    def stats(self) -> Optional[dict]:
+        """Return cache statistics, if supported by the implementation."""
+        return None
+
+    def reset_stats(self):
+        """Reset the cache statistics, if supported by the implementation."""
+
     def acquire(self, key: Text):
         """Acquire a lock on a given cache key."""
         result = CacheKeyLock(self, key)
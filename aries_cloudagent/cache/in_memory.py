@@ -1,29 +1,104 @@
 """Basic in-memory cache implementation."""
 
+import sys
 import time
-from typing import Any, Sequence, Text, Union
+from collections import OrderedDict
+from typing import Any, Optional, Sequence, Text, Union
 
 from .base import BaseCache
 
 
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Estimate the memory footprint of a cached value in bytes.
+
+    Containers are walked to a limited depth; this is an approximation used to
+    enforce the cache byte budget, not an exact accounting.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= 8:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for v in value:
+            size += estimate_size(v, _depth + 1)
+    return size
+
+
 class InMemoryCache(BaseCache):
-    """Basic in-memory cache class."""
+    """Basic in-memory cache class.
+
+    Entries are kept in least-recently-used order, optionally bounded by a
+    maximum number of entries and an estimated total size in bytes. Expired
+    entries are dropped when they are accessed, and by a timer wheel which is
+    advanced incrementally on each cache operation.
+    """
 
-    def __init__(self):
-        """Initialize a `InMemoryCache` instance."""
+    WHEEL_SLOTS = 64
+    WHEEL_RESOLUTION = 1.0
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None):
+        """Initialize a `InMemoryCache` instance.
+
+        Args:
+            max_entries: the maximum number of cached keys, or `None` for no limit
+            max_bytes: the maximum estimated size of cached values,
+                or `None` for no limit
+
+        """
         super().__init__()
+        self._max_entries = max_entries or None
+        self._max_bytes = max_bytes or None
         # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } }
-        self._cache = {}
-
-    def _remove_expired_cache_items(self):
-        """Remove all expired items from cache."""
-        for key, val in self._cache.copy().items():  # iterate copy, del from original
-            cache_item_expiry = val["expires"]
-            if cache_item_expiry is None:
-                continue
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self._wheel = [set() for _ in range(self.WHEEL_SLOTS)]
+        self._wheel_tick = self._tick(time.perf_counter())
+        self.reset_stats()
+
+    def _tick(self, ts: float) -> int:
+        return int(ts / self.WHEEL_RESOLUTION)
+
+    def _remove(self, key: Text):
+        """Remove a single entry and its timer, if present."""
+        entry = self._cache.pop(key, None)
+        if entry:
+            if entry["expires"] is not None:
+                slot = self._tick(entry["expires"]) % self.WHEEL_SLOTS
+                self._wheel[slot].discard(key)
+            self._bytes -= entry.get("size", 0)
+
+    def _remove_expired_cache_items(self, now: float = None):
+        """Remove expired items from the timer wheel slots which have elapsed.
+
+        Only the slots passed since the last call are visited, so the cost is
+        proportional to the number of expiring keys rather than the cache size.
+        """
+        if now is None:
             now = time.perf_counter()
-            if now >= cache_item_expiry:
-                del self._cache[key]
+        current = self._tick(now)
+        if current <= self._wheel_tick:
+            return
+        start = max(self._wheel_tick, current - self.WHEEL_SLOTS)
+        for tick in range(start, current):
+            slot = self._wheel[tick % self.WHEEL_SLOTS]
+            if not slot:
+                continue
+            for key in [k for k in slot if self._cache[k]["expires"] <= now]:
+                self._remove(key)
+                self._expirations += 1
+        self._wheel_tick = current
+
+    def _evict(self):
+        """Evict the least recently used entries until within bounds."""
+        while self._cache and (
+            (self._max_entries and len(self._cache) > self._max_entries)
+            or (self._max_bytes and self._bytes > self._max_bytes)
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self._evictions += 1
 
     async def get(self, key: Text):
         """Get an item from the cache.
@@ -35,8 +110,20 @@ class InMemoryCache(BaseCache):
             The record found or `None`
 
         """
-        self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        now = time.perf_counter()
+        self._remove_expired_cache_items(now)
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry["expires"] is not None and now >= entry["expires"]:
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return entry["value"]
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """Add an item to the cache with an optional ttl.
@@ -49,10 +136,17 @@ class InMemoryCache(BaseCache):
             ttl: number of seconds that the record should persist
 
         """
-        self._remove_expired_cache_items()
-        expires_ts = time.perf_counter() + ttl if ttl else None
+        now = time.perf_counter()
+        self._remove_expired_cache_items(now)
+        expires_ts = now + ttl if ttl else None
+        size = estimate_size(value) if self._max_bytes else 0
         for key in [keys] if isinstance(keys, Text) else keys:
-            self._cache[key] = {"expires": expires_ts, "value": value}
+            self._remove(key)
+            self._cache[key] = {"expires": expires_ts, "value": value, "size": size}
+            self._bytes += size
+            if expires_ts is not None:
+                self._wheel[self._tick(expires_ts) % self.WHEEL_SLOTS].add(key)
+        self._evict()
 
     async def clear(self, key: Text):
         """Remove an item from the cache, if present.
@@ -61,10 +155,31 @@ class InMemoryCache(BaseCache):
             key: the key to remove
 
         """
-        if key in self._cache:
-            del self._cache[key]
+        self._remove(key)
 
     async def flush(self):
         """Remove all items from the cache."""
 
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self._wheel = [set() for _ in range(self.WHEEL_SLOTS)]
+
+    def stats(self) -> Optional[dict]:
+        """Return the cache size and hit, miss and eviction counters."""
+        return {
+            "entries": len(self._cache),
+            "max_entries": self._max_entries,
+            "bytes": self._bytes if self._max_bytes else None,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+    def reset_stats(self):
+        """Reset the cache counters."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
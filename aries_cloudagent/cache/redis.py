@@ -0,0 +1,357 @@
+"""Cache implementation shared between agent instances using a Redis server."""
+
+import asyncio
+import json
+import logging
+import ssl
+import uuid
+from typing import Any, List, Optional, Sequence, Text, Union
+from urllib.parse import unquote, urlparse
+
+from .base import BaseCache, CacheError, CacheKeyLock
+
+LOGGER = logging.getLogger(__name__)
+
+UNLOCK_SCRIPT = (
+    'if redis.call("get", KEYS[1]) == ARGV[1] then '
+    'return redis.call("del", KEYS[1]) else return 0 end'
+)
+
+
+class RedisError(CacheError):
+    """Error reply or connection failure from the Redis server."""
+
+
+def encode_command(*args) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode("utf-8")
+        elif not isinstance(arg, bytes):
+            arg = str(arg).encode("ascii")
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read a single RESP reply from a stream."""
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise EOFError("Connection closed by server")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode("utf-8")
+    if kind == b"-":
+        raise RedisError(body.decode("utf-8"))
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(body)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise RedisError(f"Unexpected reply from server: {line!r}")
+
+
+class RedisConnection:
+    """A single connection to a Redis server."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Initialize a `RedisConnection` instance."""
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *args) -> Any:
+        """Send a command and return the reply."""
+        self.writer.write(encode_command(*args))
+        await self.writer.drain()
+        return await read_reply(self.reader)
+
+    def close(self):
+        """Close the connection."""
+        self.writer.close()
+
+
+class RedisCache(BaseCache):
+    """Cache backed by a Redis server, shared by any agents using the same prefix.
+
+    Values are stored as JSON, so only JSON-serializable values may be cached.
+    Key locks are also held on the server, so that a single agent instance
+    produces a missing value while the others wait for it to be stored.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        prefix: str = "acapy:",
+        max_connections: int = 10,
+        timeout: float = 5.0,
+        lock_ttl: float = 30.0,
+        lock_poll: float = 0.05,
+    ):
+        """Initialize a `RedisCache` instance.
+
+        Args:
+            url: the server URL, as in `redis://[[user]:password@]host[:port][/db]`
+            prefix: the prefix applied to all keys on the server
+            max_connections: the maximum number of open connections
+            timeout: the timeout in seconds for each server command
+            lock_ttl: the maximum time in seconds to hold or wait for a key lock
+            lock_poll: the initial interval in seconds between lock checks
+
+        """
+        super().__init__()
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "rediss") or not parsed.hostname:
+            raise CacheError(f"Invalid Redis URL: {url}")
+        self._host = parsed.hostname
+        self._port = parsed.port or 6379
+        self._ssl = ssl.create_default_context() if parsed.scheme == "rediss" else None
+        self._username = unquote(parsed.username) if parsed.username else None
+        self._password = unquote(parsed.password) if parsed.password else None
+        self._db = int(parsed.path.strip("/") or 0)
+        self.prefix = prefix
+        self.timeout = timeout
+        self.lock_ttl = lock_ttl
+        self.lock_poll = lock_poll
+        self._idle: List[RedisConnection] = []
+        self._limit = asyncio.Semaphore(max_connections)
+        self.reset_stats()
+
+    async def _connect(self) -> RedisConnection:
+        reader, writer = await asyncio.open_connection(
+            self._host, self._port, ssl=self._ssl
+        )
+        conn = RedisConnection(reader, writer)
+        try:
+            if self._password:
+                if self._username:
+                    await conn.execute("AUTH", self._username, self._password)
+                else:
+                    await conn.execute("AUTH", self._password)
+            if self._db:
+                await conn.execute("SELECT", self._db)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    async def execute(self, *args) -> Any:
+        """Execute a command on a pooled connection.
+
+        Raises:
+            RedisError: if the server returns an error or cannot be reached
+
+        """
+        async with self._limit:
+            conn = self._idle.pop() if self._idle else None
+            try:
+                if not conn:
+                    conn = await asyncio.wait_for(self._connect(), self.timeout)
+                result = await asyncio.wait_for(conn.execute(*args), self.timeout)
+            except RedisError:
+                # an error reply leaves the connection usable
+                if conn:
+                    self._idle.append(conn)
+                self._errors += 1
+                raise
+            except (OSError, EOFError, asyncio.TimeoutError) as err:
+                if conn:
+                    conn.close()
+                self._errors += 1
+                raise RedisError(f"Error communicating with Redis server: {err}")
+            self._idle.append(conn)
+            return result
+
+    def _key(self, key: Text) -> str:
+        return self.prefix + key
+
+    async def get(self, key: Text):
+        """Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        try:
+            value = await self.execute("GET", self._key(key))
+        except RedisError as err:
+            LOGGER.warning("Error reading from cache: %s", err)
+            value = None
+        if value is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return json.loads(value)
+
+    async def set(
+        self, keys: Union[Text, Sequence[Text]], value: Any, ttl: Optional[int] = None
+    ):
+        """Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        try:
+            data = json.dumps(value)
+        except (TypeError, ValueError) as err:
+            raise CacheError(f"Cannot cache value: {err}") from err
+        expiry = ("PX", max(1, int(ttl * 1000))) if ttl else ()
+        try:
+            for key in [keys] if isinstance(keys, Text) else keys:
+                await self.execute("SET", self._key(key), data, *expiry)
+        except RedisError as err:
+            LOGGER.warning("Error writing to cache: %s", err)
+
+    async def clear(self, key: Text):
+        """Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        try:
+            await self.execute("DEL", self._key(key))
+        except RedisError as err:
+            LOGGER.warning("Error writing to cache: %s", err)
+
+    async def flush(self):
+        """Remove all items with this cache's key prefix."""
+        cursor = b"0"
+        while True:
+            cursor, keys = await self.execute(
+                "SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 500
+            )
+            if keys:
+                await self.execute("DEL", *keys)
+            if cursor in (b"0", 0):
+                break
+
+    async def try_lock(self, key: Text, token: str) -> bool:
+        """Attempt to take the shared lock on a cache key.
+
+        Returns:
+            `True` if the lock was taken, or could not be checked
+
+        """
+        try:
+            return bool(
+                await self.execute(
+                    "SET",
+                    self._key("lock:" + key),
+                    token,
+                    "NX",
+                    "PX",
+                    int(self.lock_ttl * 1000),
+                )
+            )
+        except RedisError as err:
+            LOGGER.warning("Error acquiring cache lock: %s", err)
+            return True
+
+    async def unlock(self, key: Text, token: str):
+        """Release the shared lock on a cache key if it is still held."""
+        try:
+            await self.execute(
+                "EVAL", UNLOCK_SCRIPT, 1, self._key("lock:" + key), token
+            )
+        except RedisError as err:
+            LOGGER.warning("Error releasing cache lock: %s", err)
+
+    def acquire(self, key: Text):
+        """Acquire a lock on a given cache key."""
+        result = RedisCacheKeyLock(self, key)
+        first = self._key_locks.setdefault(key, result)
+        if first is not result:
+            result.parent = first
+        return result
+
+    async def close(self):
+        """Close all idle connections."""
+        while self._idle:
+            self._idle.pop().close()
+
+    def stats(self) -> Optional[dict]:
+        """Return the hit, miss and lock wait counters."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "lock_waits": self._lock_waits,
+            "errors": self._errors,
+        }
+
+    def reset_stats(self):
+        """Reset the cache counters."""
+        self._hits = 0
+        self._misses = 0
+        self._lock_waits = 0
+        self._errors = 0
+
+
+class RedisCacheKeyLock(CacheKeyLock):
+    """A cache key lock which is also held on the Redis server.
+
+    When the value is missing, the lock waits until either the value is stored
+    by another agent instance, or the shared lock is obtained and this instance
+    is expected to produce the value.
+    """
+
+    cache: RedisCache
+
+    def __init__(self, cache: RedisCache, key: Text):
+        """Initialize the key lock."""
+        super().__init__(cache, key)
+        self._token: str = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await super().__aenter__()
+        if not self.done:
+            await self._acquire_shared()
+        return self
+
+    async def _acquire_shared(self):
+        token = uuid.uuid4().hex
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self.cache.lock_ttl
+        delay = self.cache.lock_poll
+        while True:
+            if await self.cache.try_lock(self.key, token):
+                self._token = token
+                # the previous holder may have stored the value since it was checked
+                found = await self.cache.get(self.key)
+                if found:
+                    self._future.set_result(found)
+                return
+            self.cache._lock_waits += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+            found = await self.cache.get(self.key)
+            if found:
+                self._future.set_result(found)
+                return
+            if loop.time() >= deadline:
+                LOGGER.warning("Timed out waiting for cache lock: %s", self.key)
+                return
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, releasing the shared lock if held."""
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        if self._token:
+            token, self._token = self._token, None
+            await self.cache.unlock(self.key, token)
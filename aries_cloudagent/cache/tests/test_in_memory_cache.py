@@ -67,6 +67,60 @@ class TestBasicCache:
             item = await cache.get(key)
             assert item is None
 
+    @pytest.mark.asyncio
+    async def test_sweep_expired(self, cache):
+        await cache.set("key", "value", 0.01)
+        await cache.set("other", "value", 3600)
+        assert "key" in cache._wheel[cache._tick(cache._cache["key"]["expires"]) % 64]
+        await sleep(0.02)
+        cache._remove_expired_cache_items(cache._cache["key"]["expires"] + 2)
+        assert "key" not in cache._cache
+        assert "other" in cache._cache
+        assert not any("key" in slot for slot in cache._wheel)
+        assert cache.stats()["expirations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_ttl(self, cache):
+        await cache.set("key", "value", 0.01)
+        await cache.set("key", "value")
+        assert not any("key" in slot for slot in cache._wheel)
+        await sleep(0.02)
+        assert await cache.get("key") == "value"
+
+    @pytest.mark.asyncio
+    async def test_max_entries_lru(self):
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert await cache.get("a") == 1
+        await cache.set("c", 3)
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        assert cache.stats() == {
+            "entries": 2,
+            "max_entries": 2,
+            "bytes": None,
+            "max_bytes": None,
+            "hits": 3,
+            "misses": 1,
+            "evictions": 1,
+            "expirations": 0,
+        }
+        cache.reset_stats()
+        assert cache.stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_max_bytes(self):
+        cache = InMemoryCache(max_bytes=2048)
+        await cache.set("a", "x" * 1000)
+        await cache.set("b", "y" * 1000)
+        assert cache.stats()["entries"] == 1
+        assert await cache.get("a") is None
+        assert await cache.get("b") == "y" * 1000
+        await cache.clear("b")
+        assert cache.stats()["bytes"] == 0
+
     @pytest.mark.asyncio
     async def test_flush(self, cache):
         await cache.flush()
@@ -0,0 +1,225 @@
+import asyncio
+import time
+from fnmatch import fnmatchcase
+
+import pytest
+
+from ..base import CacheError
+from ..redis import UNLOCK_SCRIPT, RedisCache, RedisError, read_reply
+
+
+class StandInServer:
+    """Minimal server speaking the Redis protocol, for the commands in use."""
+
+    def __init__(self, password: str = None):
+        self.data = {}
+        self.password = password
+        self.commands = []
+        self.server = None
+        self.port = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def lookup(self, key):
+        entry = self.data.get(key)
+        if entry and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            entry = None
+        return entry and entry[0]
+
+    async def handle(self, reader, writer):
+        authed = not self.password
+        try:
+            while True:
+                args = await read_reply(reader)
+                cmd = args[0].decode().upper()
+                self.commands.append(cmd)
+                if cmd == "AUTH":
+                    authed = args[-1].decode() == self.password
+                    reply = b"+OK\r\n" if authed else b"-WRONGPASS invalid\r\n"
+                elif not authed:
+                    reply = b"-NOAUTH Authentication required.\r\n"
+                else:
+                    reply = self.command(cmd, args[1:])
+                writer.write(reply)
+                await writer.drain()
+        except (EOFError, ConnectionError):
+            writer.close()
+
+    def bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def command(self, cmd, args):
+        if cmd == "SELECT":
+            return b"+OK\r\n"
+        if cmd == "GET":
+            return self.bulk(self.lookup(args[0]))
+        if cmd == "SET":
+            key, value, opts = args[0], args[1], [a.decode().upper() for a in args[2:]]
+            if "NX" in opts and self.lookup(key) is not None:
+                return b"$-1\r\n"
+            expires = None
+            if "PX" in opts:
+                expires = time.monotonic() + int(opts[opts.index("PX") + 1]) / 1000
+            self.data[key] = (value, expires)
+            return b"+OK\r\n"
+        if cmd == "DEL":
+            count = sum(1 for key in args if self.data.pop(key, None))
+            return b":%d\r\n" % count
+        if cmd == "SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            keys = [k for k in self.data if fnmatchcase(k.decode(), pattern)]
+            return (
+                b"*2\r\n"
+                + self.bulk(b"0")
+                + b"*%d\r\n" % len(keys)
+                + b"".join(self.bulk(k) for k in keys)
+            )
+        if cmd == "EVAL" and args[0].decode() == UNLOCK_SCRIPT:
+            if self.lookup(args[2]) == args[3]:
+                del self.data[args[2]]
+                return b":1\r\n"
+            return b":0\r\n"
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture()
+async def server():
+    server = StandInServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture()
+async def cache(server):
+    cache = RedisCache(f"redis://127.0.0.1:{server.port}", lock_poll=0.01)
+    yield cache
+    await cache.close()
+
+
+class TestRedisCache:
+    @pytest.mark.asyncio
+    async def test_get_set(self, cache, server):
+        assert await cache.get("key") is None
+        await cache.set("key", {"dictkey": "dval"})
+        assert server.data[b"acapy:key"][0] == b'{"dictkey": "dval"}'
+        assert await cache.get("key") == {"dictkey": "dval"}
+        await cache.set([f"key{i}" for i in range(4)], "value")
+        for i in range(4):
+            assert await cache.get(f"key{i}") == "value"
+        assert cache.stats()["hits"] == 5
+        assert cache.stats()["misses"] == 1
+        assert len(cache._idle) == 1
+
+    @pytest.mark.asyncio
+    async def test_set_expires(self, cache):
+        await cache.set("key", "value", 0.05)
+        assert await cache.get("key") == "value"
+        await asyncio.sleep(0.06)
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_set_not_serializable(self, cache):
+        with pytest.raises(CacheError):
+            await cache.set("key", object())
+
+    @pytest.mark.asyncio
+    async def test_clear_flush(self, cache, server):
+        await cache.set("key", "value")
+        await cache.set("other", "value")
+        server.data[b"unrelated"] = (b"1", None)
+        await cache.clear("key")
+        assert await cache.get("key") is None
+        await cache.flush()
+        assert await cache.get("other") is None
+        assert b"unrelated" in server.data
+
+    @pytest.mark.asyncio
+    async def test_auth_select(self):
+        server = StandInServer(password="secret")
+        await server.start()
+        cache = RedisCache(f"redis://:secret@127.0.0.1:{server.port}/2")
+        await cache.set("key", "value")
+        assert await cache.get("key") == "value"
+        assert server.commands[:3] == ["AUTH", "SELECT", "SET"]
+        await cache.close()
+
+        cache = RedisCache(f"redis://:wrong@127.0.0.1:{server.port}")
+        with pytest.raises(RedisError):
+            await cache.execute("GET", "key")
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_server_unavailable(self):
+        cache = RedisCache("redis://127.0.0.1:1", timeout=1)
+        assert await cache.get("key") is None
+        await cache.set("key", "value")
+        async with cache.acquire("key") as entry:
+            assert not entry.done
+            await entry.set_result("value")
+        assert cache.stats()["errors"] >= 3
+
+    def test_invalid_url(self):
+        with pytest.raises(CacheError):
+            RedisCache("http://localhost")
+
+    @pytest.mark.asyncio
+    async def test_acquire_shared(self, cache, server):
+        other = RedisCache(f"redis://127.0.0.1:{server.port}", lock_poll=0.01)
+        fetched = []
+
+        async def fetch(c: RedisCache):
+            async with c.acquire("key") as entry:
+                if entry.result:
+                    return entry.result
+                fetched.append(c)
+                await asyncio.sleep(0.05)
+                await entry.set_result("value")
+                return "value"
+
+        results = await asyncio.gather(fetch(cache), fetch(other), fetch(other))
+        assert results == ["value"] * 3
+        assert len(fetched) == 1
+        assert b"acapy:lock:key" not in server.data
+        assert (cache.stats()["lock_waits"] + other.stats()["lock_waits"]) > 0
+        await other.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_shared_no_result(self, cache, server):
+        other = RedisCache(f"redis://127.0.0.1:{server.port}", lock_poll=0.01)
+        lock = cache.acquire("key")
+        await lock.__aenter__()
+        assert b"acapy:lock:key" in server.data
+
+        async def wait_other():
+            async with other.acquire("key") as entry:
+                return entry.done
+
+        task = asyncio.ensure_future(wait_other())
+        await asyncio.sleep(0.03)
+        assert not task.done()
+        await lock.__aexit__(None, None, None)
+        # the holder produced nothing: the waiter takes the lock instead
+        assert await asyncio.wait_for(task, 1) is False
+        assert b"acapy:lock:key" not in server.data
+        await other.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(self, server):
+        cache = RedisCache(
+            f"redis://127.0.0.1:{server.port}", lock_ttl=0.05, lock_poll=0.01
+        )
+        server.data[b"acapy:lock:key"] = (b"other", None)
+        async with cache.acquire("key") as entry:
+            assert not entry.done
+        assert server.data[b"acapy:lock:key"] == (b"other", None)
+        await cache.close()
@@ -171,6 +171,40 @@ class AdminGroup(ArgumentGroup):
                 "admin API. If not specified, webhooks are not published by the agent."
             ),
         )
+        parser.add_argument(
+            "--webhook-batch-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WEBHOOK_BATCH_SIZE",
+            help=(
+                "Send webhooks in batches of up to <count> events, posted as a "
+                "JSON array of {topic, payload} objects to <webhook-url>/batch/. "
+                "Batches for each webhook URL are delivered in order. "
+                "Default: send each webhook separately."
+            ),
+        )
+        parser.add_argument(
+            "--webhook-batch-linger",
+            type=BoundedInt(min=0),
+            metavar="<milliseconds>",
+            env_var="ACAPY_WEBHOOK_BATCH_LINGER",
+            help=(
+                "With --webhook-batch-size, the maximum time to wait for more "
+                "events before sending a batch. Default: 100."
+            ),
+        )
+        parser.add_argument(
+            "--webhook-spool-dir",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_WEBHOOK_SPOOL_DIR",
+            help=(
+                "With --webhook-batch-size, keep batches which cannot be delivered "
+                "in files in this directory, and deliver them in order once the "
+                "webhook URL is reachable again, including after a restart. "
+                "Default: undeliverable batches are discarded."
+            ),
+        )
         parser.add_argument(
             "--admin-client-max-request-size",
             default=1,
@@ -209,6 +243,17 @@ class AdminGroup(ArgumentGroup):
             if hook_url:
                 hook_urls.append(hook_url)
             settings["admin.webhook_urls"] = hook_urls
+            if args.webhook_batch_size:
+                settings["admin.webhook_batch_size"] = args.webhook_batch_size
+            if args.webhook_batch_linger is not None:
+                settings["admin.webhook_batch_linger"] = args.webhook_batch_linger
+            if args.webhook_spool_dir:
+                if not args.webhook_batch_size:
+                    raise ArgsParseError(
+                        "--webhook-spool-dir cannot be used without "
+                        "--webhook-batch-size"
+                    )
+                settings["admin.webhook_spool_dir"] = args.webhook_spool_dir
 
             settings["admin.admin_client_max_request_size"] = (
                 args.admin_client_max_request_size or 1
@@ -592,6 +637,91 @@ class GeneralGroup(ArgumentGroup):
                 "wallet type is set to 'indy', otherwise 'basic'."
             ),
         )
+        parser.add_argument(
+            "--cache-max-entries",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CACHE_MAX_ENTRIES",
+            help=(
+                "Limit the number of entries held in the shared in-memory cache. "
+                "The least recently used entries are evicted first. "
+                "Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--cache-max-bytes",
+            type=BoundedInt(min=1),
+            metavar="<bytes>",
+            env_var="ACAPY_CACHE_MAX_BYTES",
+            help=(
+                "Limit the estimated total size in bytes of the values held in "
+                "the shared in-memory cache. The least recently used entries are "
+                "evicted first. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--cache-redis-url",
+            type=str,
+            metavar="<url>",
+            env_var="ACAPY_CACHE_REDIS_URL",
+            help=(
+                "Use a Redis server as the shared cache, so that cached ledger "
+                "and resolver results and key locks are shared between agent "
+                "instances, as in 'redis://:password@localhost:6379/0'. "
+                "Default: cache in memory."
+            ),
+        )
+        parser.add_argument(
+            "--cache-redis-prefix",
+            type=str,
+            metavar="<prefix>",
+            env_var="ACAPY_CACHE_REDIS_PREFIX",
+            help=(
+                "Prefix applied to cache keys stored in the Redis server. "
+                "Default: 'acapy:'."
+            ),
+        )
+        parser.add_argument(
+            "--concurrent-event-dispatch",
+            action="store_true",
+            env_var="ACAPY_CONCURRENT_EVENT_DISPATCH",
+            help=(
+                "Deliver events to each subscriber from its own queue, so that "
+                "a slow subscriber does not delay the code emitting the event or "
+                "other subscribers. Default: subscribers are called in turn."
+            ),
+        )
+        parser.add_argument(
+            "--event-queue-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_EVENT_QUEUE_SIZE",
+            help=(
+                "With --concurrent-event-dispatch, the maximum number of events "
+                "queued for a subscriber before the emitter is made to wait. "
+                "Default: 100."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-workers",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_WORKERS",
+            help=(
+                "Number of workers running AnonCreds credential issuance, "
+                "presentation creation and presentation verification, apart "
+                "from other blocking work. Default: the number of CPUs."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-worker-processes",
+            action="store_true",
+            env_var="ACAPY_CRYPTO_WORKER_PROCESSES",
+            help=(
+                "Run the AnonCreds crypto workers as separate processes rather "
+                "than threads. Default: threads."
+            ),
+        )
         parser.add_argument(
             "-e",
             "--endpoint",
@@ -677,6 +807,27 @@ class GeneralGroup(ArgumentGroup):
         if args.storage_type:
             settings["storage_type"] = args.storage_type
 
+        if args.cache_max_entries:
+            settings["cache.max_entries"] = args.cache_max_entries
+        if args.cache_max_bytes:
+            settings["cache.max_bytes"] = args.cache_max_bytes
+        if args.concurrent_event_dispatch:
+            settings["events.concurrent"] = True
+        if args.event_queue_size:
+            settings["events.queue_size"] = args.event_queue_size
+        if args.crypto_workers:
+            settings["anoncreds.crypto_workers"] = args.crypto_workers
+        if args.crypto_worker_processes:
+            settings["anoncreds.crypto_processes"] = True
+        if args.cache_redis_url:
+            settings["cache.redis_url"] = args.cache_redis_url
+        if args.cache_redis_prefix:
+            if not args.cache_redis_url:
+                raise ArgsParseError(
+                    "--cache-redis-prefix cannot be used without --cache-redis-url"
+                )
+            settings["cache.redis_prefix"] = args.cache_redis_prefix
+
         if args.endpoint:
             settings["default_endpoint"] = args.endpoint[0]
             settings["additional_endpoints"] = args.endpoint[1:]
@@ -762,6 +913,18 @@ class RevocationGroup(ArgumentGroup):
                 "for anoncreds credentials. Values are 'accept' or 'reject'."
             ),
         )
+        parser.add_argument(
+            "--revocation-index-block-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_INDEX_BLOCK_SIZE",
+            help=(
+                "Number of anoncreds credential revocation indexes reserved by "
+                "this instance at a time for each revocation registry. Larger "
+                "blocks reduce contention when issuing from many instances, "
+                "while indexes left unused on shutdown are skipped. Default: 1."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract revocation settings."""
@@ -781,6 +944,10 @@ class RevocationGroup(ArgumentGroup):
             settings["revocation.anoncreds_legacy_support"] = (
                 args.anoncreds_legacy_revocation
             )
+        if args.revocation_index_block_size:
+            settings["anoncreds.revocation_index_block"] = (
+                args.revocation_index_block_size
+            )
         return settings
 
 
@@ -1341,6 +1508,36 @@ class TransportGroup(ArgumentGroup):
                 "option will require additional memory to store messages in the queue."
             ),
         )
+        parser.add_argument(
+            "--persist-undelivered-queue",
+            action="store_true",
+            env_var="ACAPY_PERSIST_UNDELIVERED_QUEUE",
+            help=(
+                "Keep the undelivered queue in the wallet storage as well as in "
+                "memory, so that held messages survive a restart."
+            ),
+        )
+        parser.add_argument(
+            "--undelivered-queue-max-messages",
+            type=BoundedInt(min=1),
+            env_var="ACAPY_UNDELIVERED_QUEUE_MAX_MESSAGES",
+            help=(
+                "Set the maximum number of undelivered messages held for each "
+                "recipient key. The oldest messages are dropped beyond this "
+                "limit. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--undelivered-queue-max-bytes",
+            type=ByteSize(min=1024),
+            metavar="<queue-size>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_MAX_BYTES",
+            help=(
+                "Set the maximum total size in bytes of the undelivered messages "
+                "held for each recipient key. The oldest messages are dropped "
+                "beyond this limit. Default: no limit."
+            ),
+        )
         parser.add_argument(
             "--max-outbound-retry",
             default=4,
@@ -1352,6 +1549,81 @@ class TransportGroup(ArgumentGroup):
                 "accumulated messages in message queue. Default value is 4."
             ),
         )
+        parser.add_argument(
+            "--max-outbound-per-endpoint",
+            type=BoundedInt(min=1),
+            env_var="ACAPY_MAX_OUTBOUND_PER_ENDPOINT",
+            help=(
+                "Set the maximum number of concurrent deliveries to a single "
+                "outbound endpoint. Further messages for the endpoint wait until "
+                "a delivery completes. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-http-pool-limit",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_HTTP_POOL_LIMIT",
+            help=(
+                "Set the maximum number of simultaneous outbound HTTP connections. "
+                "Default: 200."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-http-pool-limit-per-host",
+            type=BoundedInt(min=0),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_HTTP_POOL_LIMIT_PER_HOST",
+            help=(
+                "Set the maximum number of simultaneous outbound HTTP connections "
+                "to a single host, or 0 for no limit. Default: 50."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-http-host-limit",
+            type=str,
+            action="append",
+            metavar="<pattern=count>",
+            env_var="ACAPY_OUTBOUND_HTTP_HOST_LIMIT",
+            help=(
+                "Set the maximum number of simultaneous outbound HTTP requests to "
+                "each host matching a pattern, as in '*.example.com=5', overriding "
+                "--outbound-http-pool-limit-per-host. The first matching pattern "
+                "applies. This parameter can be specified multiple times."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-http-breaker-threshold",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_HTTP_BREAKER_THRESHOLD",
+            help=(
+                "Stop sending to an endpoint host for a cooldown period after this "
+                "many consecutive connection failures or server errors; messages "
+                "for the host fail immediately and are retried later. "
+                "Default: disabled."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-http-breaker-cooldown",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_HTTP_BREAKER_COOLDOWN",
+            help=(
+                "The initial cooldown period for a failing endpoint host, doubled "
+                "on each further failure. Default: 30."
+            ),
+        )
+        parser.add_argument(
+            "--persist-outbound-queue",
+            action="store_true",
+            env_var="ACAPY_PERSIST_OUTBOUND_QUEUE",
+            help=(
+                "Keep encoded outbound messages which are pending delivery or "
+                "awaiting retry in the base wallet, so that they are delivered "
+                "after the agent restarts. Default: false."
+            ),
+        )
         parser.add_argument(
             "--ws-heartbeat-interval",
             default=3,
@@ -1387,6 +1659,16 @@ class TransportGroup(ArgumentGroup):
         else:
             raise ArgsParseError("-ot/--outbound-transport is required")
         settings["transport.enable_undelivered_queue"] = args.enable_undelivered_queue
+        if args.persist_undelivered_queue:
+            settings["transport.undelivered_queue_persist"] = True
+        if args.undelivered_queue_max_messages:
+            settings["transport.undelivered_queue_max_messages"] = (
+                args.undelivered_queue_max_messages
+            )
+        if args.undelivered_queue_max_bytes:
+            settings["transport.undelivered_queue_max_bytes"] = (
+                args.undelivered_queue_max_bytes
+            )
 
         if args.label:
             settings["default_label"] = args.label
@@ -1396,6 +1678,36 @@ class TransportGroup(ArgumentGroup):
             settings["transport.max_message_size"] = args.max_message_size
         if args.max_outbound_retry:
             settings["transport.max_outbound_retry"] = args.max_outbound_retry
+        if args.max_outbound_per_endpoint:
+            settings["transport.max_outbound_per_endpoint"] = (
+                args.max_outbound_per_endpoint
+            )
+        if args.persist_outbound_queue:
+            settings["transport.persist_outbound_queue"] = True
+        if args.outbound_http_pool_limit:
+            settings["transport.http_pool_limit"] = args.outbound_http_pool_limit
+        if args.outbound_http_pool_limit_per_host is not None:
+            settings["transport.http_pool_limit_per_host"] = (
+                args.outbound_http_pool_limit_per_host
+            )
+        if args.outbound_http_host_limit:
+            host_limits = {}
+            for value in args.outbound_http_host_limit:
+                pattern, _, limit = value.rpartition("=")
+                if not pattern or not limit.isdigit() or not int(limit):
+                    raise ArgsParseError(
+                        f"Invalid --outbound-http-host-limit value: {value}"
+                    )
+                host_limits[pattern] = int(limit)
+            settings["transport.http_host_limits"] = host_limits
+        if args.outbound_http_breaker_threshold:
+            settings["transport.http_breaker_threshold"] = (
+                args.outbound_http_breaker_threshold
+            )
+        if args.outbound_http_breaker_cooldown:
+            settings["transport.http_breaker_cooldown"] = (
+                args.outbound_http_breaker_cooldown
+            )
         if args.ws_heartbeat_interval:
             settings["transport.ws.heartbeat_interval"] = args.ws_heartbeat_interval
         if args.ws_timeout_interval:
@@ -1481,6 +1793,18 @@ class MediationGroup(ArgumentGroup):
             env_var="ACAPY_CLEAR_DEFAULT_MEDIATOR",
             help="Clear the stored default mediator.",
         )
+        parser.add_argument(
+            "--mediation-route-index",
+            action="store_true",
+            env_var="ACAPY_MEDIATION_ROUTE_INDEX",
+            help=(
+                "Keep the routes of mediated connections in memory, so forwarded "
+                "messages are delivered without a storage lookup. Routes are "
+                "loaded at startup and updated by keylist updates handled by "
+                "this agent, so this should only be enabled when a single agent "
+                "instance handles mediation."
+            ),
+        )
 
     def get_settings(self, args: Namespace):
         """Extract mediation settings."""
@@ -1491,6 +1815,8 @@ class MediationGroup(ArgumentGroup):
             settings["mediation.default_id"] = args.default_mediator_id
         if args.clear_default_mediator:
             settings["mediation.clear"] = True
+        if args.mediation_route_index:
+            settings["mediation.route_index"] = True
 
         if args.clear_default_mediator and args.default_mediator_id:
             raise ArgsParseError(
@@ -1744,8 +2070,17 @@ class MultitenantGroup(ArgumentGroup):
                 "Specify multitenancy configuration in key=value pairs. "
                 'For example: "wallet_type=askar-profile wallet_name=askar-profile-name" '
                 "Possible values: wallet_name, wallet_key, cache_size, "
-                'key_derivation_method. "wallet_name" is only used when '
-                '"wallet_type" is "askar-profile"'
+                "key_derivation_method, lookup_cache_size, lookup_cache_ttl, "
+                "cache_idle_ttl, cache_max_connections, cache_prewarm. "
+                '"wallet_name" is only used when "wallet_type" is "askar-profile". '
+                '"lookup_cache_size" (default 10000) and "lookup_cache_ttl" '
+                "(seconds, default 60) bound the cache of verified tokens, wallet "
+                "records and recipient keys; a value of 0 disables the cache. "
+                '"cache_idle_ttl" releases wallets unused for the given seconds, '
+                '"cache_max_connections" bounds the storage connections of open '
+                'wallets, and "cache_prewarm" opens the given number of most '
+                "recently updated managed wallets at startup, where issuing a "
+                "token updates a wallet."
             ),
         )
         parser.add_argument(
@@ -1804,6 +2139,17 @@ class MultitenantGroup(ArgumentGroup):
                             multitenancy_config.get("key_derivation_method")
                         )
 
+                    # zero is meaningful for these, disabling the limit or cache
+                    for key in (
+                        "lookup_cache_size",
+                        "lookup_cache_ttl",
+                        "cache_idle_ttl",
+                        "cache_max_connections",
+                        "cache_prewarm",
+                    ):
+                        if multitenancy_config.get(key) is not None:
+                            settings[f"multitenant.{key}"] = multitenancy_config[key]
+
                 else:
                     for value_str in args.multitenancy_config:
                         key, value = value_str.split("=", maxsplit=1)
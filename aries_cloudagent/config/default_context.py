@@ -1,8 +1,10 @@
 """Classes for configuring the default injection context."""
 
 from ..anoncreds.registry import AnonCredsRegistry
+from ..anoncreds.worker_pool import CryptoWorkerPool
 from ..cache.base import BaseCache
 from ..cache.in_memory import InMemoryCache
+from ..cache.redis import RedisCache
 from ..core.event_bus import EventBus
 from ..core.goal_code_registry import GoalCodeRegistry
 from ..core.plugin_registry import PluginRegistry
@@ -41,8 +43,18 @@ class DefaultContextBuilder(ContextBuilder):
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, InMemoryCache())
+        # Shared cache: in memory, or on a server shared between instances
+        if context.settings.get("cache.redis_url"):
+            cache = RedisCache(
+                context.settings["cache.redis_url"],
+                prefix=context.settings.get("cache.redis_prefix") or "acapy:",
+            )
+        else:
+            cache = InMemoryCache(
+                max_entries=context.settings.get_int("cache.max_entries"),
+                max_bytes=context.settings.get_int("cache.max_bytes"),
+            )
+        context.injector.bind_instance(BaseCache, cache)
 
         # Global protocol registry
         context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
@@ -51,7 +63,22 @@ class DefaultContextBuilder(ContextBuilder):
         context.injector.bind_instance(GoalCodeRegistry, GoalCodeRegistry())
 
         # Global event bus
-        context.injector.bind_instance(EventBus, EventBus())
+        context.injector.bind_instance(
+            EventBus,
+            EventBus(
+                concurrent=bool(context.settings.get("events.concurrent")),
+                queue_size=context.settings.get_int("events.queue_size"),
+            ),
+        )
+
+        # Workers for anoncreds issuance, proof creation and verification
+        context.injector.bind_instance(
+            CryptoWorkerPool,
+            CryptoWorkerPool(
+                context.settings.get_int("anoncreds.crypto_workers"),
+                processes=bool(context.settings.get("anoncreds.crypto_processes")),
+            ),
+        )
 
         # Global did resolver
         context.injector.bind_instance(DIDResolver, DIDResolver([]))
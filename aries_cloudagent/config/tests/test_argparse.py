@@ -42,6 +42,14 @@ class TestArgParse(IsolatedAsyncioTestCase):
                 "http",
                 "--max-outbound-retry",
                 "5",
+                "--persist-outbound-queue",
+                "--max-outbound-per-endpoint",
+                "10",
+                "--persist-undelivered-queue",
+                "--undelivered-queue-max-messages",
+                "100",
+                "--undelivered-queue-max-bytes",
+                "1m",
             ]
         )
 
@@ -52,8 +60,52 @@ class TestArgParse(IsolatedAsyncioTestCase):
 
         assert settings.get("transport.inbound_configs") == [["http", "0.0.0.0", "80"]]
         assert settings.get("transport.outbound_configs") == ["http"]
+        assert settings.get("transport.persist_outbound_queue") is True
+        assert settings.get("transport.max_outbound_per_endpoint") == 10
+        assert settings.get("transport.undelivered_queue_persist") is True
+        assert settings.get("transport.undelivered_queue_max_messages") == 100
+        assert settings.get("transport.undelivered_queue_max_bytes") == 1048576
         assert result.max_outbound_retry == 5
 
+    async def test_outbound_http_settings(self):
+        """Test outbound HTTP pool and circuit breaker argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.TransportGroup()
+        group.add_arguments(parser)
+
+        args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+        result = parser.parse_args(
+            args
+            + [
+                "--outbound-http-pool-limit",
+                "1000",
+                "--outbound-http-pool-limit-per-host",
+                "4",
+                "--outbound-http-host-limit",
+                "*.example.com=20",
+                "--outbound-http-host-limit",
+                "slow.host=1",
+                "--outbound-http-breaker-threshold",
+                "3",
+                "--outbound-http-breaker-cooldown",
+                "10",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["transport.http_pool_limit"] == 1000
+        assert settings["transport.http_pool_limit_per_host"] == 4
+        assert settings["transport.http_host_limits"] == {
+            "*.example.com": 20,
+            "slow.host": 1,
+        }
+        assert settings["transport.http_breaker_threshold"] == 3
+        assert settings["transport.http_breaker_cooldown"] == 10
+
+        result = parser.parse_args(args + ["--outbound-http-host-limit", "host=x"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
     async def test_get_genesis_transactions_list_with_ledger_selection(self):
         """Test multiple ledger support related argument parsing."""
 
@@ -269,6 +321,127 @@ class TestArgParse(IsolatedAsyncioTestCase):
         assert settings.get("external_plugins") == ["foo"]
         assert settings.get("storage_type") == "bar"
 
+    async def test_cache_settings(self):
+        """Test cache argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--endpoint",
+                "localhost",
+                "--cache-max-entries",
+                "100",
+                "--cache-max-bytes",
+                "1048576",
+                "--cache-redis-url",
+                "redis://localhost:6379",
+                "--cache-redis-prefix",
+                "agent1:",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("cache.max_entries") == 100
+        assert settings.get("cache.max_bytes") == 1048576
+        assert settings.get("cache.redis_url") == "redis://localhost:6379"
+        assert settings.get("cache.redis_prefix") == "agent1:"
+
+        result = parser.parse_args(
+            ["--endpoint", "localhost", "--cache-redis-prefix", "agent1:"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_event_settings(self):
+        """Test event dispatch argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--endpoint",
+                "localhost",
+                "--concurrent-event-dispatch",
+                "--event-queue-size",
+                "10",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("events.concurrent") is True
+        assert settings.get("events.queue_size") == 10
+
+    async def test_webhook_batch_settings(self):
+        """Test webhook batching argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.AdminGroup()
+        group.add_arguments(parser)
+
+        args = ["--admin", "0.0.0.0", "8080", "--admin-insecure-mode"]
+        result = parser.parse_args(
+            args
+            + [
+                "--webhook-url",
+                "http://localhost:8022",
+                "--webhook-batch-size",
+                "50",
+                "--webhook-batch-linger",
+                "0",
+                "--webhook-spool-dir",
+                "/tmp/spool",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("admin.webhook_batch_size") == 50
+        assert settings.get("admin.webhook_batch_linger") == 0
+        assert settings.get("admin.webhook_spool_dir") == "/tmp/spool"
+
+        result = parser.parse_args(args + ["--webhook-spool-dir", "/tmp/spool"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_revocation_index_block_size(self):
+        """Test revocation index block size setting."""
+        parser = argparse.create_argument_parser()
+        group = argparse.RevocationGroup()
+        group.add_arguments(parser)
+
+        settings = group.get_settings(parser.parse_args([]))
+        assert "anoncreds.revocation_index_block" not in settings
+
+        result = parser.parse_args(["--revocation-index-block-size", "50"])
+        settings = group.get_settings(result)
+        assert settings["anoncreds.revocation_index_block"] == 50
+
+    async def test_crypto_workers(self):
+        """Test crypto worker pool argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["--endpoint", "localhost"])
+        settings = group.get_settings(result)
+        assert "anoncreds.crypto_workers" not in settings
+        assert "anoncreds.crypto_processes" not in settings
+
+        result = parser.parse_args(
+            [
+                "--endpoint",
+                "localhost",
+                "--crypto-workers",
+                "4",
+                "--crypto-worker-processes",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("anoncreds.crypto_workers") == 4
+        assert settings.get("anoncreds.crypto_processes") is True
+
     async def test_plugin_config_file(self):
         """Test file argument parsing."""
 
@@ -366,6 +539,26 @@ class TestArgParse(IsolatedAsyncioTestCase):
         assert settings.get("multitenant.wallet_name") == "test"
         assert settings.get("multitenant.base_wallet_routes") == ["/my_route"]
 
+        result = parser.parse_args(
+            [
+                "--multitenant",
+                "--jwt-secret",
+                "secret",
+                "--multitenancy-config",
+                '{"lookup_cache_size": 0, "lookup_cache_ttl": 30, '
+                '"cache_idle_ttl": 600, "cache_max_connections": 50, '
+                '"cache_prewarm": 5}',
+            ]
+        )
+
+        settings = group.get_settings(result)
+
+        assert settings.get("multitenant.lookup_cache_size") == 0
+        assert settings.get("multitenant.lookup_cache_ttl") == 30
+        assert settings.get("multitenant.cache_idle_ttl") == 600
+        assert settings.get("multitenant.cache_max_connections") == 50
+        assert settings.get("multitenant.cache_prewarm") == 5
+
     async def test_endorser_settings(self):
         """Test required argument parsing."""
 
@@ -495,6 +688,15 @@ class TestArgParse(IsolatedAsyncioTestCase):
             )
             group.get_settings(args)
 
+    async def test_mediation_route_index(self):
+        parser = argparse.create_argument_parser()
+        group = argparse.MediationGroup()
+        group.add_arguments(parser)
+
+        args = parser.parse_args(["--mediation-route-index"])
+        settings = group.get_settings(args)
+        assert settings["mediation.route_index"] is True
+
     def test_plugin_config_value_parsing(self):
         required_args = ["-e", "http://localhost:3000"]
         parser = argparse.create_argument_parser()
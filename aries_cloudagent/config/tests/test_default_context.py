@@ -3,6 +3,8 @@ from tempfile import NamedTemporaryFile
 from unittest import IsolatedAsyncioTestCase
 
 from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
+from ...cache.redis import RedisCache
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
 from ...transport.wire_format import BaseWireFormat
@@ -36,3 +38,23 @@ class TestDefaultContext(IsolatedAsyncioTestCase):
         )
         result = await builder.build_context()
         assert isinstance(result, InjectionContext)
+
+    async def test_build_context_cache(self):
+        builder = DefaultContextBuilder(
+            settings={"cache.max_entries": 10, "cache.max_bytes": 1000}
+        )
+        result = await builder.build_context()
+        cache = result.inject(BaseCache)
+        assert isinstance(cache, InMemoryCache)
+        assert cache.stats()["max_entries"] == 10
+
+        builder = DefaultContextBuilder(
+            settings={
+                "cache.redis_url": "redis://localhost:6379/1",
+                "cache.redis_prefix": "test:",
+            }
+        )
+        result = await builder.build_context()
+        cache = result.inject(BaseCache)
+        assert isinstance(cache, RedisCache)
+        assert cache.prefix == "test:"
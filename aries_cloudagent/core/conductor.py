@@ -17,6 +17,7 @@ from qrcode import QRCode
 
 from ..admin.base_server import BaseAdminServer
 from ..admin.server import AdminResponder, AdminServer
+from ..anoncreds.worker_pool import CryptoWorkerPool
 from ..commands.upgrade import (
     add_version_record,
     get_upgrade_version_list,
@@ -59,6 +60,7 @@ from ..protocols.coordinate_mediation.v1_0.route_manager_provider import (
     RouteManagerProvider,
 )
 from ..protocols.out_of_band.v1_0.manager import OutOfBandManager
+from ..protocols.routing.v1_0.manager import RouteIndex
 from ..protocols.out_of_band.v1_0.messages.invitation import HSProto, InvitationMessage
 from ..storage.base import BaseStorage
 from ..storage.error import StorageNotFoundError
@@ -78,6 +80,7 @@ from ..version import RECORD_TYPE_ACAPY_VERSION, __version__
 from ..wallet.did_info import DIDInfo
 from .dispatcher import Dispatcher
 from .error import StartupError
+from .event_bus import EventBus
 from .oob_processor import OobMessageProcessor
 from .util import SHUTDOWN_EVENT_TOPIC, STARTUP_EVENT_TOPIC
 
@@ -228,6 +231,12 @@ class Conductor:
             RouteManager, RouteManagerProvider(self.root_profile)
         )
 
+        # Index the routes of mediated connections for forward handling
+        if context.settings.get("mediation.route_index"):
+            route_index = RouteIndex(self.root_profile)
+            await route_index.load()
+            context.injector.bind_instance(RouteIndex, route_index)
+
         # Bind oob message processor to be able to receive and process un-encrypted
         # messages
         context.injector.bind_instance(
@@ -522,6 +531,13 @@ class Conductor:
             except Exception:
                 LOGGER.exception("Error accepting mediation invitation")
 
+        # Open the profiles of the most active tenants in the background
+        prewarm = context.settings.get_int("multitenant.cache_prewarm")
+        if prewarm and context.settings.get("multitenant.enabled"):
+            multitenant_mgr = context.inject_or(BaseMultitenantManager)
+            if multitenant_mgr:
+                self.dispatcher.run_task(multitenant_mgr.prewarm_profiles(prewarm))
+
         # notify protocols of startup status
         await self.root_profile.notify(STARTUP_EVENT_TOPIC, {})
 
@@ -530,6 +546,12 @@ class Conductor:
         # notify protocols that we are shutting down
         if self.root_profile:
             await self.root_profile.notify(SHUTDOWN_EVENT_TOPIC, {})
+            event_bus = self.root_profile.inject_or(EventBus)
+            if event_bus:
+                await event_bus.close(timeout)
+            crypto_pool = self.root_profile.inject_or(CryptoWorkerPool)
+            if crypto_pool:
+                crypto_pool.shutdown()
 
         shutdown = TaskQueue()
         if self.dispatcher:
@@ -624,7 +646,7 @@ class Conductor:
             "task_failed": self.dispatcher.task_queue.total_failed,
             "task_pending": self.dispatcher.task_queue.current_pending,
         }
-        for m in self.outbound_transport_manager.outbound_buffer:
+        for m in self.outbound_transport_manager.outbound_active:
             if m.state == QueuedOutboundMessage.STATE_ENCODE:
                 stats["out_encode"] += 1
             if m.state == QueuedOutboundMessage.STATE_DELIVER:
@@ -7,7 +7,7 @@ lifecycle hook callbacks storing state for message threads, etc.
 import asyncio
 import logging
 import os
-from typing import Callable, Coroutine, Union
+from typing import Callable, Coroutine, Optional, Union
 import warnings
 import weakref
 
@@ -24,6 +24,8 @@ from ..messaging.request_context import RequestContext
 from ..messaging.responder import BaseResponder, SKIP_ACTIVE_CONN_CHECK_MSG_TYPES
 from ..messaging.util import datetime_now
 from ..protocols.problem_report.v1_0.message import ProblemReport
+from ..protocols.routing.v1_0.handlers.forward_handler import ForwardHandler
+from ..protocols.routing.v1_0.messages.forward import Forward
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
@@ -138,8 +140,10 @@ class Dispatcher:
         error_result = None
         version_warning = None
         message = None
+        forward_to = self.forward_target(inbound_message)
         try:
-            message = await self.make_message(profile, inbound_message.payload)
+            if not forward_to:
+                message = await self.make_message(profile, inbound_message.payload)
         except ProblemReportParseError:
             pass  # avoid problem report recursion
         except MessageParseError as e:
@@ -208,6 +212,16 @@ class Dispatcher:
             if self.collector:
                 handler = self.collector.wrap_coro(handler, [handler.__qualname__])
             await handler(context, responder)
+        elif forward_to:
+            handler = ForwardHandler().relay
+            if self.collector:
+                handler = self.collector.wrap_coro(handler, [handler.__qualname__])
+            await handler(
+                context,
+                responder,
+                forward_to,
+                inbound_message.receipt.raw_forward.encode("utf-8"),
+            )
 
         trace_event(
             self.profile.settings,
@@ -216,6 +230,38 @@ class Dispatcher:
             perf_counter=r_time,
         )
 
+    def forward_target(self, inbound_message: InboundMessage) -> Optional[str]:
+        """Check whether an inbound forward message can be relayed as received.
+
+        When the wire format has kept the original text of the message carried
+        by a forward, it is relayed directly rather than through a `Forward`
+        message instance, unless the forward message type has been assigned
+        another message class.
+
+        Returns:
+            The recipient key of the forwarded message, if it can be relayed
+
+        """
+        receipt = inbound_message.receipt
+        payload = inbound_message.payload
+        if not (
+            receipt.raw_forward
+            and receipt.recipient_verkey
+            and isinstance(payload, dict)
+        ):
+            return None
+        to = payload.get("to")
+        if not (to and isinstance(to, str)):
+            return None
+        registry: ProtocolRegistry = self.profile.inject(ProtocolRegistry)
+        try:
+            message_cls = registry.resolve_message_class(payload.get("@type"))
+        except (ProtocolMinorVersionNotSupported, ValueError):
+            return None
+        if isinstance(message_cls, DeferLoad):
+            message_cls = message_cls.resolved
+        return to if message_cls is Forward else None
+
     async def make_message(self, profile: Profile, parsed_msg: dict) -> BaseMessage:
         """Deserialize a message dict into the appropriate message instance.
 
@@ -80,48 +80,171 @@ class EventWithMetadata(Event):
 
 
 class EventBus:
-    """A simple event bus implementation."""
+    """A simple event bus implementation.
 
-    def __init__(self):
-        """Initialize Event Bus."""
+    In the default (synchronous) mode, `notify` awaits each matching subscriber
+    in turn. In concurrent mode, each subscriber is given a bounded queue
+    drained by its own task: `notify` returns once the event has been queued
+    for every matching subscriber, waiting only when a subscriber's queue is
+    full. Events are delivered to each subscriber in the order notified.
+    """
+
+    DEFAULT_QUEUE_SIZE = 100
+    MATCH_CACHE_SIZE = 1024
+
+    def __init__(self, concurrent: bool = False, queue_size: int = None):
+        """Initialize Event Bus.
+
+        Args:
+            concurrent: dispatch events to subscribers concurrently
+            queue_size: the maximum number of events queued for a subscriber
+                in concurrent mode
+
+        """
         self.topic_patterns_to_subscribers: Dict[Pattern, List[Callable]] = {}
+        self.concurrent = concurrent
+        self.queue_size = queue_size or self.DEFAULT_QUEUE_SIZE
+        self._match_cache: Dict[str, List[Tuple[Pattern, Match, Callable]]] = {}
+        self._queues: Dict[Callable, asyncio.Queue] = {}
+        self._workers: Dict[asyncio.Task, asyncio.Queue] = {}
+        self.reset_stats()
+
+    def _match(self, topic: str) -> List[Tuple[Pattern, Match, Callable]]:
+        """Find the subscribers matching a topic, using the match cache."""
+        matched = self._match_cache.get(topic)
+        if matched is not None:
+            self._cache_hits += 1
+            return matched
+        self._cache_misses += 1
+        matched = []
+        for pattern, subscribers in self.topic_patterns_to_subscribers.items():
+            match = pattern.match(topic)
+            if match:
+                matched.extend((pattern, match, sub) for sub in subscribers)
+        if len(self._match_cache) >= self.MATCH_CACHE_SIZE:
+            self._match_cache.clear()
+        self._match_cache[topic] = matched
+        return matched
 
     async def notify(self, profile: "Profile", event: Event):
         """Notify subscribers of event.
 
+        Errors raised by subscribers are logged and otherwise ignored.
+
         Args:
             profile (Profile): context of the event
             event (Event): event to emit
 
         """
-        # TODO don't block notifier until subscribers have all been called?
-        # TODO trigger each processor but don't await?
-        # TODO log errors but otherwise ignore?
-
         LOGGER.debug("Notifying subscribers: %s", event)
 
-        partials = []
-        for pattern, subscribers in self.topic_patterns_to_subscribers.items():
-            match = pattern.match(event.topic)
-
-            if not match:
-                continue
-
-            for subscriber in subscribers:
-                partials.append(
-                    partial(
-                        subscriber,
-                        profile,
-                        event.with_metadata(EventMetadata(pattern, match)),
-                    )
+        matched = self._match(event.topic)
+        self._notified += 1
+        if self.concurrent:
+            for pattern, match, subscriber in matched:
+                await self._enqueue(
+                    subscriber,
+                    (profile, event.with_metadata(EventMetadata(pattern, match))),
                 )
+            return
 
+        partials = [
+            partial(
+                subscriber,
+                profile,
+                event.with_metadata(EventMetadata(pattern, match)),
+            )
+            for pattern, match, subscriber in matched
+        ]
         for processor in partials:
             try:
                 await processor()
             except Exception:
+                self._errors += 1
                 LOGGER.exception("Error occurred while processing event")
 
+    async def _enqueue(self, subscriber: Callable, item: Tuple["Profile", Event]):
+        """Queue an event for a subscriber, starting its worker if required."""
+        queue = self._queues.get(subscriber)
+        if not queue:
+            queue = asyncio.Queue(self.queue_size)
+            self._queues[subscriber] = queue
+            worker = asyncio.get_event_loop().create_task(
+                self._run_worker(subscriber, queue)
+            )
+            self._workers[worker] = queue
+            worker.add_done_callback(self._workers.pop)
+        if queue.full():
+            # apply backpressure to the notifier
+            self._blocked += 1
+        await queue.put(item)
+        self._max_depth = max(self._max_depth, queue.qsize())
+
+    async def _run_worker(self, subscriber: Callable, queue: asyncio.Queue):
+        """Deliver queued events to a subscriber in order."""
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    break
+                await subscriber(*item)
+            except Exception:
+                self._errors += 1
+                LOGGER.exception("Error occurred while processing event")
+            finally:
+                queue.task_done()
+
+    def _is_subscribed(self, processor: Callable) -> bool:
+        return any(
+            processor in subscribers
+            for subscribers in self.topic_patterns_to_subscribers.values()
+        )
+
+    async def join(self):
+        """Wait until all queued events have been processed."""
+        for queue in list(self._workers.values()):
+            await queue.join()
+
+    async def close(self, timeout: float = None):
+        """Process any queued events and stop the subscriber tasks.
+
+        Args:
+            timeout: the maximum time in seconds to wait for queued events
+
+        """
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except asyncio.TimeoutError:
+            LOGGER.warning("Timed out processing queued events")
+        workers = list(self._workers)
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queues.clear()
+
+    def stats(self) -> dict:
+        """Return dispatch and backpressure statistics."""
+        return {
+            "concurrent": self.concurrent,
+            "notified": self._notified,
+            "errors": self._errors,
+            "match_cache_hits": self._cache_hits,
+            "match_cache_misses": self._cache_misses,
+            "subscriber_queues": len(self._workers),
+            "queued": sum(queue.qsize() for queue in self._workers.values()),
+            "max_queue_depth": self._max_depth,
+            "blocked": self._blocked,
+        }
+
+    def reset_stats(self):
+        """Reset the dispatch statistics."""
+        self._notified = 0
+        self._errors = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._max_depth = 0
+        self._blocked = 0
+
     def subscribe(self, pattern: Pattern, processor: Callable):
         """Subscribe to an event.
 
@@ -134,6 +257,7 @@ class EventBus:
         if pattern not in self.topic_patterns_to_subscribers:
             self.topic_patterns_to_subscribers[pattern] = []
         self.topic_patterns_to_subscribers[pattern].append(processor)
+        self._match_cache.clear()
 
     def unsubscribe(self, pattern: Pattern, processor: Callable):
         """Unsubscribe from an event.
@@ -154,6 +278,14 @@ class EventBus:
             del self.topic_patterns_to_subscribers[pattern][index]
             if not self.topic_patterns_to_subscribers[pattern]:
                 del self.topic_patterns_to_subscribers[pattern]
+            self._match_cache.clear()
+            if processor in self._queues and not self._is_subscribed(processor):
+                # stop the worker once events already queued are processed
+                queue = self._queues.pop(processor)
+                if queue.full():
+                    asyncio.ensure_future(queue.put(None))
+                else:
+                    queue.put_nowait(None)
             LOGGER.debug("Unsubscribed: topic %s, processor %s", pattern, processor)
 
     @contextmanager
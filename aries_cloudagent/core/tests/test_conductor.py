@@ -495,7 +495,7 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
             test_module, "LoggingConfigurator", autospec=True
         ) as mock_logger:
             mock_inbound_mgr.return_value.sessions = ["dummy"]
-            mock_outbound_mgr.return_value.outbound_buffer = [
+            mock_outbound_mgr.return_value.outbound_active = [
                 mock.MagicMock(state=QueuedOutboundMessage.STATE_ENCODE),
                 mock.MagicMock(state=QueuedOutboundMessage.STATE_DELIVER),
             ]
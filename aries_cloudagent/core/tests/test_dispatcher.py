@@ -22,6 +22,8 @@ from ...protocols.issue_credential.v2_0.messages.cred_problem_report import (
 )
 from ...protocols.problem_report.v1_0.message import ProblemReport
 from ...protocols.coordinate_mediation.v1_0.route_manager import RouteManager
+from ...protocols.routing.v1_0.message_types import FORWARD
+from ...protocols.routing.v1_0.messages.forward import Forward
 from ...transport.inbound.message import InboundMessage
 from ...transport.inbound.receipt import MessageReceipt
 from ...transport.outbound.message import OutboundMessage
@@ -129,6 +131,59 @@ class TestDispatcher(IsolatedAsyncioTestCase):
                 handler_mock.call_args[0][2], test_module.DispatcherResponder
             )
 
+    async def test_dispatch_forward_as_received(self):
+        profile = make_profile()
+        registry = profile.inject(ProtocolRegistry)
+        registry.register_message_types(
+            {DIDCommPrefix.qualify_current(FORWARD): Forward}
+        )
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        rcv = Receiver()
+        raw_msg = '{"protected": "abc", "ciphertext": "def"}'
+        message = {
+            "@type": DIDCommPrefix.qualify_current(FORWARD),
+            "to": "recipient-key",
+            "msg": json.loads(raw_msg),
+        }
+
+        with mock.patch.object(
+            test_module.ForwardHandler, "relay", autospec=True
+        ) as relay_mock, mock.patch.object(
+            dispatcher, "make_message", mock.CoroutineMock()
+        ) as make_message:
+            inbound = make_inbound(message)
+            inbound.receipt.recipient_verkey = "router-key"
+            inbound.receipt.raw_forward = raw_msg
+            await dispatcher.queue_message(dispatcher.profile, inbound, rcv.send)
+            await dispatcher.task_queue
+            make_message.assert_not_called()
+            relay_mock.assert_awaited_once()
+            assert relay_mock.call_args[0][3:] == ("recipient-key", raw_msg.encode())
+
+            # without the original text, the message is handled as usual
+            relay_mock.reset_mock()
+            inbound = make_inbound(message)
+            inbound.receipt.recipient_verkey = "router-key"
+            await dispatcher.queue_message(dispatcher.profile, inbound, rcv.send)
+            await dispatcher.task_queue
+            make_message.assert_awaited_once()
+            relay_mock.assert_not_called()
+
+    async def test_forward_target_other_message_class(self):
+        profile = make_profile()
+        registry = profile.inject(ProtocolRegistry)
+        registry.register_message_types(
+            {DIDCommPrefix.qualify_current(FORWARD): StubAgentMessage}
+        )
+        dispatcher = test_module.Dispatcher(profile)
+        inbound = make_inbound(
+            {"@type": DIDCommPrefix.qualify_current(FORWARD), "to": "key", "msg": {}}
+        )
+        inbound.receipt.recipient_verkey = "router-key"
+        inbound.receipt.raw_forward = "{}"
+        assert dispatcher.forward_target(inbound) is None
+
     async def test_dispatch_versioned_message(self):
         profile = make_profile()
         registry = profile.inject(ProtocolRegistry)
@@ -1,5 +1,7 @@
 """Test Event Bus."""
 
+import asyncio
+
 import pytest
 import re
 
@@ -205,3 +207,98 @@ async def test_wait_for_event_condition(event_bus: EventBus, profile, event):
         await event_bus.notify(profile, event)
         assert returned_event.done()
         assert await returned_event == event
+
+
+@pytest.mark.asyncio
+async def test_match_cache(event_bus: EventBus, profile, event, processor):
+    event_bus.subscribe(re.compile(".*"), processor)
+    await event_bus.notify(profile, event)
+    await event_bus.notify(profile, event)
+    stats = event_bus.stats()
+    assert stats["match_cache_misses"] == 1
+    assert stats["match_cache_hits"] == 1
+
+    processor1 = MockProcessor()
+    event_bus.subscribe(re.compile("anything"), processor1)
+    await event_bus.notify(profile, event)
+    assert processor1.event == event
+    assert event_bus.stats()["match_cache_misses"] == 2
+
+    event_bus.unsubscribe(re.compile("anything"), processor1)
+    processor1.event = None
+    await event_bus.notify(profile, event)
+    assert processor1.event is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_notify(profile, event):
+    event_bus = EventBus(concurrent=True, queue_size=2)
+    release = asyncio.Event()
+    received = []
+
+    async def slow(profile, event):
+        await release.wait()
+        received.append(event.payload)
+
+    processor = MockProcessor()
+    event_bus.subscribe(re.compile(".*"), slow)
+    event_bus.subscribe(re.compile(".*"), processor)
+
+    # the slow subscriber does not hold up the notifier or other subscribers
+    await asyncio.wait_for(event_bus.notify(profile, event), 1)
+    await asyncio.sleep(0)
+    assert processor.event == event
+    assert not received
+
+    # fill the queue: the notifier now waits for the subscriber
+    await event_bus.notify(profile, Event("anything", 2))
+    await event_bus.notify(profile, Event("anything", 3))
+    blocked = asyncio.ensure_future(event_bus.notify(profile, Event("anything", 4)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+    assert event_bus.stats()["blocked"] == 1
+
+    release.set()
+    await asyncio.wait_for(blocked, 1)
+    await event_bus.join()
+    assert received == ["payload", 2, 3, 4]
+    stats = event_bus.stats()
+    assert stats["notified"] == 4
+    assert stats["queued"] == 0
+    assert stats["max_queue_depth"] == 2
+    await event_bus.close()
+    assert not event_bus.stats()["subscriber_queues"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_error_logged(profile, event):
+    event_bus = EventBus(concurrent=True)
+
+    async def _raise_exception(profile, event):
+        raise Exception()
+
+    processor = MockProcessor()
+    event_bus.subscribe(re.compile(".*"), _raise_exception)
+    event_bus.subscribe(re.compile(".*"), processor)
+    with mock.patch.object(
+        test_module.LOGGER, "exception", mock.MagicMock()
+    ) as mock_log_exc:
+        await event_bus.notify(profile, event)
+        await event_bus.join()
+
+    mock_log_exc.assert_called_once_with("Error occurred while processing event")
+    assert processor.event == event
+    assert event_bus.stats()["errors"] == 1
+    await event_bus.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_wait_for_event(profile, event):
+    event_bus = EventBus(concurrent=True)
+    with event_bus.wait_for_event(profile, re.compile(".*")) as returned_event:
+        await event_bus.notify(profile, event)
+        assert await asyncio.wait_for(returned_event, 1) == event
+    await event_bus.join()
+    # the one-shot subscriber's worker stops once unsubscribed
+    await asyncio.sleep(0)
+    assert not event_bus.stats()["subscriber_queues"]
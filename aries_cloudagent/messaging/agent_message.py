@@ -492,6 +492,8 @@ class AgentMessageSchema(BaseModelSchema):
             ValidationError: If there is a missing field signature
 
         """
+        # schema instances are reused: collect the decorators for this message
+        self._decorators = DecoratorSet()
         processed = self._decorators.extract_decorators(data, self.__class__)
 
         expect_fields = resolve_meta_property(self, "signed_fields") or ()
@@ -6,9 +6,15 @@ https://github.com/transmute-industries/Ed25519Signature2018/blob/master/src/cre
 
 import datetime
 import hashlib
+import json
 
 from pyld import jsonld
 
+from ...vc.ld_proofs.canonization import (
+    CANONIZATION_CACHE,
+    canonize,
+    scoped_cache_key,
+)
 from .error import (
     DroppedAttributeError,
     MissingVerificationMethodError,
@@ -17,14 +23,7 @@ from .error import (
 
 
 def _canonize(data, document_loader=None):
-    return jsonld.normalize(
-        data,
-        {
-            "algorithm": "URDNA2015",
-            "format": "application/n-quads",
-            **{opt: document_loader for opt in ["documentLoader"] if document_loader},
-        },
-    )
+    return canonize(data, document_loader)
 
 
 def _sha256(data):
@@ -66,6 +65,15 @@ def create_verify_data(data, signature_options, document_loader=None):
         )
 
     signature_options["created"] = signature_options.get("created", _created_at())
+
+    key = scoped_cache_key(
+        "create_verify_data", document_loader, data, signature_options
+    )
+    cached = CANONIZATION_CACHE.get(key)
+    if cached is not None:
+        framed, verify_data = json.loads(cached)
+        return (framed, verify_data)
+
     [expanded] = jsonld.expand(
         data,
         options={
@@ -136,4 +144,7 @@ def create_verify_data(data, signature_options, document_loader=None):
     canonized_document = _canonize_document(framed, document_loader)
     hash_of_canonized_document = _sha256(canonized_document)
 
-    return (framed, hash_of_canonized_signature_options + hash_of_canonized_document)
+    verify_data = hash_of_canonized_signature_options + hash_of_canonized_document
+    CANONIZATION_CACHE.set(key, json.dumps([framed, verify_data]))
+
+    return (framed, verify_data)
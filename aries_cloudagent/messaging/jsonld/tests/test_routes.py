@@ -12,6 +12,7 @@ from ....admin.request_context import AdminRequestContext
 from ....config.base import InjectionError
 from ....resolver.base import DIDMethodNotSupported, DIDNotFound, ResolverError
 from ....resolver.did_resolver import DIDResolver
+from ....vc.ld_proofs.canonization import CANONIZATION_CACHE
 from ....vc.ld_proofs.document_loader import DocumentLoader
 from ....wallet.base import BaseWallet
 from ....wallet.did_method import SOV, DIDMethods
@@ -341,6 +342,7 @@ class TestJSONLDRoutes(IsolatedAsyncioTestCase):
             mock_response.assert_called_once_with({"valid": True})  # expected response
 
         # compact, expand take a LONG TIME: do them once above, mock for error cases
+        CANONIZATION_CACHE.clear()
         with mock.patch.object(
             jsonld, "compact", mock.MagicMock()
         ) as mock_compact, mock.patch.object(
@@ -490,6 +492,7 @@ class TestJSONLDRoutes(IsolatedAsyncioTestCase):
             assert "error" in json.loads(result)
 
         # compact, expand take a LONG TIME: do them once above, mock for error cases
+        CANONIZATION_CACHE.clear()
         posted_request = deepcopy(POSTED_REQUEST)
         self.request.json = mock.CoroutineMock(return_value=posted_request)
         with mock.patch.object(
@@ -5,10 +5,32 @@ import json
 
 from abc import ABC
 from collections import namedtuple
-from typing import Mapping, Optional, Type, TypeVar, Union, cast, overload
+from contextlib import contextmanager
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 from typing_extensions import Literal
 
-from marshmallow import Schema, post_dump, pre_load, post_load, ValidationError, EXCLUDE
+from marshmallow import (
+    EXCLUDE,
+    Schema,
+    ValidationError,
+    fields,
+    missing,
+    post_dump,
+    post_load,
+    pre_load,
+)
 
 from ...core.error import BaseError
 from ...utils.classloader import ClassLoader
@@ -17,6 +39,20 @@ LOGGER = logging.getLogger(__name__)
 
 SerDe = namedtuple("SerDe", "ser de")
 
+# Resolved schema classes, by model class and Meta.schema_class
+_SCHEMA_CLASSES: Dict[Tuple[type, object], type] = {}
+
+# Field classes which dump values of these types unchanged (object: any type)
+_PLAIN_FIELD_TYPES = {
+    fields.Boolean: bool,
+    fields.Integer: int,
+    fields.Raw: object,
+    fields.String: str,
+}
+
+# Schema instances free for reuse, by schema class and unknown mode
+_SCHEMA_POOL: Dict[Tuple[type, Optional[str]], List[Schema]] = {}
+
 
 def resolve_class(the_cls, relative_cls: Optional[type] = None) -> type:
     """Resolve a class.
@@ -79,6 +115,49 @@ class BaseModelError(BaseError):
 ModelType = TypeVar("ModelType", bound="BaseModel")
 
 
+def _acquire_schema(schema_cls: Type[Schema], unknown: Optional[str]) -> Schema:
+    """Take a schema instance for exclusive use, creating one if none is free."""
+    pool = _SCHEMA_POOL.get((schema_cls, unknown))
+    if pool:
+        try:
+            return pool.pop()
+        except IndexError:
+            pass
+    schema = schema_cls(
+        unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
+    )
+    schema._pool_key = (schema_cls, unknown)
+    return schema
+
+
+def _release_schema(schema: Schema):
+    """Return a schema instance taken by `_acquire_schema` for reuse."""
+    _SCHEMA_POOL.setdefault(schema._pool_key, []).append(schema)
+
+
+@contextmanager
+def pooled_schema(
+    schema_cls: Type[Schema], unknown: Optional[str] = None
+) -> Iterator[Schema]:
+    """Provide a schema instance, reused across calls.
+
+    Constructing a schema copies each of its fields, which costs far more than
+    a typical load or dump. Instances are kept for reuse by schema class and
+    unknown mode, and each is only held by one caller at a time, as some
+    schemas keep state between their processing hooks.
+
+    Args:
+        schema_cls: The schema class
+        unknown: Behaviour for unknown attributes, by default from the schema
+
+    """
+    schema = _acquire_schema(schema_cls, unknown)
+    try:
+        yield schema
+    finally:
+        _release_schema(schema)
+
+
 class BaseModel(ABC):
     """Base model that provides convenience methods."""
 
@@ -109,8 +188,13 @@ class BaseModel(ABC):
             The resolved schema class
 
         """
+        key = (cls, cls.Meta.schema_class)
+        resolved = _SCHEMA_CLASSES.get(key)
+        if resolved:
+            return resolved
         resolved = resolve_class(cls.Meta.schema_class, cls)
         if issubclass(resolved, BaseModelSchema):
+            _SCHEMA_CLASSES[key] = resolved
             return resolved
 
         raise TypeError(
@@ -185,11 +269,7 @@ class BaseModel(ABC):
         if obj is None and none2none:
             return None
 
-        schema_cls = cls._get_schema_class()
-        schema = schema_cls(
-            unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
-        )
-
+        schema = _acquire_schema(cls._get_schema_class(), unknown)
         try:
             return cast(
                 ModelType,
@@ -198,6 +278,8 @@ class BaseModel(ABC):
         except (AttributeError, ValidationError) as err:
             LOGGER.exception(f"{cls.__name__} message validation error:")
             raise BaseModelError(f"{cls.__name__} schema validation failed") from err
+        finally:
+            _release_schema(schema)
 
     @overload
     def serialize(
@@ -229,10 +311,7 @@ class BaseModel(ABC):
             A dict representation of this model, or a JSON string if as_string is True
 
         """
-        schema_cls = self._get_schema_class()
-        schema = schema_cls(
-            unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
-        )
+        schema = _acquire_schema(self._get_schema_class(), unknown)
         try:
             return (
                 schema.dumps(self, separators=(",", ":"))
@@ -244,6 +323,8 @@ class BaseModel(ABC):
             raise BaseModelError(
                 f"{self.__class__.__name__} schema validation failed"
             ) from err
+        finally:
+            _release_schema(schema)
 
     @classmethod
     def serde(cls, obj: Union["BaseModel", Mapping, None]) -> Optional[SerDe]:
@@ -335,6 +416,50 @@ class BaseModelSchema(Schema):
                     self.__class__.__name__
                 )
             )
+        self._dump_plan = None
+
+    def _compile_dump_plan(self) -> list:
+        """Resolve how each field is dumped, once for the schema instance.
+
+        Values for fields of plain types are read directly from the model,
+        while the other fields dump their values themselves.
+        """
+        plan = []
+        direct = type(self).get_attribute is Schema.get_attribute
+        for attr_name, field_obj in self.dump_fields.items():
+            key = field_obj.data_key if field_obj.data_key is not None else attr_name
+            attribute = (
+                attr_name if field_obj.attribute is None else field_obj.attribute
+            )
+            value_type = _PLAIN_FIELD_TYPES.get(type(field_obj))
+            if not direct or field_obj.dump_default is not missing or "." in attribute:
+                value_type = None
+            plan.append((attr_name, key, attribute, value_type, field_obj))
+        return plan
+
+    def _serialize(self, obj, *, many: bool = False):
+        """Serialize a model instance using the precompiled dump plan."""
+        if many or hasattr(obj, "__getitem__"):
+            return super()._serialize(obj, many=many)
+        plan = self._dump_plan
+        if plan is None:
+            plan = self._dump_plan = self._compile_dump_plan()
+        ret = self.dict_class()
+        for attr_name, key, attribute, value_type, field_obj in plan:
+            if value_type:
+                value = getattr(obj, attribute, missing)
+                if value is missing:
+                    continue
+                if not (
+                    value is None or value_type is object or type(value) is value_type
+                ):
+                    value = field_obj._serialize(value, attr_name, obj)
+            else:
+                value = field_obj.serialize(attr_name, obj, accessor=self.get_attribute)
+                if value is missing:
+                    continue
+            ret[key] = value
+        return ret
 
     @classmethod
     def _get_model_class(cls):
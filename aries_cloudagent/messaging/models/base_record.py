@@ -5,14 +5,19 @@ import logging
 import sys
 import uuid
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Type, TypeVar, Union
+from typing import Any, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from marshmallow import fields
 
 from ...cache.base import BaseCache
 from ...config.settings import BaseSettings
 from ...core.profile import ProfileSession
-from ...storage.base import BaseStorage, StorageDuplicateError, StorageNotFoundError
+from ...storage.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseStorage,
+    StorageDuplicateError,
+    StorageNotFoundError,
+)
 from ...storage.record import StorageRecord
 from ..util import datetime_to_str, time_now
 from ..valid import INDY_ISO8601_DATETIME_EXAMPLE, INDY_ISO8601_DATETIME_VALIDATE
@@ -64,6 +69,74 @@ def match_post_filter(
     return positive
 
 
+def post_filter_tag_query(
+    tag_map: Mapping[str, str],
+    post_filter: dict,
+    positive: bool = True,
+    alt: bool = False,
+) -> Tuple[Optional[dict], Optional[dict]]:
+    """Translate post-filter criteria on tagged fields into a tag query.
+
+    Criteria on tagged fields can be evaluated by the storage backend instead
+    of decoding and checking every record value. Criteria which cannot be
+    expressed as a tag query are left for `match_post_filter`.
+
+    Args:
+        tag_map: mapping of record property names to tag names
+        post_filter: filter to apply, as for `match_post_filter`
+        positive: whether matching all filter criteria positively or negatively
+        alt: set to match any (positive=True) value or miss all (positive=False)
+            values in post_filter
+
+    Returns:
+        A tuple of the tag query clause to add to the storage query (if any)
+        and the post-filter which remains to be applied to record values
+
+    """
+    if not post_filter:
+        return None, post_filter
+
+    def _tagged_str(key, value) -> bool:
+        return key in tag_map and isinstance(value, str)
+
+    def _tagged_alts(key, alts) -> bool:
+        return (
+            key in tag_map
+            and isinstance(alts, (list, tuple, set))
+            and bool(alts)
+            and all(isinstance(alt, str) and alt for alt in alts)
+        )
+
+    if not alt:
+        if positive:
+            # every criterion must hold: each tagged one can be matched separately
+            pushed = {
+                tag_map[k]: v for k, v in post_filter.items() if _tagged_str(k, v)
+            }
+            remaining = {k: v for k, v in post_filter.items() if not _tagged_str(k, v)}
+            return (pushed or None), remaining
+        # any criterion may miss: only translatable as a whole
+        if all(_tagged_str(k, v) for k, v in post_filter.items()):
+            return {"$not": {tag_map[k]: v for k, v in post_filter.items()}}, None
+        return None, post_filter
+
+    clauses = []
+    remaining = {}
+    for k, alts in post_filter.items():
+        if not _tagged_alts(k, alts):
+            remaining[k] = alts
+        elif positive:
+            clauses.append({tag_map[k]: {"$in": list(alts)}})
+        else:
+            # records without the tag also pass the tag query, but must be
+            # excluded: keep the criterion to check against the record value
+            clauses.append({"$not": {tag_map[k]: {"$in": list(alts)}}})
+            remaining[k] = alts
+    if not clauses:
+        return None, post_filter
+    return (clauses[0] if len(clauses) == 1 else {"$and": clauses}), remaining
+
+
 class BaseRecord(BaseModel):
     """Represents a single storage record."""
 
@@ -252,15 +325,16 @@ class BaseRecord(BaseModel):
         """
 
         storage = session.inject(BaseStorage)
+        tag_query, remaining, _ = cls.storage_tag_query(tag_filter, post_filter)
         rows = await storage.find_all_records(
             cls.RECORD_TYPE,
-            cls.prefix_tag_filter(tag_filter),
+            tag_query,
             options={"forUpdate": for_update, "retrieveTags": False},
         )
         found = None
         for record in rows:
             vals = json.loads(record.value)
-            if match_post_filter(vals, post_filter, alt=False):
+            if match_post_filter(vals, remaining, alt=False):
                 if found:
                     raise StorageDuplicateError(
                         "Multiple {} records located for {}{}".format(
@@ -284,15 +358,23 @@ class BaseRecord(BaseModel):
         session: ProfileSession,
         tag_filter: dict = None,
         *,
+        limit: int = None,
+        offset: int = None,
         post_filter_positive: dict = None,
         post_filter_negative: dict = None,
         alt: bool = False,
     ) -> Sequence[RecordType]:
         """Query stored records.
 
+        Without `limit` or `offset` all matching records are returned. Otherwise
+        only the requested page is returned, in the storage backend's order, and
+        records are read from storage one page at a time.
+
         Args:
             session: The profile session to use
             tag_filter: An optional dictionary of tag filter clauses
+            limit: The maximum number of records to return
+            offset: The number of matching records to skip
             post_filter_positive: Additional value filters to apply matching positively
             post_filter_negative: Additional value filters to apply matching negatively
             alt: set to match any (positive=True) value or miss all (positive=False)
@@ -300,15 +382,16 @@ class BaseRecord(BaseModel):
         """
 
         storage = session.inject(BaseStorage)
-        rows = await storage.find_all_records(
-            cls.RECORD_TYPE,
-            cls.prefix_tag_filter(tag_filter),
-            options={"retrieveTags": False},
+        (
+            tag_query,
+            post_filter_positive,
+            post_filter_negative,
+        ) = cls.storage_tag_query(
+            tag_filter, post_filter_positive, post_filter_negative, alt=alt
         )
-        result = []
-        for record in rows:
-            vals = json.loads(record.value)
-            if match_post_filter(
+
+        def matches(vals: dict) -> bool:
+            return match_post_filter(
                 vals,
                 post_filter_positive,
                 positive=True,
@@ -318,13 +401,66 @@ class BaseRecord(BaseModel):
                 post_filter_negative,
                 positive=False,
                 alt=alt,
-            ):
-                try:
-                    result.append(cls.from_storage(record.id, vals))
-                except BaseModelError as err:
-                    raise BaseModelError(f"{err}, for record id {record.id}")
+            )
+
+        if limit is None and offset is None:
+            rows = await storage.find_all_records(
+                cls.RECORD_TYPE,
+                tag_query,
+                options={"retrieveTags": False},
+            )
+            result = []
+            for record in rows:
+                vals = json.loads(record.value)
+                if matches(vals):
+                    result.append(cls._from_storage_row(record, vals))
+            return result
+
+        limit = DEFAULT_PAGE_SIZE if limit is None else limit
+        offset = offset or 0
+        if not (post_filter_positive or post_filter_negative):
+            rows = await storage.find_paginated_records(
+                cls.RECORD_TYPE, tag_query, limit=limit, offset=offset
+            )
+            return [
+                cls._from_storage_row(record, json.loads(record.value))
+                for record in rows
+            ]
+
+        # post-filtered fields are not indexed: walk storage page by page,
+        # skipping and collecting matches until the requested page is filled
+        result = []
+        scan_offset = 0
+        while len(result) < limit:
+            rows = await storage.find_paginated_records(
+                cls.RECORD_TYPE, tag_query, limit=DEFAULT_PAGE_SIZE, offset=scan_offset
+            )
+            scan_offset += len(rows)
+            for record in rows:
+                vals = json.loads(record.value)
+                if not matches(vals):
+                    continue
+                if offset:
+                    offset -= 1
+                    continue
+                result.append(cls._from_storage_row(record, vals))
+                if len(result) == limit:
+                    break
+            if len(rows) < DEFAULT_PAGE_SIZE:
+                break
         return result
 
+    @classmethod
+    def _from_storage_row(
+        cls: Type[RecordType], record: StorageRecord, vals: dict
+    ) -> RecordType:
+        """Instantiate a record from a storage row and its decoded value."""
+
+        try:
+            return cls.from_storage(record.id, vals)
+        except BaseModelError as err:
+            raise BaseModelError(f"{err}, for record id {record.id}")
+
     async def save(
         self,
         session: ProfileSession,
@@ -375,6 +511,84 @@ class BaseRecord(BaseModel):
 
         return self._id
 
+    @classmethod
+    async def save_many(
+        cls,
+        session: ProfileSession,
+        records: Sequence["BaseRecord"],
+        *,
+        reason: str = None,
+        log_params: Mapping[str, Any] = None,
+        log_override: bool = False,
+        event: bool = None,
+    ) -> Sequence[str]:
+        """Persist several records to storage using bulk storage operations.
+
+        New records are added and existing records updated in one operation
+        each, which the storage backend may perform as a single transaction.
+        Post-save actions are performed for each record once all are stored.
+
+        Args:
+            session: The profile session to use
+            records: The records to save
+            reason: A reason to add to the log
+            log_params: Additional parameters to log
+            log_override: Override configured logging regimen, print to stderr instead
+            event: Flag to override whether the events are sent
+
+        Returns:
+            The record identifiers, in the order of the records given
+
+        """
+        added = []
+        updated = []
+        timestamp = time_now()
+        for record in records:
+            record.updated_at = timestamp
+            if record._id and not record._new_with_id:
+                updated.append(record)
+            else:
+                if not record._id:
+                    record._id = str(uuid.uuid4())
+                record.created_at = timestamp
+                added.append(record)
+
+        new_ids = {id(record) for record in added}
+        storage = session.inject(BaseStorage)
+        stored = False
+        try:
+            if added:
+                await storage.add_records([record.storage_record for record in added])
+            if updated:
+                await storage.update_records(
+                    [record.storage_record for record in updated]
+                )
+            stored = True
+        finally:
+            for record in records:
+                new_record = id(record) in new_ids
+                log_reason = reason or (
+                    "Created record" if new_record else "Updated record"
+                )
+                if not stored:
+                    log_reason = f"FAILED: {log_reason}"
+                params = {record.RECORD_TYPE: record.serialize()}
+                if log_params:
+                    params.update(log_params)
+                record.log_state(
+                    log_reason, params, override=log_override, settings=session.settings
+                )
+
+        for record in added:
+            record._new_with_id = False
+        for record in records:
+            await record.post_save(
+                session, id(record) in new_ids, record._last_state, event
+            )
+            record._last_state = record.state
+
+        return [record._id for record in records]
+
     async def post_save(
         self,
         session: ProfileSession,
@@ -476,6 +690,47 @@ class BaseRecord(BaseModel):
                     ret[tag_map.get(k, k)] = v
         return ret
 
+    @classmethod
+    def storage_tag_query(
+        cls,
+        tag_filter: dict = None,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        *,
+        alt: bool = False,
+    ) -> Tuple[Optional[dict], Optional[dict], Optional[dict]]:
+        """Build the storage tag query for a tag filter and post-filters.
+
+        Post-filter criteria on tagged fields are moved into the tag query,
+        so that they are evaluated by the storage backend.
+
+        Args:
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+
+        Returns:
+            A tuple of the tag query and the remaining positive and negative
+            post-filters to apply to record values
+
+        """
+        tag_map = cls.get_tag_map()
+        tag_query = cls.prefix_tag_filter(tag_filter)
+        pos_clause, post_filter_positive = post_filter_tag_query(
+            tag_map, post_filter_positive, positive=True, alt=alt
+        )
+        neg_clause, post_filter_negative = post_filter_tag_query(
+            tag_map, post_filter_negative, positive=False, alt=alt
+        )
+        clauses = [clause for clause in (tag_query, pos_clause, neg_clause) if clause]
+        if len(clauses) > 1:
+            tag_query = {"$and": clauses}
+        elif clauses:
+            tag_query = clauses[0]
+        return tag_query, post_filter_positive, post_filter_negative
+
     def __eq__(self, other: Any) -> bool:
         """Comparison between records."""
 
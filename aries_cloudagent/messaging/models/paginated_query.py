@@ -0,0 +1,46 @@
+"""Query string parameters for paginated record listings."""
+
+from typing import Optional, Tuple
+
+from aiohttp.web import BaseRequest
+from marshmallow import fields, validate
+
+from ...storage.base import DEFAULT_PAGE_SIZE
+from .openapi import OpenAPISchema
+
+MAXIMUM_PAGE_SIZE = 10000
+
+
+class PaginatedQuerySchema(OpenAPISchema):
+    """Parameters for paginated record queries."""
+
+    limit = fields.Int(
+        required=False,
+        validate=validate.Range(min=1, max=MAXIMUM_PAGE_SIZE),
+        metadata={
+            "description": "Number of results to return",
+            "example": DEFAULT_PAGE_SIZE,
+        },
+    )
+    offset = fields.Int(
+        required=False,
+        validate=validate.Range(min=0),
+        metadata={"description": "Offset for pagination", "example": 0},
+    )
+
+
+def get_limit_offset(request: BaseRequest) -> Tuple[Optional[int], Optional[int]]:
+    """Read the pagination parameters from a request query string.
+
+    Returns:
+        A tuple of (limit, offset); both are None if pagination was not requested,
+        in which case all matching records are expected to be returned
+
+    """
+    limit = request.query.get("limit")
+    offset = request.query.get("offset")
+    if limit in (None, "") and offset in (None, ""):
+        return None, None
+    limit = min(int(limit), MAXIMUM_PAGE_SIZE) if limit else DEFAULT_PAGE_SIZE
+    offset = max(int(offset), 0) if offset else 0
+    return limit, offset
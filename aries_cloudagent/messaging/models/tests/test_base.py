@@ -3,7 +3,13 @@ from unittest import IsolatedAsyncioTestCase
 
 from marshmallow import EXCLUDE, INCLUDE, fields, validates_schema, ValidationError
 
-from ..base import BaseModel, BaseModelError, BaseModelSchema
+from ..base import (
+    _SCHEMA_POOL,
+    BaseModel,
+    BaseModelError,
+    BaseModelSchema,
+    pooled_schema,
+)
 
 
 class ModelImpl(BaseModel):
@@ -69,6 +75,27 @@ class SchemaImplWithoutUnknown(BaseModelSchema):
             raise ValidationError("")
 
 
+class ModelImplFields(BaseModel):
+    class Meta:
+        schema_class = "SchemaImplFields"
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class SchemaImplFields(BaseModelSchema):
+    class Meta:
+        model_class = ModelImplFields
+
+    text = fields.Str(data_key="@text")
+    number = fields.Int()
+    flag = fields.Bool()
+    renamed = fields.Str(attribute="other")
+    defaulted = fields.Str(dump_default="default")
+    raw = fields.Raw()
+    nested = fields.Nested(SchemaImpl)
+
+
 class TestBase(IsolatedAsyncioTestCase):
     def test_model_validate_fails(self):
         model = ModelImpl(attr="string")
@@ -118,3 +145,37 @@ class TestBase(IsolatedAsyncioTestCase):
         assert ModelImplWithoutUnknown.deserialize(
             {"attr": "succeeds", "another": "value"}
         )
+
+    def test_schema_pooled(self):
+        _SCHEMA_POOL.pop((SchemaImpl, None), None)
+        ModelImpl(attr="succeeds").serialize()
+        with pooled_schema(SchemaImpl) as schema:
+            # the instance in use is not shared
+            assert ModelImpl.deserialize({"attr": "succeeds"}).attr == "succeeds"
+            assert len(_SCHEMA_POOL[(SchemaImpl, None)]) == 1
+            assert _SCHEMA_POOL[(SchemaImpl, None)][0] is not schema
+        assert len(_SCHEMA_POOL[(SchemaImpl, None)]) == 2
+        with pooled_schema(SchemaImpl, INCLUDE) as schema:
+            assert schema.unknown == INCLUDE
+
+    def test_serialize_fields(self):
+        model = ModelImplFields(
+            text="text",
+            number=True,
+            flag=False,
+            other=5,
+            raw={"a": [1]},
+            nested=ModelImpl(attr="succeeds"),
+        )
+        assert model.serialize() == {
+            "@text": "text",
+            "number": 1,
+            "flag": False,
+            "renamed": "5",
+            "defaulted": "default",
+            "raw": {"a": [1]},
+            "nested": {"attr": "succeeds"},
+        }
+        model = ModelImplFields(text=None, number=3)
+        assert model.serialize() == {"number": 3, "defaulted": "default"}
+        assert model.serialize(as_string=True) == '{"number":3,"defaulted":"default"}'
@@ -12,11 +12,12 @@ from ....storage.base import (
     StorageDuplicateError,
     StorageRecord,
 )
+from ....storage.in_memory import InMemoryStorage
 from ....messaging.models.base import BaseModelError
 
 from ...util import time_now
 
-from ..base_record import BaseRecord, BaseRecordSchema
+from ..base_record import BaseRecord, BaseRecordSchema, post_filter_tag_query
 
 
 class BaseRecordImpl(BaseRecord):
@@ -151,6 +152,55 @@ class TestBaseRecord(IsolatedAsyncioTestCase):
             with self.assertRaises(ZeroDivisionError):
                 await rec.save(session)
 
+    async def test_save_many(self):
+        session = InMemoryProfile.test_session()
+        existing = ARecordImpl(a="1", b="0", code="one")
+        await existing.save(session)
+        existing.b = "1"
+        records = [existing] + [
+            ARecordImpl(a="2", b=str(i), code="two") for i in range(3)
+        ]
+        storage = session.inject(BaseStorage)
+        with mock.patch.object(
+            storage, "add_records", wraps=storage.add_records
+        ) as add_records, mock.patch.object(
+            storage, "update_records", wraps=storage.update_records
+        ) as update_records, mock.patch.object(
+            ARecordImpl, "post_save", mock.CoroutineMock()
+        ) as post_save:
+            ids = await ARecordImpl.save_many(session, records)
+        assert ids == [record._id for record in records]
+        assert len(add_records.call_args[0][0]) == 3
+        assert len(update_records.call_args[0][0]) == 1
+        assert [call.args[1] for call in post_save.call_args_list] == [
+            False,
+            True,
+            True,
+            True,
+        ]
+        stored = await storage.find_all_records(ARecordImpl.RECORD_TYPE)
+        assert len(stored) == 4
+        assert (
+            json.loads(
+                (await storage.get_record(ARecordImpl.RECORD_TYPE, existing._id)).value
+            )["b"]
+            == "1"
+        )
+
+    async def test_save_many_x(self):
+        session = InMemoryProfile.test_session()
+        rec = ARecordImpl(a="1", b="0", code="one")
+        with mock.patch.object(session, "inject", mock.MagicMock()) as mock_inject:
+            mock_inject.return_value = mock.MagicMock(
+                add_records=mock.CoroutineMock(side_effect=ZeroDivisionError())
+            )
+            with mock.patch.object(
+                ARecordImpl, "post_save", mock.CoroutineMock()
+            ) as post_save:
+                with self.assertRaises(ZeroDivisionError):
+                    await ARecordImpl.save_many(session, [rec])
+                post_save.assert_not_called()
+
     async def test_neq(self):
         a_rec = ARecordImpl(a="1", b="0", code="one")
         b_rec = BaseRecordImpl()
@@ -254,6 +304,139 @@ class TestBaseRecord(IsolatedAsyncioTestCase):
         )
         assert not result
 
+    async def test_query_paginated(self):
+        session = InMemoryProfile.test_session()
+        records = [
+            ARecordImpl(a=str(i), b="two", code="red" if i % 2 else "blue")
+            for i in range(7)
+        ]
+        for record in records:
+            await record.save(session)
+
+        result = await ARecordImpl.query(session, limit=3)
+        assert [r._id for r in result] == [r._id for r in records[:3]]
+
+        result = await ARecordImpl.query(session, {"code": "red"}, limit=2, offset=1)
+        assert [r._id for r in result] == [records[3]._id, records[5]._id]
+
+        result = await ARecordImpl.query(session, offset=5)
+        assert [r._id for r in result] == [r._id for r in records[5:]]
+
+    async def test_query_paginated_post_filter(self):
+        session = InMemoryProfile.test_session()
+        records = [ARecordImpl(a=str(i % 3), b="two") for i in range(250)]
+        for record in records:
+            await record.save(session)
+        expect = [r._id for r in records if r.a == "1"]
+
+        with mock.patch.object(
+            InMemoryStorage,
+            "find_paginated_records",
+            autospec=True,
+            side_effect=InMemoryStorage.find_paginated_records,
+        ) as mock_find, mock.patch.object(
+            InMemoryStorage, "find_all_records", autospec=True
+        ) as mock_find_all:
+            result = await ARecordImpl.query(
+                session, limit=10, offset=5, post_filter_positive={"a": "1"}
+            )
+            assert [r._id for r in result] == expect[5:15]
+            # only the first page of storage rows is needed to fill the request
+            assert mock_find.call_count == 1
+            mock_find_all.assert_not_called()
+
+            result = await ARecordImpl.query(
+                session,
+                limit=100,
+                offset=50,
+                post_filter_negative={"a": ["0", "2"]},
+                alt=True,
+            )
+            assert [r._id for r in result] == expect[50:]
+
+    async def test_query_post_filter_tagged(self):
+        session = InMemoryProfile.test_session()
+        records = [
+            ARecordImpl(a=str(i), b="two", code=("red", "blue", "green")[i % 3])
+            for i in range(9)
+        ]
+        for record in records:
+            await record.save(session)
+
+        with mock.patch.object(
+            InMemoryStorage,
+            "find_all_records",
+            autospec=True,
+            side_effect=InMemoryStorage.find_all_records,
+        ) as mock_find_all:
+            result = await ARecordImpl.query(
+                session,
+                post_filter_positive={"code": ["red", "blue"], "a": ["0", "1", "2"]},
+                alt=True,
+            )
+            assert {r._id for r in result} == {records[0]._id, records[1]._id}
+            mock_find_all.assert_called_once_with(
+                mock.ANY,
+                ARecordImpl.RECORD_TYPE,
+                {"code": {"$in": ["red", "blue"]}},
+                options={"retrieveTags": False},
+            )
+            assert (
+                len(await mock_find_all.side_effect(*mock_find_all.call_args[0])) == 6
+            )
+
+            mock_find_all.reset_mock()
+            result = await ARecordImpl.query(
+                session, post_filter_negative={"code": "green"}
+            )
+            assert {r._id for r in result} == {
+                r._id for r in records if r.code != "green"
+            }
+            mock_find_all.assert_called_once_with(
+                mock.ANY,
+                ARecordImpl.RECORD_TYPE,
+                {"$not": {"code": "green"}},
+                options={"retrieveTags": False},
+            )
+
+    def test_post_filter_tag_query(self):
+        tag_map = {"code": "code", "thread_id": "~thread_id"}
+
+        assert post_filter_tag_query(tag_map, None) == (None, None)
+        assert post_filter_tag_query(tag_map, {"code": "red", "a": "one"}) == (
+            {"code": "red"},
+            {"a": "one"},
+        )
+        assert post_filter_tag_query(tag_map, {"a": ["one"]}) == (None, {"a": ["one"]})
+        assert post_filter_tag_query(
+            tag_map, {"code": "red", "thread_id": "abc"}, positive=False
+        ) == ({"$not": {"code": "red", "~thread_id": "abc"}}, None)
+        assert post_filter_tag_query(
+            tag_map, {"code": "red", "a": "one"}, positive=False
+        ) == (None, {"code": "red", "a": "one"})
+        assert post_filter_tag_query(
+            tag_map, {"code": ["red", "blue"], "a": ["one"]}, alt=True
+        ) == ({"code": {"$in": ["red", "blue"]}}, {"a": ["one"]})
+        assert post_filter_tag_query(
+            tag_map, {"code": ["red"], "thread_id": ["abc"]}, alt=True
+        ) == (
+            {"$and": [{"code": {"$in": ["red"]}}, {"~thread_id": {"$in": ["abc"]}}]},
+            {},
+        )
+        # negative alternatives still require a value: keep the value check
+        assert post_filter_tag_query(
+            tag_map, {"code": ["red"]}, positive=False, alt=True
+        ) == ({"$not": {"code": {"$in": ["red"]}}}, {"code": ["red"]})
+        # substring and empty-value matches cannot be expressed as tag queries
+        assert post_filter_tag_query(tag_map, {"code": "red"}, alt=True) == (
+            None,
+            {"code": "red"},
+        )
+        assert post_filter_tag_query(tag_map, {"code": ["", "red"]}, alt=True) == (
+            None,
+            {"code": ["", "red"]},
+        )
+
     @mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
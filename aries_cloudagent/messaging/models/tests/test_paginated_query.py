@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from aries_cloudagent.tests import mock
+
+from ....storage.base import DEFAULT_PAGE_SIZE
+from ..paginated_query import (
+    MAXIMUM_PAGE_SIZE,
+    PaginatedQuerySchema,
+    get_limit_offset,
+)
+
+
+class TestPaginatedQuery(TestCase):
+    def test_get_limit_offset(self):
+        request = mock.MagicMock(query={})
+        assert get_limit_offset(request) == (None, None)
+
+        request = mock.MagicMock(query={"limit": "", "offset": ""})
+        assert get_limit_offset(request) == (None, None)
+
+        request = mock.MagicMock(query={"limit": "10"})
+        assert get_limit_offset(request) == (10, 0)
+
+        request = mock.MagicMock(query={"offset": "20"})
+        assert get_limit_offset(request) == (DEFAULT_PAGE_SIZE, 20)
+
+        request = mock.MagicMock(query={"limit": str(MAXIMUM_PAGE_SIZE + 1)})
+        assert get_limit_offset(request) == (MAXIMUM_PAGE_SIZE, 0)
+
+    def test_schema_validation(self):
+        schema = PaginatedQuerySchema()
+        assert not schema.validate({"limit": "10", "offset": "0"})
+        assert schema.validate({"limit": "0"})
+        assert schema.validate({"offset": "-1"})
+        assert schema.validate({"limit": str(MAXIMUM_PAGE_SIZE + 1)})
@@ -48,6 +48,25 @@ class BasicAgentMessage(AgentMessage):
         message_type = "doc/protocol/1.0/basic-message"
 
 
+class ThreadedAgentMessage(AgentMessage):
+    """Agent message implementation with a schema"""
+
+    class Meta:
+        """Meta data"""
+
+        schema_class = "ThreadedAgentMessageSchema"
+        message_type = "doc/protocol/1.0/threaded-message"
+
+
+class ThreadedAgentMessageSchema(AgentMessageSchema):
+    """Schema for threaded agent message"""
+
+    class Meta:
+        """Meta data"""
+
+        model_class = ThreadedAgentMessage
+
+
 class TestAgentMessage(IsolatedAsyncioTestCase):
     """Tests agent message."""
 
@@ -267,3 +286,15 @@ class TestAgentMessageSchema(IsolatedAsyncioTestCase):
         }
         result = SignedAgentMessage.deserialize(serial)
         result.serialize()
+
+    def test_deserialize_decorators_not_shared(self):
+        first = ThreadedAgentMessage.deserialize(
+            {"@type": "doc/proto/1.0/threaded-message", "~thread": {"thid": "first"}}
+        )
+        second = ThreadedAgentMessage.deserialize(
+            {"@type": "doc/proto/1.0/threaded-message", "~trace": {"target": "log"}}
+        )
+        assert first._decorators is not second._decorators
+        assert first._thread_id == "first"
+        assert "trace" not in first._decorators
+        assert second._thread_id == second._id
@@ -7,6 +7,7 @@ from typing import Iterable, List, Optional, Tuple, cast
 
 import jwt
 
+from ..cache.in_memory import InMemoryCache
 from ..config.injection_context import InjectionContext
 from ..core.error import BaseError
 from ..core.profile import Profile, ProfileSession
@@ -18,6 +19,7 @@ from ..protocols.coordinate_mediation.v1_0.route_manager import RouteManager
 from ..protocols.routing.v1_0.manager import RouteNotFoundError, RoutingManager
 from ..protocols.routing.v1_0.models.route_record import RouteRecord
 from ..storage.base import BaseStorage
+from ..storage.error import StorageNotFoundError
 from ..transport.wire_format import BaseWireFormat
 from ..wallet.base import BaseWallet
 from ..wallet.models.wallet_record import WalletRecord
@@ -31,7 +33,19 @@ class MultitenantManagerError(BaseError):
 
 
 class BaseMultitenantManager(ABC):
-    """Base class for handling multitenancy."""
+    """Base class for handling multitenancy.
+
+    Verified auth tokens, wallet records and the wallets of recipient keys are
+    cached in memory for a short time, to avoid reading the base wallet for
+    every admin request and inbound message. The cache is private to this
+    instance, as wallet records and unmanaged tokens hold wallet keys. Wallet
+    records are dropped from the cache when the wallet is updated or removed,
+    or a new token is issued for it; changes made by other agent instances
+    take effect once the cached entries expire.
+    """
+
+    DEFAULT_LOOKUP_CACHE_SIZE = 10000
+    DEFAULT_LOOKUP_CACHE_TTL = 60
 
     def __init__(self, profile: Profile):
         """Initialize base multitenant Manager.
@@ -42,12 +56,76 @@ class BaseMultitenantManager(ABC):
         self._profile = profile
         if not profile:
             raise MultitenantManagerError("Missing profile")
+        cache_size = profile.settings.get_int("multitenant.lookup_cache_size")
+        if cache_size is None:
+            cache_size = self.DEFAULT_LOOKUP_CACHE_SIZE
+        self._lookup_ttl = profile.settings.get_int("multitenant.lookup_cache_ttl")
+        if self._lookup_ttl is None:
+            self._lookup_ttl = self.DEFAULT_LOOKUP_CACHE_TTL
+        self._lookup_cache = (
+            InMemoryCache(max_entries=cache_size)
+            if cache_size and self._lookup_ttl
+            else None
+        )
+
+    async def _cache_wallet_record(self, wallet_record: WalletRecord):
+        """Store a wallet record in the lookup cache."""
+        if self._lookup_cache:
+            await self._lookup_cache.set(
+                f"wallet::{wallet_record.wallet_id}", wallet_record, self._lookup_ttl
+            )
+
+    async def _clear_wallet_record(self, wallet_id: str):
+        """Drop a wallet record from the lookup cache."""
+        if self._lookup_cache:
+            await self._lookup_cache.clear(f"wallet::{wallet_id}")
+
+    async def _get_wallet_record(
+        self, wallet_id: str, *, refresh: bool = False
+    ) -> WalletRecord:
+        """Get a wallet record from the lookup cache or the base wallet.
+
+        Args:
+            wallet_id: The wallet id of the wallet record
+            refresh: Read the wallet record from the base wallet
+
+        Raises:
+            StorageNotFoundError: If the wallet record does not exist
+
+        """
+        wallet = None
+        if self._lookup_cache and not refresh:
+            wallet = await self._lookup_cache.get(f"wallet::{wallet_id}")
+        if not wallet:
+            async with self._profile.session() as session:
+                wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
+            await self._cache_wallet_record(wallet)
+        return wallet
 
     @property
     @abstractmethod
     def open_profiles(self) -> Iterable[Profile]:
         """Return iterator over open profiles."""
 
+    async def prewarm_profiles(self, count: int):
+        """Open the profiles of the most recently active wallets in advance.
+
+        Args:
+            count: The maximum number of profiles to open
+
+        """
+
+    def stats(self) -> dict:
+        """Return the lookup cache and open profile statistics."""
+        return {
+            "lookup_cache": self._lookup_cache and self._lookup_cache.stats(),
+        }
+
+    def reset_stats(self):
+        """Reset the lookup cache and open profile statistics."""
+        if self._lookup_cache:
+            self._lookup_cache.reset_stats()
+
     async def get_default_mediator(self) -> Optional[MediationRecord]:
         """Retrieve the default mediator used for subwallet routing.
 
@@ -229,6 +307,7 @@ class BaseMultitenantManager(ABC):
             wallet_record = await WalletRecord.retrieve_by_id(session, wallet_id)
             wallet_record.update_settings(new_settings)
             await wallet_record.save(session)
+        await self._clear_wallet_record(wallet_id)
 
         return wallet_record
 
@@ -271,6 +350,7 @@ class BaseMultitenantManager(ABC):
             )
 
             await wallet.delete_record(session)
+        await self._clear_wallet_record(wallet.wallet_id)
 
     @abstractmethod
     async def remove_wallet_profile(self, profile: Profile):
@@ -316,6 +396,7 @@ class BaseMultitenantManager(ABC):
         wallet_record.jwt_iat = iat
         async with self._profile.session() as session:
             await wallet_record.save(session)
+        await self._clear_wallet_record(wallet_record.wallet_id)
 
         return token
 
@@ -358,17 +439,33 @@ class BaseMultitenantManager(ABC):
             Profile associated with the token
 
         """
-        jwt_secret = self._profile.context.settings.get("multitenant.jwt_secret")
         extra_settings = {}
 
-        token_body = jwt.decode(token, jwt_secret, algorithms=["HS256"], leeway=1)
+        token_body = None
+        now = datetime.now(tz=timezone.utc).timestamp()
+        if self._lookup_cache:
+            token_body = await self._lookup_cache.get(f"token::{token}")
+            if token_body and token_body.get("exp") is not None:
+                # decode again once expired, so the token is rejected
+                if token_body["exp"] + 1 <= now:
+                    token_body = None
+        if not token_body:
+            jwt_secret = self._profile.context.settings.get("multitenant.jwt_secret")
+            token_body = jwt.decode(token, jwt_secret, algorithms=["HS256"], leeway=1)
+            if self._lookup_cache:
+                ttl = self._lookup_ttl
+                if token_body.get("exp") is not None:
+                    ttl = min(ttl, max(int(token_body["exp"] + 1 - now), 1))
+                await self._lookup_cache.set(f"token::{token}", token_body, ttl)
 
         wallet_id = token_body.get("wallet_id")
         wallet_key = token_body.get("wallet_key")
         iat = token_body.get("iat")
 
-        async with self._profile.session() as session:
-            wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
+        wallet = await self._get_wallet_record(wallet_id)
+        if wallet.jwt_iat and wallet.jwt_iat != iat:
+            # the token may have been issued by another agent instance
+            wallet = await self._get_wallet_record(wallet_id, refresh=True)
 
         if wallet.requires_external_key:
             if not wallet_key:
@@ -391,13 +488,25 @@ class BaseMultitenantManager(ABC):
         Returns:
             Wallet record associated with the recipient key
         """
+        cache_key = f"recipient_key::{recipient_key}"
+        wallet_id = None
+        if self._lookup_cache:
+            wallet_id = await self._lookup_cache.get(cache_key)
+        if wallet_id:
+            try:
+                return await self._get_wallet_record(wallet_id)
+            except StorageNotFoundError:
+                # the wallet has been removed
+                await self._lookup_cache.clear(cache_key)
+
         routing_mgr = RoutingManager(self._profile)
 
         try:
             routing_record = await routing_mgr.get_recipient(recipient_key)
-            async with self._profile.session() as session:
-                wallet = await WalletRecord.retrieve_by_id(
-                    session, routing_record.wallet_id
+            wallet = await self._get_wallet_record(routing_record.wallet_id)
+            if self._lookup_cache:
+                await self._lookup_cache.set(
+                    cache_key, wallet.wallet_id, self._lookup_ttl
                 )
 
             return wallet
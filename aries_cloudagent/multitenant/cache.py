@@ -1,24 +1,45 @@
 """Cache for multitenancy profiles."""
 
 import logging
+import time
 from collections import OrderedDict
-from typing import Optional
+from typing import Callable, Dict, Optional
 from weakref import WeakValueDictionary
 
 from ..core.profile import Profile
+from ..utils.stats import Stats
 
 LOGGER = logging.getLogger(__name__)
 
 
 class ProfileCache:
-    """Profile cache that caches based on LRU strategy."""
-
-    def __init__(self, capacity: int):
+    """Profile cache that caches based on LRU strategy.
+
+    Besides the capacity, profiles may be evicted after being unused for a
+    given time, or to keep the total weight of the cached profiles (such as
+    their number of storage connections) within a budget. Idle profiles are
+    evicted as the cache is used. Eviction only drops the cache's reference:
+    a profile still in use elsewhere stays open and is rescued on the next
+    lookup.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        idle_ttl: float = None,
+        budget: int = None,
+        weigher: Callable[[Profile], int] = None,
+    ):
         """Initialize ProfileCache.
 
         Args:
             capacity: The capacity of the cache. If capacity is exceeded
                       profiles are closed.
+            idle_ttl: The time in seconds after which an unused profile is
+                      evicted, if any.
+            budget: The maximum total weight of the cached profiles, if any.
+            weigher: Callable returning the weight of a profile, by default 1.
         """
 
         LOGGER.debug(f"Profile cache initialized with capacity {capacity}")
@@ -26,17 +47,50 @@ class ProfileCache:
         self._cache: OrderedDict[str, Profile] = OrderedDict()
         self.profiles: WeakValueDictionary[str, Profile] = WeakValueDictionary()
         self.capacity = capacity
+        self.idle_ttl = idle_ttl
+        self.budget = budget
+        self.weigher = weigher or (lambda profile: 1)
+        self._last_used: Dict[str, float] = {}
+        self._weights: Dict[str, int] = {}
+        self._weight = 0
+        self.reset_stats()
+
+    def _insert(self, key: str, value: Profile):
+        """Add or refresh a profile at the most recently used position."""
+        if key not in self._cache:
+            weight = self.weigher(value)
+            self._weights[key] = weight
+            self._weight += weight
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        self._last_used[key] = time.monotonic()
+
+    def _evict(self, reason: str):
+        """Evict the least recently used profile."""
+        key, _ = self._cache.popitem(last=False)
+        del self._last_used[key]
+        self._weight -= self._weights.pop(key)
+        self._evictions[reason] += 1
+        LOGGER.debug(f"Evicted profile with key {key} ({reason})")
 
     def _cleanup(self):
-        """Prune cache until size matches defined capacity."""
+        """Prune cache until it is within the defined capacity and budget."""
+        if self.idle_ttl:
+            # the least recently used profile is also the longest idle
+            expired = time.monotonic() - self.idle_ttl
+            while self._cache and self._last_used[next(iter(self._cache))] < expired:
+                self._evict("idle")
         if len(self._cache) > self.capacity:
             LOGGER.debug(
                 f"Profile limit of {self.capacity} reached."
                 " Evicting least recently used profiles..."
             )
             while len(self._cache) > self.capacity:
-                key, _ = self._cache.popitem(last=False)
-                LOGGER.debug(f"Evicted profile with key {key}")
+                self._evict("capacity")
+        if self.budget:
+            # always keep the most recently used profile
+            while self._weight > self.budget and len(self._cache) > 1:
+                self._evict("budget")
 
     def get(self, key: str) -> Optional[Profile]:
         """Get profile with associated key from cache.
@@ -59,9 +113,12 @@ class ProfileCache:
                     f"Rescuing profile {key} from eviction from cache; profile "
                     "will be reinserted into cache"
                 )
-                self._cache[key] = value
-            self._cache.move_to_end(key)
+                self._rescues += 1
+            self._hits += 1
+            self._insert(key, value)
             self._cleanup()
+        else:
+            self._misses += 1
 
         return value
 
@@ -97,12 +154,16 @@ class ProfileCache:
 
         # Strong reference to profile to hold open until evicted
         LOGGER.debug(f"Setting profile with id {key} in profile cache")
-        self._cache[key] = value
+        self._opens += 1
+        self._insert(key, value)
 
         # Refresh profile liveliness
-        self._cache.move_to_end(key)
         self._cleanup()
 
+    def log_open(self, duration: float):
+        """Record the time taken to open a profile."""
+        self._stats.log("open", duration)
+
     def remove(self, key: str):
         """Remove profile with associated key from the cache.
 
@@ -111,3 +172,30 @@ class ProfileCache:
         """
         del self.profiles[key]
         del self._cache[key]
+        del self._last_used[key]
+        self._weight -= self._weights.pop(key)
+
+    def stats(self) -> dict:
+        """Return the cache size and hit, open and eviction counters."""
+        return {
+            "open": len(self.profiles),
+            "cached": len(self._cache),
+            "capacity": self.capacity,
+            "weight": self._weight,
+            "budget": self.budget,
+            "hits": self._hits,
+            "misses": self._misses,
+            "opens": self._opens,
+            "rescues": self._rescues,
+            "evictions": dict(self._evictions),
+            "timing": self._stats.extract(),
+        }
+
+    def reset_stats(self):
+        """Reset the cache counters."""
+        self._hits = 0
+        self._misses = 0
+        self._opens = 0
+        self._rescues = 0
+        self._evictions = {"capacity": 0, "idle": 0, "budget": 0}
+        self._stats = Stats()
@@ -1,12 +1,16 @@
 """Manager for multitenancy."""
 
+import heapq
+import json
 import logging
+import time
 from typing import Iterable, Optional
 
 from ..config.injection_context import InjectionContext
 from ..config.wallet import wallet_config
 from ..core.profile import Profile
 from ..multitenant.base import BaseMultitenantManager
+from ..storage.base import DEFAULT_PAGE_SIZE
 from ..wallet.models.wallet_record import WalletRecord
 from .cache import ProfileCache
 
@@ -16,6 +20,9 @@ LOGGER = logging.getLogger(__name__)
 class MultitenantManager(BaseMultitenantManager):
     """Class for handling multitenancy."""
 
+    # the default connection pool size of an Askar store
+    DEFAULT_PROFILE_CONNECTIONS = 10
+
     def __init__(self, profile: Profile):
         """Initialize default multitenant Manager.
 
@@ -24,9 +31,25 @@ class MultitenantManager(BaseMultitenantManager):
         """
         super().__init__(profile)
         self._profiles = ProfileCache(
-            profile.settings.get_int("multitenant.cache_size") or 100
+            profile.settings.get_int("multitenant.cache_size") or 100,
+            idle_ttl=profile.settings.get_int("multitenant.cache_idle_ttl"),
+            budget=profile.settings.get_int("multitenant.cache_max_connections"),
+            weigher=self._profile_connections,
         )
 
+    @classmethod
+    def _profile_connections(cls, profile: Profile) -> int:
+        """Estimate the number of storage connections held by a profile."""
+        storage_config = profile.settings.get("wallet.storage_config")
+        if isinstance(storage_config, str):
+            try:
+                storage_config = json.loads(storage_config)
+            except ValueError:
+                storage_config = None
+        if isinstance(storage_config, dict) and storage_config.get("max_connections"):
+            return int(storage_config["max_connections"])
+        return cls.DEFAULT_PROFILE_CONNECTIONS
+
     @property
     def open_profiles(self) -> Iterable[Profile]:
         """Return iterator over open profiles."""
@@ -81,11 +104,69 @@ class MultitenantManager(BaseMultitenantManager):
             )
 
             # MTODO: add ledger config
+            start = time.perf_counter()
             profile, _ = await wallet_config(context, provision=provision)
+            self._profiles.log_open(time.perf_counter() - start)
             self._profiles.put(wallet_id, profile)
 
         return profile
 
+    async def prewarm_profiles(self, count: int):
+        """Open the profiles of the most recently active wallets in advance.
+
+        Wallets are ranked by the `updated_at` time of their record, which
+        changes when a new token is issued or the wallet settings are updated,
+        but not when an existing token is used. Unmanaged wallets are skipped,
+        as their keys are not stored. Wallet records are read one page at a
+        time, keeping only the best ranked.
+
+        Args:
+            count: The maximum number of profiles to open
+
+        """
+        count = min(count, self._profiles.capacity)
+        if count <= 0:
+            return
+        # a min-heap of (updated_at, wallet_id, record), least recent first
+        selected = []
+        offset = 0
+        async with self._profile.session() as session:
+            while True:
+                wallet_records = await WalletRecord.query(
+                    session, limit=DEFAULT_PAGE_SIZE, offset=offset
+                )
+                offset += len(wallet_records)
+                for record in wallet_records:
+                    if record.requires_external_key:
+                        continue
+                    entry = (record.updated_at or "", record.wallet_id, record)
+                    if len(selected) < count:
+                        heapq.heappush(selected, entry)
+                    elif entry[:2] > selected[0][:2]:
+                        heapq.heapreplace(selected, entry)
+                if len(wallet_records) < DEFAULT_PAGE_SIZE:
+                    break
+        selected.sort(key=lambda entry: entry[:2], reverse=True)
+        for _, _, wallet_record in selected:
+            try:
+                await self.get_wallet_profile(self._profile.context, wallet_record)
+            except Exception:
+                LOGGER.exception(
+                    "Error opening profile for wallet %s", wallet_record.wallet_id
+                )
+        LOGGER.debug("Opened %d profiles in advance", len(self._profiles.profiles))
+
+    def stats(self) -> dict:
+        """Return the lookup cache and open profile statistics."""
+        stats = super().stats()
+        stats["profiles"] = self._profiles.stats()
+        return stats
+
+    def reset_stats(self):
+        """Reset the lookup cache and open profile statistics."""
+        super().reset_stats()
+        self._profiles.reset_stats()
+
     async def update_wallet(self, wallet_id: str, new_settings: dict) -> WalletRecord:
         """Update an existing wallet and wallet record.
 
@@ -32,7 +32,7 @@ class MockMultitenantManager(BaseMultitenantManager):
         wallet_record: WalletRecord,
         extra_settings: dict = ...,
         *,
-        provision=False
+        provision=False,
     ):
         """Do nothing."""
 
@@ -642,6 +642,165 @@ class TestBaseMultitenantManager(IsolatedAsyncioTestCase):
 
             assert profile == mock_profile
 
+    async def test_get_profile_for_token_cached(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_MANAGED,
+            settings={"wallet.type": "indy", "wallet.key": "wallet_key"},
+        )
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        token = await self.manager.create_auth_token(wallet_record)
+
+        with mock.patch.object(
+            self.manager, "get_wallet_profile", mock.CoroutineMock()
+        ), mock.patch.object(
+            WalletRecord, "retrieve_by_id", wraps=WalletRecord.retrieve_by_id
+        ) as retrieve, mock.patch.object(
+            test_module.jwt, "decode", wraps=jwt.decode
+        ) as decode:
+            await self.manager.get_profile_for_token(self.context, token)
+            await self.manager.get_profile_for_token(self.context, token)
+            assert retrieve.call_count == 1
+            assert decode.call_count == 1
+
+            # a new token replaces the old one
+            wallet_record.jwt_iat = None
+            with mock.patch.object(
+                test_module, "datetime", mock.MagicMock()
+            ) as mock_datetime:
+                mock_datetime.now.return_value.timestamp.return_value = 12345
+                new_token = await self.manager.create_auth_token(wallet_record)
+            await self.manager.get_profile_for_token(self.context, new_token)
+            with self.assertRaises(MultitenantManagerError):
+                await self.manager.get_profile_for_token(self.context, token)
+
+            # a token issued by another instance is accepted
+            async with self.profile.session() as session:
+                wallet_record.jwt_iat = 23456
+                await wallet_record.save(session)
+            other_token = jwt.encode(
+                {"wallet_id": wallet_record.wallet_id, "iat": 23456},
+                "very_secret_jwt",
+                algorithm="HS256",
+            )
+            await self.manager.get_profile_for_token(self.context, other_token)
+
+            await self.manager.update_wallet(wallet_record.wallet_id, {})
+            retrieve.reset_mock()
+            await self.manager.get_profile_for_token(self.context, other_token)
+            assert retrieve.call_count == 1
+
+    async def test_get_profile_for_token_cached_expiry(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_MANAGED,
+            settings={"wallet.type": "indy", "wallet.key": "wallet_key"},
+        )
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        exp = int(datetime.now(tz=timezone.utc).timestamp()) + 100
+        token = jwt.encode(
+            {"wallet_id": wallet_record.wallet_id, "exp": exp},
+            "very_secret_jwt",
+            algorithm="HS256",
+        )
+
+        with mock.patch.object(
+            self.manager, "get_wallet_profile", mock.CoroutineMock()
+        ), mock.patch.object(
+            self.manager._lookup_cache, "set", wraps=self.manager._lookup_cache.set
+        ) as cache_set, mock.patch.object(
+            test_module.jwt, "decode", wraps=jwt.decode
+        ) as decode:
+            await self.manager.get_profile_for_token(self.context, token)
+            await self.manager.get_profile_for_token(self.context, token)
+            assert decode.call_count == 1
+            # cached no longer than the token is valid
+            (ttl,) = [
+                call[0][2]
+                for call in cache_set.call_args_list
+                if call[0][0] == f"token::{token}"
+            ]
+            assert ttl <= 101
+
+            # the cached body is not used once the token has expired
+            with mock.patch.object(
+                test_module, "datetime", mock.MagicMock()
+            ) as mock_datetime:
+                mock_datetime.now.return_value.timestamp.return_value = exp + 10
+                await self.manager.get_profile_for_token(self.context, token)
+            assert decode.call_count == 2
+
+    async def test_update_wallet_cached_during_save(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_MANAGED,
+            settings={"wallet.webhook_urls": ["old-url"]},
+        )
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        stale = await self.manager._get_wallet_record(wallet_record.wallet_id)
+        save = WalletRecord.save
+
+        async def save_with_lookup(record, session, *args, **kwargs):
+            # a concurrent lookup caches the record before the update is saved
+            await self.manager._cache_wallet_record(stale)
+            return await save(record, session, *args, **kwargs)
+
+        with mock.patch.object(WalletRecord, "save", save_with_lookup):
+            await self.manager.update_wallet(
+                wallet_record.wallet_id, {"wallet.webhook_urls": ["new-url"]}
+            )
+            wallet = await self.manager._get_wallet_record(wallet_record.wallet_id)
+            assert wallet.settings["wallet.webhook_urls"] == ["new-url"]
+
+            await self.manager._cache_wallet_record(stale)
+            await self.manager.create_auth_token(wallet)
+            wallet = await self.manager._get_wallet_record(wallet_record.wallet_id)
+            assert wallet.jwt_iat
+
+    async def test_get_wallet_by_key_cached(self):
+        recipient_key = "test-recipient-key"
+        wallet_record = WalletRecord(settings={})
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+            await RouteRecord(
+                wallet_id=wallet_record.wallet_id, recipient_key=recipient_key
+            ).save(session)
+
+        with mock.patch.object(
+            test_module.RoutingManager,
+            "get_recipient",
+            wraps=test_module.RoutingManager(self.profile).get_recipient,
+        ) as get_recipient:
+            for _ in range(2):
+                wallet = await self.manager._get_wallet_by_key(recipient_key)
+                assert wallet.wallet_id == wallet_record.wallet_id
+            assert get_recipient.call_count == 1
+
+            async with self.profile.session() as session:
+                await wallet_record.delete_record(session)
+            await self.manager._clear_wallet_record(wallet_record.wallet_id)
+            with self.assertRaises(StorageNotFoundError):
+                await self.manager._get_wallet_by_key(recipient_key)
+            assert get_recipient.call_count == 2
+
+    async def test_lookup_cache_disabled(self):
+        self.profile.settings["multitenant.lookup_cache_size"] = 0
+        manager = MockMultitenantManager(self.profile)
+        assert manager._lookup_cache is None
+
+        wallet_record = WalletRecord(settings={})
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        with mock.patch.object(
+            WalletRecord, "retrieve_by_id", wraps=WalletRecord.retrieve_by_id
+        ) as retrieve:
+            await manager._get_wallet_record(wallet_record.wallet_id)
+            await manager._get_wallet_record(wallet_record.wallet_id)
+            assert retrieve.call_count == 2
+
     async def test_get_wallets_by_message_missing_wire_format_raises(self):
         with self.assertRaises(
             InjectionError,
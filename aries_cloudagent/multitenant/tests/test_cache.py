@@ -103,3 +103,64 @@ def test_rescue_open_profile():
     assert cache.get("2") is None
     assert cache.get("3")
     assert cache.get("4")
+
+
+def test_cleanup_idle():
+    cache = ProfileCache(3, idle_ttl=10)
+
+    cache.put("1", MockProfile())
+    cache.put("2", MockProfile())
+    cache._last_used["1"] -= 20
+
+    cache.put("3", MockProfile())
+
+    assert len(cache._cache) == 2
+    assert cache.get("1") is None
+    assert cache.get("2")
+    assert cache.stats()["evictions"]["idle"] == 1
+
+
+def test_cleanup_budget():
+    weights = {}
+    cache = ProfileCache(10, budget=5, weigher=lambda profile: weights[id(profile)])
+
+    for key, weight in (("1", 2), ("2", 2), ("3", 3)):
+        profile = MockProfile()
+        weights[id(profile)] = weight
+        cache.put(key, profile)
+
+    assert list(cache._cache) == ["2", "3"]
+    assert cache.stats()["weight"] == 5
+
+    large = MockProfile()
+    weights[id(large)] = 8
+    cache.put("4", large)
+
+    # the most recently used profile is kept when over budget by itself
+    assert list(cache._cache) == ["4"]
+    assert cache.stats()["evictions"]["budget"] == 3
+
+    cache.remove("4")
+    assert cache.stats()["weight"] == 0
+
+
+def test_stats():
+    cache = ProfileCache(1)
+
+    cache.put("1", MockProfile())
+    held = cache.profiles["1"]
+    cache.put("2", MockProfile())
+    assert cache.get("1") is held
+    assert cache.get("2") is None
+    cache.log_open(0.1)
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["opens"] == 2
+    assert stats["rescues"] == 1
+    assert stats["evictions"]["capacity"] == 2
+    assert stats["timing"]["count"] == {"open": 1}
+
+    cache.reset_stats()
+    assert cache.stats()["hits"] == 0
@@ -217,3 +217,64 @@ class TestMultitenantManager(IsolatedAsyncioTestCase):
             await self.manager.remove_wallet_profile(test_profile)
             assert not self.manager._profiles.has("test")
             profile_remove.assert_called_once_with()
+
+    async def test_prewarm_profiles(self):
+        wallet_ids = []
+        async with self.profile.session() as session:
+            for idx in range(3):
+                wallet_record = WalletRecord(
+                    key_management_mode=WalletRecord.MODE_MANAGED, settings={}
+                )
+                await wallet_record.save(session)
+                wallet_ids.append(wallet_record.wallet_id)
+            await WalletRecord(
+                key_management_mode=WalletRecord.MODE_UNMANAGED,
+                settings={"wallet.type": "askar"},
+            ).save(session)
+
+        def side_effect(context, provision):
+            return (InMemoryProfile(context=context), None)
+
+        with mock.patch(
+            "aries_cloudagent.multitenant.manager.wallet_config"
+        ) as wallet_config, mock.patch(
+            "aries_cloudagent.multitenant.manager.DEFAULT_PAGE_SIZE", 2
+        ), mock.patch.object(
+            WalletRecord, "query", wraps=WalletRecord.query
+        ) as query:
+            wallet_config.side_effect = side_effect
+            await self.manager.prewarm_profiles(2)
+            assert wallet_config.call_count == 2
+            # wallet records are read a page at a time
+            assert [call.kwargs["offset"] for call in query.call_args_list] == [
+                0,
+                2,
+                4,
+            ]
+
+        # the most recently saved wallets are opened first
+        assert set(self.manager._profiles.profiles) == set(wallet_ids[1:])
+        stats = self.manager.stats()
+        assert stats["profiles"]["opens"] == 2
+        assert stats["profiles"]["timing"]["count"] == {"open": 2}
+        assert stats["lookup_cache"]["entries"] == 0
+
+        self.manager.reset_stats()
+        assert self.manager.stats()["profiles"]["opens"] == 0
+
+    async def test_profile_connection_budget(self):
+        self.profile.settings["multitenant.cache_max_connections"] = 10
+        manager = MultitenantManager(self.profile)
+        small = InMemoryProfile.test_profile(
+            settings={"wallet.storage_config": '{"max_connections": 4}'}
+        )
+        assert manager._profile_connections(small) == 4
+        assert (
+            manager._profile_connections(InMemoryProfile.test_profile())
+            == MultitenantManager.DEFAULT_PROFILE_CONNECTIONS
+        )
+
+        manager._profiles.put("1", small)
+        manager._profiles.put("2", InMemoryProfile.test_profile())
+        assert list(manager._profiles._cache) == ["2"]
+        assert manager._profiles.stats()["evictions"]["budget"] == 1
@@ -97,6 +97,8 @@ class TestConnectionRoutes(IsolatedAsyncioTestCase):
                         "their_public_did": "a_public_did",
                         "invitation_msg_id": "dummy_msg",
                     },
+                    limit=None,
+                    offset=None,
                     post_filter_positive={
                         "their_role": list(ConnRecord.Role.REQUESTER.value),
                         "connection_protocol": "connections/1.0",
@@ -115,6 +117,36 @@ class TestConnectionRoutes(IsolatedAsyncioTestCase):
                     }  # sorted
                 )
 
+    async def test_connections_list_paginated(self):
+        self.request.query = {"limit": "2", "offset": "1"}
+
+        with mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec:
+            conns = [
+                mock.MagicMock(
+                    serialize=mock.MagicMock(
+                        return_value={"state": state.rfc23, "created_at": "1234567890"}
+                    )
+                )
+                for state in (ConnRecord.State.ABANDONED, ConnRecord.State.COMPLETED)
+            ]
+            mock_conn_rec.query = mock.CoroutineMock(return_value=conns)
+
+            with mock.patch.object(test_module.web, "json_response") as mock_response:
+                await test_module.connections_list(self.request)
+                mock_conn_rec.query.assert_called_once_with(
+                    ANY,
+                    {},
+                    limit=2,
+                    offset=1,
+                    post_filter_positive={},
+                    alt=True,
+                )
+                mock_response.assert_called_once_with(
+                    {"results": [c.serialize.return_value for c in conns]}  # unsorted
+                )
+
     async def test_connections_list_x(self):
         self.request.query = {
             "their_role": ConnRecord.Role.REQUESTER.rfc160,
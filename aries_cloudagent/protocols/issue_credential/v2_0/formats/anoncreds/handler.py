@@ -27,6 +27,7 @@ from ......messaging.credential_definitions.util import (
     CredDefQueryStringSchema,
 )
 from ......messaging.decorators.attach_decorator import AttachDecorator
+from ......messaging.models.base import pooled_schema
 from ......multitenant.base import BaseMultitenantManager
 from ......revocation_anoncreds.models.issuer_cred_rev_record import IssuerCredRevRecord
 from ......storage.base import BaseStorage
@@ -84,7 +85,8 @@ class AnonCredsCredFormatHandler(V20CredFormatHandler):
         Schema = mapping[message_type]
 
         # Validate, throw if not valid
-        Schema(unknown=RAISE).load(attachment_data)
+        with pooled_schema(Schema, RAISE) as schema:
+            schema.load(attachment_data)
 
     async def get_detail_record(self, cred_ex_id: str) -> V20CredExRecordIndy:
         """Retrieve credential exchange detail record by cred_ex_id."""
@@ -8,9 +8,10 @@ from pyld import jsonld
 from pyld.jsonld import JsonLdProcessor
 
 from ......messaging.decorators.attach_decorator import AttachDecorator
+from ......messaging.models.base import pooled_schema
 from ......storage.vc_holder.base import VCHolder
 from ......storage.vc_holder.vc_record import VCRecord
-from ......vc.ld_proofs import DocumentLoader
+from ......vc.ld_proofs import DocumentLoader, run_jsonld
 from ......vc.ld_proofs.check import get_properties_without_context
 from ......vc.ld_proofs.error import LinkedDataProofException
 from ......vc.vc_ld import VerifiableCredential, VerifiableCredentialSchema
@@ -71,7 +72,8 @@ class LDProofCredFormatHandler(V20CredFormatHandler):
         Schema = mapping[message_type]
 
         # Validate, throw if not valid
-        Schema(unknown=EXCLUDE).load(attachment_data)
+        with pooled_schema(Schema, EXCLUDE) as schema:
+            schema.load(attachment_data)
 
     async def get_detail_record(self, cred_ex_id: str) -> V20CredExRecordLDProof:
         """Retrieve credential exchange detail record by cred_ex_id."""
@@ -392,7 +394,12 @@ class LDProofCredFormatHandler(V20CredFormatHandler):
 
         # Saving expanded type as a cred_tag
         document_loader = self.profile.inject(DocumentLoader)
-        expanded = jsonld.expand(cred_dict, options={"documentLoader": document_loader})
+        expanded = await run_jsonld(
+            document_loader,
+            jsonld.expand,
+            cred_dict,
+            options={"documentLoader": document_loader},
+        )
         types = JsonLdProcessor.get_values(
             expanded[0],
             "@type",
@@ -13,12 +13,13 @@ import re
 import logging
 
 from datetime import datetime
+from functools import lru_cache
 from dateutil.parser import parse as dateutil_parser
 from dateutil.parser import ParserError
-from jsonpath_ng import parse
+from jsonpath_ng import JSONPath, parse
 from pyld import jsonld
 from pyld.jsonld import JsonLdProcessor
-from typing import Sequence, Optional, Tuple, Union, Dict, List
+from typing import Sequence, Optional, Pattern, Tuple, Union, Dict, List
 from unflatten import unflatten
 from uuid import uuid4
 
@@ -68,6 +69,34 @@ LIST_INDEX_PATTERN = re.compile(r"\[(\W+)\]|\[(\d+)\]")
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def parse_jsonpath(path: str) -> JSONPath:
+    """Parse a JSONPath expression, reusing the result for the same expression.
+
+    Parsing is far slower than evaluating, and the same paths are evaluated
+    against every credential.
+    """
+    return parse(path)
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=4096)
+def _timezone_aware_datetime(datetime_str: str) -> datetime:
+    # filter bounds are compared with every credential, so they are parsed once
+    match = PYTZ_TIMEZONE_PATTERN.search(datetime_str)
+    if match:
+        result = match.group(1)
+        datetime_str = datetime_str.replace(result, "")
+        return dateutil_parser(datetime_str).replace(tzinfo=pytz.timezone(result))
+    else:
+        utc = pytz.UTC
+        return dateutil_parser(datetime_str).replace(tzinfo=utc)
+
+
 class DIFPresExchError(BaseError):
     """Base class for DIF Presentation Exchange related errors."""
 
@@ -367,6 +396,7 @@ class DIFPresExchHandler:
         document_loader = self.profile.inject(DocumentLoader)
 
         result = []
+        is_holder_field_ids = self.field_ids_for_is_holder(constraints)
         for credential in credentials:
             if constraints.subject_issuer == "required" and not self.subject_is_issuer(
                 credential=credential
@@ -374,7 +404,6 @@ class DIFPresExchHandler:
                 continue
 
             applicable = False
-            is_holder_field_ids = self.field_ids_for_is_holder(constraints)
             for field in constraints._fields:
                 applicable = await self.filter_by_field(field, credential)
                 # all fields in the constraint should be satisfied
@@ -513,7 +542,7 @@ class DIFPresExchHandler:
             unflatten_dict = {}
             for field in constraints._fields:
                 for path in field.paths:
-                    jsonpath = parse(path)
+                    jsonpath = parse_jsonpath(path)
                     match = jsonpath.find(credential_dict)
                     if len(match) == 0:
                         continue
@@ -578,7 +607,7 @@ class DIFPresExchHandler:
                     "is not currently supported"
                 )
             try:
-                jsonpath = parse(path)
+                jsonpath = parse_jsonpath(path)
                 match = jsonpath.find(credential_dict)
             except KeyError:
                 continue
@@ -613,13 +642,7 @@ class DIFPresExchHandler:
 
     def string_to_timezone_aware_datetime(self, datetime_str: str) -> datetime:
         """Convert string with PYTZ timezone to datetime for comparison."""
-        if PYTZ_TIMEZONE_PATTERN.search(datetime_str):
-            result = PYTZ_TIMEZONE_PATTERN.search(datetime_str).group(1)
-            datetime_str = datetime_str.replace(result, "")
-            return dateutil_parser(datetime_str).replace(tzinfo=pytz.timezone(result))
-        else:
-            utc = pytz.UTC
-            return dateutil_parser(datetime_str).replace(tzinfo=utc)
+        return _timezone_aware_datetime(datetime_str)
 
     def validate_patch(self, to_check: any, _filter: Filter) -> bool:
         """Apply filter on match_value.
@@ -909,7 +932,7 @@ class DIFPresExchHandler:
 
         """
         if _filter.pattern:
-            return bool(re.search(pattern=_filter.pattern, string=str(val)))
+            return bool(_compile_pattern(_filter.pattern).search(str(val)))
         return False
 
     def const_check(self, val: any, _filter: Filter) -> bool:
@@ -1396,7 +1419,7 @@ class DIFPresExchHandler:
             constraint = inp_desc_id_constraint_map.get(desc_map_item_id)
             schema_filter = inp_desc_id_schemas_map.get(desc_map_item_id)
             desc_map_item_path = desc_map_item.get("path")
-            jsonpath = parse(desc_map_item_path)
+            jsonpath = parse_jsonpath(desc_map_item_path)
             match = jsonpath.find(pres)
             if len(match) == 0:
                 raise DIFPresExchError(
@@ -1435,7 +1458,7 @@ class DIFPresExchHandler:
         """Return field_paths that are applicable to oneof_filter."""
         applied_field_paths = []
         for path in field_paths:
-            jsonpath = parse(path)
+            jsonpath = parse_jsonpath(path)
             match = jsonpath.find(cred_dict)
             if len(match) > 0:
                 applied_field_paths.append(path)
@@ -1560,7 +1583,7 @@ class DIFPresExchHandler:
                 return path
             split_by_index = re.split(r"\[(\d+)\]", to_check, 1)
             if len(split_by_index) > 1:
-                jsonpath = parse(split_by_index[0])
+                jsonpath = parse_jsonpath(split_by_index[0])
                 match = jsonpath.find(cred_dict)
                 if len(match) > 0:
                     if isinstance(match[0].value, dict):
@@ -1572,7 +1595,7 @@ class DIFPresExchHandler:
 
     def nested_get(self, input_dict: dict, path: str) -> Union[Dict, List]:
         """Return dict or list from nested dict given list of nested_key."""
-        jsonpath = parse(path)
+        jsonpath = parse_jsonpath(path)
         match = jsonpath.find(input_dict)
         if len(match) > 1:
             return_list = []
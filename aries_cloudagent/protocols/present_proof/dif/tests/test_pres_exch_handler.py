@@ -3729,6 +3729,14 @@ class TestPresExchHandler:
             field = DIFField.deserialize({"path": ["$.credentialSubject.test"]})
             assert await dif_pres_exch_handler.filter_by_field(field, vc_record_cred)
 
+    def test_parse_jsonpath_reused(self):
+        jsonpath = test_module.parse_jsonpath("$.credentialSubject.givenName")
+        assert test_module.parse_jsonpath("$.credentialSubject.givenName") is jsonpath
+        assert [
+            match.value
+            for match in jsonpath.find({"credentialSubject": {"givenName": "Alice"}})
+        ] == ["Alice"]
+
     def test_string_to_timezone_aware_datetime(self, profile):
         dif_pres_exch_handler = DIFPresExchHandler(
             profile, proof_type=BbsBlsSignature2020.signature_type
@@ -14,6 +14,7 @@ from ......indy.models.xform import indy_proof_req_preview2indy_requested_creds
 from ......anoncreds.util import generate_pr_nonce
 from ......anoncreds.verifier import AnonCredsVerifier
 from ......messaging.decorators.attach_decorator import AttachDecorator
+from ......messaging.models.base import pooled_schema
 from ......messaging.util import canon
 
 from ....anoncreds.pres_exch_handler import AnonCredsPresExchHandler
@@ -67,7 +68,8 @@ class AnonCredsPresExchangeHandler(V20PresFormatHandler):
         Schema = mapping[message_type]
 
         # Validate, throw if not valid
-        Schema(unknown=RAISE).load(attachment_data)
+        with pooled_schema(Schema, RAISE) as schema:
+            schema.load(attachment_data)
 
     def get_format_identifier(self, message_type: str) -> str:
         """Get attachment format identifier for format and message combination.
@@ -9,6 +9,7 @@ from marshmallow import RAISE
 
 from ......messaging.base_handler import BaseResponder
 from ......messaging.decorators.attach_decorator import AttachDecorator
+from ......messaging.models.base import pooled_schema
 from ......storage.error import StorageNotFoundError
 from ......storage.vc_holder.base import VCHolder
 from ......storage.vc_holder.vc_record import VCRecord
@@ -75,7 +76,8 @@ class DIFPresFormatHandler(V20PresFormatHandler):
         Schema = mapping[message_type]
 
         # Validate, throw if not valid
-        Schema(unknown=RAISE).load(attachment_data)
+        with pooled_schema(Schema, RAISE) as schema:
+            schema.load(attachment_data)
 
     def get_format_identifier(self, message_type: str) -> str:
         """Get attachment format identifier for format and message combination.
@@ -1,5 +1,6 @@
 """Admin routes for presentations."""
 
+import asyncio
 import json
 from typing import Mapping, Sequence, Tuple
 
@@ -26,6 +27,10 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    get_limit_offset,
+)
 from ....messaging.valid import (
     INDY_EXTRA_WQL_EXAMPLE,
     INDY_EXTRA_WQL_VALIDATE,
@@ -70,7 +75,7 @@ class V20PresentProofModuleResponseSchema(OpenAPISchema):
     """Response schema for Present Proof Module."""
 
 
-class V20PresExRecordListQueryStringSchema(OpenAPISchema):
+class V20PresExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.Str(
@@ -392,6 +397,57 @@ class V20PresExIdMatchInfoSchema(OpenAPISchema):
     )
 
 
+BATCH_VERIFY_MAX = 100
+BATCH_VERIFY_CONCURRENCY = 10
+
+
+class V20PresVerifyBatchRequestSchema(OpenAPISchema):
+    """Request schema for verifying several presentations."""
+
+    pres_ex_ids = fields.List(
+        fields.Str(
+            validate=UUID4_VALIDATE,
+            metadata={
+                "description": "Presentation exchange identifier",
+                "example": UUID4_EXAMPLE,
+            },
+        ),
+        required=True,
+        validate=validate.Length(min=1, max=BATCH_VERIFY_MAX),
+        metadata={"description": "Presentation exchanges to verify, without repeats"},
+    )
+
+
+class V20PresVerifyBatchResultSchema(OpenAPISchema):
+    """Result of verifying a single presentation in a batch."""
+
+    pres_ex_id = fields.Str(
+        required=True,
+        metadata={
+            "description": "Presentation exchange identifier",
+            "example": UUID4_EXAMPLE,
+        },
+    )
+    record = fields.Nested(
+        V20PresExRecordSchema(),
+        required=False,
+        metadata={"description": "Presentation exchange record, once verified"},
+    )
+    error = fields.Str(
+        required=False,
+        metadata={"description": "Reason the presentation could not be verified"},
+    )
+
+
+class V20PresVerifyBatchResponseSchema(OpenAPISchema):
+    """Response schema for verifying several presentations."""
+
+    results = fields.List(
+        fields.Nested(V20PresVerifyBatchResultSchema()),
+        metadata={"description": "Verification results, in request order"},
+    )
+
+
 async def _add_nonce(indy_proof_request: Mapping) -> Mapping:
     """Add nonce to indy proof request if need be."""
 
@@ -446,12 +502,15 @@ async def present_proof_list(request: web.BaseRequest):
         for k in ("connection_id", "role", "state")
         if request.query.get(k, "") != ""
     }
+    limit, offset = get_limit_offset(request)
 
     try:
         async with profile.session() as session:
             records = await V20PresExRecord.query(
                 session=session,
                 tag_filter=tag_filter,
+                limit=limit,
+                offset=offset,
                 post_filter_positive=post_filter,
             )
         results = [record.serialize() for record in records]
@@ -1307,6 +1366,85 @@ async def present_proof_verify_presentation(request: web.BaseRequest):
     return web.json_response(result)
 
 
+@docs(tags=["present-proof v2.0"], summary="Verify several received presentations")
+@request_schema(V20PresVerifyBatchRequestSchema())
+@response_schema(V20PresVerifyBatchResponseSchema(), 200, description="")
+async def present_proof_verify_presentations(request: web.BaseRequest):
+    """Request handler for verifying several presentations concurrently.
+
+    A failure to verify one presentation does not affect the others; it is
+    reported in the result for that presentation exchange. Results are given
+    in the order of the requested presentation exchange identifiers.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        The verification result for each presentation exchange
+
+    """
+    r_time = get_timer()
+
+    context: AdminRequestContext = request["context"]
+    profile = context.profile
+    outbound_handler = request["outbound_message_router"]
+
+    body = await request.json()
+    pres_ex_ids = body["pres_ex_ids"]
+    if len(set(pres_ex_ids)) != len(pres_ex_ids):
+        raise web.HTTPBadRequest(
+            reason="Presentation exchange identifiers must be unique"
+        )
+
+    pres_manager = V20PresManager(profile)
+    semaphore = asyncio.Semaphore(BATCH_VERIFY_CONCURRENCY)
+
+    async def verify(pres_ex_id: str) -> dict:
+        async with semaphore:
+            try:
+                async with profile.session() as session:
+                    pres_ex_record = await V20PresExRecord.retrieve_by_id(
+                        session, pres_ex_id
+                    )
+            except StorageNotFoundError as err:
+                return {"pres_ex_id": pres_ex_id, "error": err.roll_up}
+
+            if pres_ex_record.state != V20PresExRecord.STATE_PRESENTATION_RECEIVED:
+                return {
+                    "pres_ex_id": pres_ex_id,
+                    "error": (
+                        f"Presentation exchange {pres_ex_id} "
+                        f"in {pres_ex_record.state} state "
+                        f"(must be {V20PresExRecord.STATE_PRESENTATION_RECEIVED})"
+                    ),
+                }
+
+            try:
+                pres_ex_record = await pres_manager.verify_pres(pres_ex_record)
+            except (BaseModelError, LedgerError, StorageError) as err:
+                async with profile.session() as session:
+                    await pres_ex_record.save_error_state(session, reason=err.roll_up)
+                # other party cares that we cannot continue protocol
+                await outbound_handler(
+                    problem_report_for_record(
+                        pres_ex_record, ProblemReportReason.ABANDONED.value
+                    ),
+                    connection_id=pres_ex_record.connection_id,
+                )
+                return {"pres_ex_id": pres_ex_id, "error": err.roll_up}
+
+            trace_event(
+                context.settings,
+                pres_ex_record,
+                outcome="presentation_exchange_verify.END",
+                perf_counter=r_time,
+            )
+            return {"pres_ex_id": pres_ex_id, "record": pres_ex_record.serialize()}
+
+    results = await asyncio.gather(*(verify(pres_ex_id) for pres_ex_id in pres_ex_ids))
+    return web.json_response({"results": results})
+
+
 @docs(
     tags=["present-proof v2.0"],
     summary="Send a problem report for presentation exchange",
@@ -1428,6 +1566,10 @@ async def register(app: web.Application):
                 "/present-proof-2.0/records/{pres_ex_id}/verify-presentation",
                 present_proof_verify_presentation,
             ),
+            web.post(
+                "/present-proof-2.0/verify-presentations",
+                present_proof_verify_presentations,
+            ),
             web.post(
                 "/present-proof-2.0/records/{pres_ex_id}/problem-report",
                 present_proof_problem_report,
@@ -2204,6 +2204,78 @@ class TestPresentProofRoutes(IsolatedAsyncioTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):  # storage error
                 await test_module.present_proof_verify_presentation(self.request)
 
+    async def test_present_proof_verify_presentations(self):
+        self.request.json = mock.CoroutineMock(
+            return_value={"pres_ex_ids": ["ok", "missing", "done", "bad"]}
+        )
+
+        def make_record(state):
+            return mock.MagicMock(
+                connection_id="dummy",
+                state=state,
+                serialize=mock.MagicMock(return_value={"state": "done"}),
+                save_error_state=mock.CoroutineMock(),
+            )
+
+        records = {
+            "ok": make_record(V20PresExRecord.STATE_PRESENTATION_RECEIVED),
+            "done": make_record(V20PresExRecord.STATE_DONE),
+            "bad": make_record(V20PresExRecord.STATE_PRESENTATION_RECEIVED),
+        }
+
+        async def retrieve(session, pres_ex_id):
+            if pres_ex_id not in records:
+                raise StorageNotFoundError("no such record")
+            return records[pres_ex_id]
+
+        async def verify_pres(record):
+            if record is records["bad"]:
+                raise test_module.LedgerError("ledger down")
+            return record
+
+        with mock.patch.object(
+            test_module, "V20PresManager", autospec=True
+        ) as mock_pres_mgr_cls, mock.patch.object(
+            test_module, "V20PresExRecord", autospec=True
+        ) as mock_px_rec_cls, mock.patch.object(
+            test_module.web, "json_response", mock.MagicMock()
+        ) as mock_response:
+            mock_px_rec_cls.STATE_PRESENTATION_RECEIVED = (
+                V20PresExRecord.STATE_PRESENTATION_RECEIVED
+            )
+            mock_px_rec_cls.retrieve_by_id = mock.CoroutineMock(side_effect=retrieve)
+            mock_pres_mgr_cls.return_value = mock.MagicMock(
+                verify_pres=mock.CoroutineMock(side_effect=verify_pres)
+            )
+
+            await test_module.present_proof_verify_presentations(self.request)
+            results = mock_response.call_args[0][0]["results"]
+            assert [result["pres_ex_id"] for result in results] == [
+                "ok",
+                "missing",
+                "done",
+                "bad",
+            ]
+            assert results[0]["record"] == {"state": "done"}
+            assert "no such record" in results[1]["error"]
+            assert "must be" in results[2]["error"]
+            assert "ledger down" in results[3]["error"]
+            records["bad"].save_error_state.assert_awaited_once()
+            self.request["outbound_message_router"].assert_awaited_once()
+            assert mock_pres_mgr_cls.return_value.verify_pres.await_count == 2
+
+    async def test_present_proof_verify_presentations_duplicate_x(self):
+        self.request.json = mock.CoroutineMock(
+            return_value={"pres_ex_ids": ["dummy", "other", "dummy"]}
+        )
+
+        with mock.patch.object(
+            test_module, "V20PresManager", autospec=True
+        ) as mock_pres_mgr_cls:
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.present_proof_verify_presentations(self.request)
+            mock_pres_mgr_cls.return_value.verify_pres.assert_not_called()
+
     async def test_present_proof_problem_report(self):
         self.request.json = mock.CoroutineMock(
             return_value={"description": "Did I say no problem? I meant 'No! Problem.'"}
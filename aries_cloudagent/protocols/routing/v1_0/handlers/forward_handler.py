@@ -1,6 +1,7 @@
 """Handler for incoming forward messages."""
 
 import json
+from typing import Union
 
 from .....messaging.base_handler import (
     BaseHandler,
@@ -23,14 +24,32 @@ class ForwardHandler(BaseHandler):
 
         if not context.message_receipt.recipient_verkey:
             raise HandlerException("Cannot forward message: unknown recipient")
+
+        packed = context.message.msg
+        packed = json.dumps(packed).encode("ascii")
+        await self.relay(context, responder, context.message.to, packed)
+
+    async def relay(
+        self,
+        context: RequestContext,
+        responder: BaseResponder,
+        target: str,
+        packed: Union[str, bytes],
+    ):
+        """Send a packed message to the connection routed for a recipient key.
+
+        Args:
+            context: The request context of the forward message
+            responder: The responder for the forward message
+            target: The recipient key of the packed message
+            packed: The packed message to deliver
+
+        """
         self._logger.info(
             "Received forward for: %s", context.message_receipt.recipient_verkey
         )
 
-        packed = context.message.msg
-        packed = json.dumps(packed).encode("ascii")
         rt_mgr = RoutingManager(context.profile)
-        target = context.message.to
 
         try:
             recipient = await rt_mgr.get_recipient(target)
@@ -64,6 +83,6 @@ class ForwardHandler(BaseHandler):
             {
                 "connection_id": recipient.connection_id,
                 "status": send_status.value,
-                "recipient_key": context.message.to,
+                "recipient_key": target,
             },
         )
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from typing import Sequence
+import time
+from typing import Dict, Optional, Sequence
 
 from ....core.error import BaseError
 from ....core.profile import Profile
@@ -28,6 +29,94 @@ class RouteNotFoundError(RoutingManagerError):
     """Requested route was not found."""
 
 
+class RouteIndex:
+    """In-memory index of the routes to mediated connections by recipient key.
+
+    The index is loaded from the stored routes at startup and updated as
+    routes are created and removed through the `RoutingManager`, such as by
+    keylist updates, so forwarded messages are resolved without a storage
+    query. Keys with no route are remembered for a short time, so repeated
+    forwards to an unknown key do not each wait for the route lookup retries.
+
+    Only routes to connections of the root profile are indexed. Routes added
+    or removed by another agent instance are not seen until a restart, so the
+    index suits a mediator whose keylist updates are handled by one instance.
+    """
+
+    NEGATIVE_TTL = 5.0
+    MAX_MISSING = 10000
+
+    def __init__(self, profile: Profile, negative_ttl: float = None):
+        """Initialize a `RouteIndex` instance.
+
+        Args:
+            profile: The root profile whose routes are indexed
+            negative_ttl: The time in seconds to remember a key with no route
+
+        """
+        self.profile = profile
+        self.negative_ttl = self.NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        self._routes: Dict[str, RouteRecord] = {}
+        self._missing: Dict[str, float] = {}
+
+    async def load(self):
+        """Load the stored routes to connections into the index."""
+        async with self.profile.session() as session:
+            routes = await RouteRecord.query(
+                session, tag_filter={"role": RouteRecord.ROLE_SERVER}
+            )
+        self._routes = {}
+        self._missing = {}
+        for route in routes:
+            self.add(route)
+        LOGGER.info("Loaded %d routes into the routing index", len(self._routes))
+
+    def get(self, recipient_key: str) -> Optional[RouteRecord]:
+        """Look up the route for a recipient key.
+
+        Raises:
+            RouteNotFoundError: If the key was recently found to have no route
+
+        """
+        route = self._routes.get(recipient_key)
+        if route:
+            return route
+        expires = self._missing.get(recipient_key)
+        if expires:
+            if expires > time.monotonic():
+                raise RouteNotFoundError(
+                    f"No route found with recipient key: {recipient_key}"
+                )
+            del self._missing[recipient_key]
+        return None
+
+    def add(self, route: RouteRecord):
+        """Add a route to the index."""
+        self._missing.pop(route.recipient_key, None)
+        if route.connection_id and route.role == RouteRecord.ROLE_SERVER:
+            self._routes[route.recipient_key] = route
+
+    def remove(self, recipient_key: str):
+        """Remove the route for a recipient key from the index."""
+        self._routes.pop(recipient_key, None)
+
+    def add_missing(self, recipient_key: str):
+        """Remember that a recipient key has no route."""
+        if self.negative_ttl:
+            now = time.monotonic()
+            if len(self._missing) >= self.MAX_MISSING:
+                self._missing = {
+                    key: expires
+                    for (key, expires) in self._missing.items()
+                    if expires > now
+                }
+            self._missing[recipient_key] = now + self.negative_ttl
+
+    def __len__(self) -> int:
+        """Accessor for the number of indexed routes."""
+        return len(self._routes)
+
+
 class RoutingManager:
     """Class for handling routing records."""
 
@@ -43,6 +132,14 @@ class RoutingManager:
         if not profile:
             raise RoutingManagerError("Missing profile")
 
+    @property
+    def route_index(self) -> Optional[RouteIndex]:
+        """Accessor for the routing index of this profile, if enabled."""
+        route_index = self._profile.inject_or(RouteIndex)
+        if route_index and route_index.profile is self._profile:
+            return route_index
+        return None
+
     async def get_recipient(self, recip_verkey: str) -> RouteRecord:
         """Resolve the recipient for a verkey.
 
@@ -56,6 +153,12 @@ class RoutingManager:
         if not recip_verkey:
             raise RoutingManagerError("Must pass non-empty recip_verkey")
 
+        route_index = self.route_index
+        if route_index:
+            record = route_index.get(recip_verkey)
+            if record:
+                return record
+
         i = 0
         record = None
         while not record:
@@ -66,6 +169,8 @@ class RoutingManager:
                         session, recip_verkey
                     )
                 LOGGER.info(">>> FOUND routing record for verkey: " + recip_verkey)
+                if route_index:
+                    route_index.add(record)
                 return record
             except StorageDuplicateError:
                 LOGGER.info(">>> DUPLICATE routing record for verkey: " + recip_verkey)
@@ -76,6 +181,8 @@ class RoutingManager:
                 LOGGER.info(">>> NOT FOUND routing record for verkey: " + recip_verkey)
                 i += 1
                 if i > RECIP_ROUTE_RETRY:
+                    if route_index:
+                        route_index.add_missing(recip_verkey)
                     raise RouteNotFoundError(
                         f"No route found with recipient key: {recip_verkey}"
                     )
@@ -121,6 +228,9 @@ class RoutingManager:
         """Remove an existing route record."""
         async with self._profile.session() as session:
             await route.delete_record(session)
+        route_index = self.route_index
+        if route_index:
+            route_index.remove(route.recipient_key)
 
     async def create_route_record(
         self,
@@ -153,5 +263,8 @@ class RoutingManager:
         )
         async with self._profile.session() as session:
             await route.save(session, reason="Created new route")
+        route_index = self.route_index
+        if route_index:
+            route_index.add(route)
         LOGGER.info(">>> CREATED routing record for verkey: " + recipient_key)
         return route
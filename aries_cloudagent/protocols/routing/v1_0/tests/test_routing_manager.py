@@ -10,7 +10,13 @@ from .....storage.error import (
 )
 from .....transport.inbound.receipt import MessageReceipt
 
-from ..manager import RoutingManager, RoutingManagerError, RouteNotFoundError
+from .. import manager as test_module
+from ..manager import (
+    RouteIndex,
+    RoutingManager,
+    RoutingManagerError,
+    RouteNotFoundError,
+)
 from ..models.route_record import RouteRecord, RouteRecordSchema
 
 TEST_CONN_ID = "conn-id"
@@ -87,6 +93,56 @@ class TestRoutingManager(IsolatedAsyncioTestCase):
                 await self.manager.get_recipient(TEST_ROUTE_VERKEY)
         assert "No route found" in str(context.exception)
 
+    async def test_route_index(self):
+        await self.manager.create_route_record(TEST_CONN_ID, TEST_VERKEY)
+        route_index = RouteIndex(self.profile)
+        await route_index.load()
+        self.profile.context.injector.bind_instance(RouteIndex, route_index)
+        assert len(route_index) == 1
+
+        record = await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
+        assert len(route_index) == 2
+        with mock.patch.object(
+            RouteRecord, "retrieve_by_recipient_key", mock.CoroutineMock()
+        ) as mock_retrieve:
+            for key in (TEST_VERKEY, TEST_ROUTE_VERKEY):
+                found = await self.manager.get_recipient(key)
+                assert found.connection_id == TEST_CONN_ID
+                assert found.recipient_key == key
+            mock_retrieve.assert_not_called()
+
+        await self.manager.delete_route_record(record)
+        assert len(route_index) == 1
+        with mock.patch.object(test_module, "RECIP_ROUTE_RETRY", 0):
+            with self.assertRaises(RouteNotFoundError):
+                await self.manager.get_recipient(TEST_ROUTE_VERKEY)
+
+        # the missing key is remembered until a route is created
+        with mock.patch.object(
+            RouteRecord, "retrieve_by_recipient_key", mock.CoroutineMock()
+        ) as mock_retrieve:
+            with self.assertRaises(RouteNotFoundError):
+                await self.manager.get_recipient(TEST_ROUTE_VERKEY)
+            mock_retrieve.assert_not_called()
+        await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
+        assert await self.manager.get_recipient(TEST_ROUTE_VERKEY)
+
+    async def test_route_index_other_profile(self):
+        route_index = RouteIndex(mock.MagicMock())
+        self.profile.context.injector.bind_instance(RouteIndex, route_index)
+        assert self.manager.route_index is None
+        await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
+        assert not len(route_index)
+
+    async def test_route_index_missing_expires(self):
+        route_index = RouteIndex(self.profile, negative_ttl=0.01)
+        route_index.add_missing(TEST_ROUTE_VERKEY)
+        with self.assertRaises(RouteNotFoundError):
+            route_index.get(TEST_ROUTE_VERKEY)
+        route_index._missing[TEST_ROUTE_VERKEY] -= 1
+        assert route_index.get(TEST_ROUTE_VERKEY) is None
+        assert not route_index._missing
+
     async def test_get_routes_connection_id(self):
         await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
         results = await self.manager.get_routes(
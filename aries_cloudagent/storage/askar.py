@@ -1,5 +1,6 @@
 """Aries-Askar implementation of BaseStorage interface."""
 
+from contextlib import asynccontextmanager
 from typing import Mapping, Sequence
 
 from aries_askar import AskarError, AskarErrorCode, Session
@@ -140,6 +141,108 @@ class AskarStorage(BaseStorage):
             else:
                 raise StorageError("Error when removing storage record") from err
 
+    @asynccontextmanager
+    async def _batch(self):
+        """Provide a transaction handle for a batch of changes.
+
+        When the session is itself a transaction its handle is used, and the
+        changes are committed along with the session. Otherwise a transaction
+        is opened and committed only if every change in the batch succeeds.
+        """
+        if self._session.is_transaction:
+            yield self._session.handle
+            return
+        profile = self._session.profile
+        try:
+            txn = await profile.store.transaction(profile.profile_id)
+        except AskarError as err:
+            raise StorageError("Error opening storage transaction") from err
+        try:
+            yield txn
+            try:
+                await txn.commit()
+            except AskarError as err:
+                raise StorageError("Error committing storage records") from err
+        finally:
+            # closing an uncommitted transaction rolls it back
+            await txn.close()
+
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """Add multiple new records to the store in a single transaction.
+
+        Args:
+            records: the `StorageRecord` instances to be stored
+
+        Raises:
+            StorageDuplicateError: If any of the records already exists
+
+        """
+        for record in records:
+            validate_record(record)
+        async with self._batch() as txn:
+            for record in records:
+                try:
+                    await txn.insert(record.type, record.id, record.value, record.tags)
+                except AskarError as err:
+                    if err.code == AskarErrorCode.DUPLICATE:
+                        raise StorageDuplicateError(
+                            f"Duplicate record: {record.type}/{record.id}"
+                        ) from None
+                    raise StorageError("Error when adding storage record") from err
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """Replace the value and tags of multiple records in a single transaction.
+
+        Args:
+            records: the `StorageRecord` instances holding the new values and tags
+
+        Raises:
+            StorageNotFoundError: If any of the records is not found
+
+        """
+        for record in records:
+            validate_record(record)
+        async with self._batch() as txn:
+            for record in records:
+                try:
+                    await txn.replace(record.type, record.id, record.value, record.tags)
+                except AskarError as err:
+                    if err.code == AskarErrorCode.NOT_FOUND:
+                        raise StorageNotFoundError(
+                            f"Record not found: {record.type}/{record.id}"
+                        ) from None
+                    raise StorageError(
+                        "Error when updating storage record value"
+                    ) from err
+
+    async def delete_records(
+        self, records: Sequence[StorageRecord], ignore_missing: bool = False
+    ):
+        """Delete multiple records in a single transaction.
+
+        Args:
+            records: the `StorageRecord` instances to delete
+            ignore_missing: skip records which are not found instead of raising
+
+        Raises:
+            StorageNotFoundError: If any of the records is not found
+
+        """
+        for record in records:
+            validate_record(record, delete=True)
+        async with self._batch() as txn:
+            for record in records:
+                try:
+                    await txn.remove(record.type, record.id)
+                except AskarError as err:
+                    if err.code == AskarErrorCode.NOT_FOUND:
+                        if ignore_missing:
+                            continue
+                        raise StorageNotFoundError(
+                            f"Record not found: {record.type}/{record.id}"
+                        ) from None
+                    raise StorageError("Error when removing storage record") from err
+
     async def find_record(
         self, type_filter: str, tag_query: Mapping, options: Mapping = None
     ) -> StorageRecord:
@@ -191,6 +294,46 @@ class AskarStorage(BaseStorage):
             )
         return results
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query.
+
+        The offset and limit are applied by the store, so only the requested
+        page is read from the database.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+            limit: Maximum number of records to return
+            offset: Number of matching records to skip
+        """
+        results = []
+        profile: AskarProfile = self._session.profile
+        try:
+            async for row in profile.store.scan(
+                type_filter,
+                tag_query,
+                offset=offset,
+                limit=limit,
+                profile=profile.settings.get("wallet.askar_profile"),
+            ):
+                results.append(
+                    StorageRecord(
+                        type=row.category,
+                        id=row.name,
+                        value=None if row.value is None else row.value.decode("utf-8"),
+                        tags=row.tags,
+                    )
+                )
+        except AskarError as err:
+            raise StorageSearchError("Error when fetching search results") from err
+        return results
+
     async def delete_all_records(
         self,
         type_filter: str,
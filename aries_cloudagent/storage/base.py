@@ -70,6 +70,49 @@ class BaseStorage(ABC):
 
         """
 
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """Add multiple new records to the store.
+
+        Backends supporting transactions add all of the records atomically.
+
+        Args:
+            records: the `StorageRecord` instances to be stored
+
+        """
+        for record in records:
+            await self.add_record(record)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """Replace the value and tags of multiple existing records.
+
+        Backends supporting transactions update all of the records atomically.
+
+        Args:
+            records: the `StorageRecord` instances holding the new values and tags
+
+        """
+        for record in records:
+            await self.update_record(record, record.value, record.tags)
+
+    async def delete_records(
+        self, records: Sequence[StorageRecord], ignore_missing: bool = False
+    ):
+        """Delete multiple existing records.
+
+        Backends supporting transactions delete all of the records atomically.
+
+        Args:
+            records: the `StorageRecord` instances to delete
+            ignore_missing: skip records which are not found instead of raising
+
+        """
+        for record in records:
+            try:
+                await self.delete_record(record)
+            except StorageNotFoundError:
+                if not ignore_missing:
+                    raise
+
     async def find_record(
         self, type_filter: str, tag_query: Mapping = None, options: Mapping = None
     ) -> StorageRecord:
@@ -98,6 +141,43 @@ class BaseStorage(ABC):
     ):
         """Retrieve all records matching a particular type filter and tag query."""
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query.
+
+        Records are returned in a stable, backend-defined order, so that successive
+        offsets walk the matching records without loading all of them at once.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+            limit: Maximum number of records to return
+            offset: Number of matching records to skip
+        """
+        scan = self.search_records(
+            type_filter, tag_query, options={"retrieveTags": False}
+        )
+        results = []
+        try:
+            while offset > 0:
+                skipped = await scan.fetch(min(offset, DEFAULT_PAGE_SIZE))
+                if not skipped:
+                    return results
+                offset -= len(skipped)
+            while len(results) < limit:
+                rows = await scan.fetch(min(limit - len(results), DEFAULT_PAGE_SIZE))
+                if not rows:
+                    break
+                results.extend(rows)
+        finally:
+            await scan.close()
+        return results
+
     @abstractmethod
     async def delete_all_records(
         self,
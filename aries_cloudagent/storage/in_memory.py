@@ -213,6 +213,10 @@ def tag_query_match(tags: dict, tag_query: dict) -> bool:
                 if not isinstance(v, dict):
                     raise StorageSearchError("Expected dict for $not filter value")
                 chk = not tag_query_match(tags, v)
+            elif k == "$exist":
+                if not isinstance(v, list):
+                    raise StorageSearchError("Expected list for $exist filter value")
+                chk = all(name in tags for name in v)
             elif k[0] == "$":
                 raise StorageSearchError("Unexpected filter operator: {}".format(k))
             elif isinstance(v, str):
@@ -357,6 +357,49 @@ class TestAskarStorage(test_in_memory_storage.TestInMemoryStorage):
         await postgres_wallet.remove()
 
 
+@pytest.mark.askar
+class TestAskarStorageBulk:
+    @pytest.mark.asyncio
+    async def test_add_records_atomic(self, store, record_factory):
+        existing = record_factory()
+        await store.add_record(existing)
+        added = record_factory()
+        with pytest.raises(test_module.StorageDuplicateError):
+            await store.add_records([added, existing])
+        with pytest.raises(test_module.StorageNotFoundError):
+            await store.get_record(added.type, added.id)
+
+    @pytest.mark.asyncio
+    async def test_update_records_atomic(self, store, record_factory, missing):
+        record = record_factory()
+        await store.add_record(record)
+        with pytest.raises(test_module.StorageNotFoundError):
+            await store.update_records([record._replace(value="updated"), missing])
+        assert (await store.get_record(record.type, record.id)).value == "TEST"
+
+    @pytest.mark.asyncio
+    async def test_bulk_in_transaction(self, record_factory):
+        profile = await AskarProfileManager().provision(
+            InjectionContext(),
+            {
+                "name": ":memory:",
+                "key": await AskarProfileManager.generate_store_key(),
+                "key_derivation_method": "RAW",
+            },
+        )
+        records = [record_factory() for _ in range(3)]
+        async with profile.transaction() as txn:
+            await txn.inject(BaseStorage).add_records(records)
+            await txn.rollback()
+        async with profile.transaction() as txn:
+            storage = txn.inject(BaseStorage)
+            assert not await storage.find_all_records("TYPE")
+            await storage.add_records(records)
+            await txn.commit()
+        async with profile.session() as session:
+            assert len(await session.inject(BaseStorage).find_all_records("TYPE")) == 3
+
+
 class TestAskarStorageSearchSession(IsolatedAsyncioTestCase):
     @pytest.mark.asyncio(scope="module")
     async def test_askar_storage_search_session(self):
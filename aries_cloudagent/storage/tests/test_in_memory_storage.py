@@ -96,6 +96,44 @@ class TestInMemoryStorage:
         with pytest.raises(StorageNotFoundError):
             await store.update_record(missing, missing.value, {})
 
+    @pytest.mark.asyncio
+    async def test_bulk_add_update_delete(self, store, record_factory):
+        records = [record_factory({"n": str(i)}) for i in range(5)]
+        await store.add_records(records)
+        for record in records:
+            assert (await store.get_record(record.type, record.id)) == record
+
+        updated = [record._replace(value="updated", tags={}) for record in records]
+        await store.update_records(updated)
+        result = await store.get_record(records[0].type, records[0].id)
+        assert result.value == "updated"
+        assert result.tags == {}
+
+        await store.delete_records(records)
+        assert not await store.find_all_records(records[0].type)
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_duplicate(self, store, record_factory):
+        existing = record_factory()
+        await store.add_record(existing)
+        with pytest.raises(StorageDuplicateError):
+            await store.add_records([record_factory(), existing])
+        with pytest.raises(StorageError):
+            await store.add_records([StorageRecord(type="TYPE", value="")])
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_delete_missing(
+        self, store, record_factory, missing: StorageRecord
+    ):
+        with pytest.raises(StorageNotFoundError):
+            await store.update_records([missing])
+        with pytest.raises(StorageNotFoundError):
+            await store.delete_records([missing])
+        existing = record_factory()
+        await store.add_record(existing)
+        await store.delete_records([missing, existing], ignore_missing=True)
+        assert not await store.find_all_records(existing.type)
+
     @pytest.mark.asyncio
     async def test_find_record(self, store, record_factory):
         record = record_factory()
@@ -133,6 +171,31 @@ class TestInMemoryStorage:
         assert found.value == record.value
         assert found.tags == record.tags
 
+    @pytest.mark.asyncio
+    async def test_find_paginated_records(self, store, record_factory):
+        records = [record_factory({"tag": "one"}) for _ in range(5)]
+        for record in records:
+            await store.add_record(record)
+        await store.add_record(record_factory({"tag": "two"}))
+
+        rows = await store.find_paginated_records(records[0].type, {"tag": "one"})
+        assert {row.id for row in rows} == {record.id for record in records}
+        ordered = [row.id for row in rows]
+
+        rows = await store.find_paginated_records(
+            records[0].type, {"tag": "one"}, limit=2, offset=1
+        )
+        assert [row.id for row in rows] == ordered[1:3]
+
+        rows = await store.find_paginated_records(
+            records[0].type, {"tag": "one"}, limit=10, offset=4
+        )
+        assert [row.id for row in rows] == ordered[4:]
+
+        assert not await store.find_paginated_records(
+            records[0].type, {"tag": "one"}, limit=10, offset=5
+        )
+
     @pytest.mark.asyncio
     async def test_delete_all(self, store, record_factory):
         record = record_factory({"tag": "one"})
@@ -255,6 +318,12 @@ class TestInMemoryTagQuery:
             tag_query_match(TAGS, {"$and": {"z": "-1"}})
         assert "Expected list for $and filter value" in str(excinfo.value)
 
+        assert tag_query_match(TAGS, {"$exist": ["a", "b"]})
+        assert not tag_query_match(TAGS, {"$exist": ["a", "c"]})
+        with pytest.raises(StorageSearchError) as excinfo:
+            tag_query_match(TAGS, {"$exist": "a"})
+        assert "Expected list for $exist filter value" in str(excinfo.value)
+
         with pytest.raises(StorageSearchError) as excinfo:
             tag_query_match(TAGS, {"$near": {"z": "-1"}})
         assert "Unexpected filter operator" in str(excinfo.value)
@@ -5,10 +5,24 @@ been delivered to their intended destination.
 
 """
 
+import asyncio
+import base64
+import json
+import logging
 import time
-
+import uuid
+from collections import Counter, deque
+from typing import Deque, Dict, Iterator, List, Optional, Union
+
+from ...connections.models.connection_target import ConnectionTarget
+from ...core.profile import Profile
+from ...storage.base import BaseStorage
+from ...storage.error import StorageError
+from ...storage.record import StorageRecord
 from ..outbound.message import OutboundMessage
 
+LOGGER = logging.getLogger(__name__)
+
 
 class QueuedMessage:
     """Wrapper Class for queued messages.
@@ -16,13 +30,23 @@ class QueuedMessage:
     Allows tracking Metadata.
     """
 
-    def __init__(self, msg: OutboundMessage):
+    def __init__(
+        self,
+        msg: OutboundMessage,
+        recipient_key: str = None,
+        timestamp: float = None,
+        record_id: str = None,
+    ):
         """Create Wrapper for queued message.
 
         Automatically sets timestamp on create.
         """
         self.msg = msg
-        self.timestamp = time.time()
+        self.recipient_key = recipient_key
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.record_id = record_id
+        self.size = len(msg.enc_payload or msg.payload or "")
+        self.removed = False
 
     def older_than(self, compare_timestamp: float) -> bool:
         """Age Comparison.
@@ -35,20 +59,110 @@ class QueuedMessage:
         return self.timestamp < compare_timestamp
 
 
+def _encode_payload(payload: Union[str, bytes, None]) -> Optional[dict]:
+    if payload is None:
+        return None
+    if isinstance(payload, bytes):
+        return {"b64": base64.b64encode(payload).decode("ascii")}
+    return {"str": payload}
+
+
+def _decode_payload(value: Optional[dict]) -> Union[str, bytes, None]:
+    if value is None:
+        return None
+    if "b64" in value:
+        return base64.b64decode(value["b64"])
+    return value["str"]
+
+
+_TARGET_FIELDS = (
+    "did",
+    "endpoint",
+    "label",
+    "recipient_keys",
+    "routing_keys",
+    "sender_key",
+)
+
+
+def serialize_message(msg: OutboundMessage) -> dict:
+    """Convert an outbound message to a JSON-serializable dict."""
+    return {
+        "connection_id": msg.connection_id,
+        "payload": _encode_payload(msg.payload),
+        "enc_payload": _encode_payload(msg.enc_payload),
+        "reply_thread_id": msg.reply_thread_id,
+        "reply_to_verkey": msg.reply_to_verkey,
+        "reply_from_verkey": msg.reply_from_verkey,
+        # targets are stored as-is: their keys may not pass schema validation
+        "target": (
+            {name: getattr(msg.target, name) for name in _TARGET_FIELDS}
+            if msg.target
+            else None
+        ),
+        "to_session_only": msg.to_session_only,
+    }
+
+
+def deserialize_message(value: dict) -> OutboundMessage:
+    """Restore an outbound message from its serialized dict."""
+    target = value.get("target")
+    return OutboundMessage(
+        connection_id=value.get("connection_id"),
+        payload=_decode_payload(value.get("payload")),
+        enc_payload=_decode_payload(value.get("enc_payload")),
+        reply_thread_id=value.get("reply_thread_id"),
+        reply_to_verkey=value.get("reply_to_verkey"),
+        reply_from_verkey=value.get("reply_from_verkey"),
+        target=ConnectionTarget(**target) if target else None,
+        to_session_only=value.get("to_session_only", False),
+    )
+
+
 class DeliveryQueue:
     """DeliveryQueue class.
 
     Manages undelivered messages.
+
+    Messages are held in arrival order for each recipient key, so they are
+    added and taken in constant time, and expired starting from the oldest.
+    When the count or total size of the messages for a recipient exceeds
+    its limit, the oldest messages for that recipient are dropped.
+
+    When a profile is given, the queue is also written to its storage in the
+    background and restored by `load`, so that messages survive a restart.
     """
 
-    def __init__(self) -> None:
+    RECORD_TYPE = "undelivered_message"
+
+    def __init__(
+        self,
+        profile: Profile = None,
+        *,
+        ttl_seconds: int = None,
+        max_messages: int = None,
+        max_bytes: int = None,
+    ) -> None:
         """Initialize an instance of DeliveryQueue.
 
-        This uses an in memory structure to queue messages.
+        Args:
+            profile: the profile used to persist messages, if any
+            ttl_seconds: the time after which messages expire, by default one week
+            max_messages: the maximum number of messages per recipient key
+            max_bytes: the maximum total payload size per recipient key
+
         """
 
-        self.queue_by_key = {}
-        self.ttl_seconds = 604800  # one week
+        self.profile = profile
+        self.queue_by_key: Dict[str, Deque[QueuedMessage]] = {}
+        self.ttl_seconds = ttl_seconds or 604800  # one week
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self._bytes_by_key: Dict[str, int] = {}
+        self._arrivals: Deque[QueuedMessage] = deque()
+        self._stale = 0
+        self._writes: List[QueuedMessage] = []
+        self._writer: asyncio.Task = None
 
     def expire_messages(self, ttl=None):
         """Expire messages that are past the time limit.
@@ -59,10 +173,57 @@ class DeliveryQueue:
 
         ttl_seconds = ttl or self.ttl_seconds
         horizon = time.time() - ttl_seconds
-        for key in self.queue_by_key.keys():
-            self.queue_by_key[key] = [
-                wm for wm in self.queue_by_key[key] if not wm.older_than(horizon)
-            ]
+        arrivals = self._arrivals
+        while arrivals and arrivals[0].older_than(horizon):
+            wrapped_msg = arrivals.popleft()
+            if wrapped_msg.removed:
+                self._stale -= 1
+            else:
+                # the oldest message for its key is at the front of its queue
+                self._remove(wrapped_msg, first=True, arrived=False)
+
+    def _append(self, wrapped_msg: QueuedMessage):
+        key = wrapped_msg.recipient_key
+        queue = self.queue_by_key.get(key)
+        if queue is None:
+            queue = self.queue_by_key[key] = deque()
+            self._bytes_by_key[key] = 0
+        queue.append(wrapped_msg)
+        self._bytes_by_key[key] += wrapped_msg.size
+        self._arrivals.append(wrapped_msg)
+
+        while len(queue) > 1 and (
+            (self.max_messages and len(queue) > self.max_messages)
+            or (self.max_bytes and self._bytes_by_key[key] > self.max_bytes)
+        ):
+            LOGGER.warning(
+                "Undelivered queue full, dropping oldest message for %s", key
+            )
+            self._remove(queue[0], first=True)
+
+    def _remove(
+        self, wrapped_msg: QueuedMessage, first: bool = False, arrived: bool = True
+    ):
+        key = wrapped_msg.recipient_key
+        queue = self.queue_by_key[key]
+        if first:
+            queue.popleft()
+        else:
+            queue.remove(wrapped_msg)
+        wrapped_msg.removed = True
+        self._bytes_by_key[key] -= wrapped_msg.size
+        if not queue:
+            del self.queue_by_key[key]
+            del self._bytes_by_key[key]
+        if arrived:
+            # drop removed messages from the arrival order once they dominate it
+            self._stale += 1
+            if self._stale > 100 and self._stale * 2 > len(self._arrivals):
+                self._arrivals = deque(
+                    entry for entry in self._arrivals if not entry.removed
+                )
+                self._stale = 0
+        self._persist(wrapped_msg)
 
     def add_message(self, msg: OutboundMessage):
         """Add an OutboundMessage to delivery queue.
@@ -72,16 +233,17 @@ class DeliveryQueue:
         Args:
             msg: The OutboundMessage to add
         """
+        self.expire_messages()
         keys = set()
         if msg.target:
             keys.update(msg.target.recipient_keys)
         if msg.reply_to_verkey:
             keys.add(msg.reply_to_verkey)
-        wrapped_msg = QueuedMessage(msg)
+        timestamp = time.time()
         for recipient_key in keys:
-            if recipient_key not in self.queue_by_key:
-                self.queue_by_key[recipient_key] = []
-            self.queue_by_key[recipient_key].append(wrapped_msg)
+            wrapped_msg = QueuedMessage(msg, recipient_key, timestamp)
+            self._persist(wrapped_msg)
+            self._append(wrapped_msg)
 
     def has_message_for_key(self, key: str):
         """Check for queued messages by key.
@@ -89,6 +251,7 @@ class DeliveryQueue:
         Args:
             key: The key to use for lookup
         """
+        self.expire_messages()
         if key in self.queue_by_key and len(self.queue_by_key[key]):
             return True
         return False
@@ -99,6 +262,7 @@ class DeliveryQueue:
         Args:
             key: The key to use for lookup
         """
+        self.expire_messages()
         if key in self.queue_by_key:
             return len(self.queue_by_key[key])
         else:
@@ -110,17 +274,21 @@ class DeliveryQueue:
         Args:
             key: The key to use for lookup
         """
+        self.expire_messages()
         if key in self.queue_by_key:
-            return self.queue_by_key[key].pop(0).msg
+            wrapped_msg = self.queue_by_key[key][0]
+            self._remove(wrapped_msg, first=True)
+            return wrapped_msg.msg
 
-    def inspect_all_messages_for_key(self, key: str):
+    def inspect_all_messages_for_key(self, key: str) -> Iterator[OutboundMessage]:
         """Return all messages for key.
 
         Args:
             key: The key to use for lookup
         """
+        self.expire_messages()
         if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
+            for wrapped_msg in list(self.queue_by_key[key]):
                 yield wrapped_msg.msg
 
     def remove_message_for_key(self, key: str, msg: OutboundMessage):
@@ -131,9 +299,89 @@ class DeliveryQueue:
             msg: The message to remove from the queue
         """
         if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
+            queue = self.queue_by_key[key]
+            for wrapped_msg in queue:
                 if wrapped_msg.msg == msg:
-                    self.queue_by_key[key].remove(wrapped_msg)
-                    if not self.queue_by_key[key]:
-                        del self.queue_by_key[key]
+                    self._remove(wrapped_msg, first=wrapped_msg is queue[0])
                     break  # exit processing loop
+
+    def _persist(self, wrapped_msg: QueuedMessage):
+        """Schedule the storage of a newly added or removed message."""
+        if not self.profile:
+            return
+        if not wrapped_msg.record_id:
+            wrapped_msg.record_id = uuid.uuid4().hex
+        self._writes.append(wrapped_msg)
+        if not self._writer or self._writer.done():
+            self._writer = asyncio.get_event_loop().create_task(self._write())
+
+    async def _write(self):
+        """Apply the queued additions and removals to storage in order."""
+        while self._writes:
+            writes, self._writes = self._writes, []
+            # a message appears twice if it was also removed since the last write
+            counts = Counter(wrapped_msg.record_id for wrapped_msg in writes)
+            added = []
+            removed = []
+            for wrapped_msg in {id(entry): entry for entry in writes}.values():
+                if not wrapped_msg.removed:
+                    added.append(
+                        StorageRecord(
+                            self.RECORD_TYPE,
+                            json.dumps(
+                                {
+                                    "timestamp": wrapped_msg.timestamp,
+                                    "message": serialize_message(wrapped_msg.msg),
+                                }
+                            ),
+                            {"recipient_key": wrapped_msg.recipient_key},
+                            wrapped_msg.record_id,
+                        )
+                    )
+                elif counts[wrapped_msg.record_id] == 1:
+                    removed.append(
+                        StorageRecord(self.RECORD_TYPE, "", id=wrapped_msg.record_id)
+                    )
+            try:
+                async with self.profile.transaction() as txn:
+                    storage = txn.inject(BaseStorage)
+                    if added:
+                        await storage.add_records(added)
+                    if removed:
+                        # a removal may follow an addition which was never stored
+                        await storage.delete_records(removed, ignore_missing=True)
+                    await txn.commit()
+            except StorageError:
+                LOGGER.exception("Error writing undelivered messages to storage")
+                # retry the batch along with the next change to the queue
+                self._writes = writes + self._writes
+                break
+
+    async def load(self):
+        """Restore the undelivered messages held in storage."""
+        if not self.profile:
+            return
+        async with self.profile.session() as session:
+            records = await session.inject(BaseStorage).find_all_records(
+                self.RECORD_TYPE
+            )
+        entries = []
+        for record in records:
+            value = json.loads(record.value)
+            entries.append(
+                QueuedMessage(
+                    deserialize_message(value["message"]),
+                    record.tags["recipient_key"],
+                    value["timestamp"],
+                    record.id,
+                )
+            )
+        for wrapped_msg in sorted(entries, key=lambda entry: entry.timestamp):
+            self._append(wrapped_msg)
+        self.expire_messages()
+        LOGGER.info("Restored %d undelivered messages", len(self._arrivals))
+
+    async def flush(self):
+        """Wait for pending writes to storage to complete."""
+        if self._writer:
+            await self._writer
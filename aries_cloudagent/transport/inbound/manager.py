@@ -63,8 +63,17 @@ class InboundTransportManager:
             )
 
         # Setup queue for undelivered messages
-        if self.profile.context.settings.get("transport.enable_undelivered_queue"):
-            self.undelivered_queue = DeliveryQueue()
+        settings = self.profile.context.settings
+        if settings.get("transport.enable_undelivered_queue"):
+            persist = settings.get("transport.undelivered_queue_persist")
+            self.undelivered_queue = DeliveryQueue(
+                self.profile if persist else None,
+                max_messages=settings.get_int(
+                    "transport.undelivered_queue_max_messages"
+                ),
+                max_bytes=settings.get_int("transport.undelivered_queue_max_bytes"),
+            )
+            await self.undelivered_queue.load()
 
     def register(self, config: InboundTransportConfiguration) -> str:
         """Register transport module.
@@ -136,6 +145,8 @@ class InboundTransportManager:
         await self.task_queue.complete(None if wait else 0)
         for transport in self.running_transports.values():
             await transport.stop()
+        if self.undelivered_queue:
+            await self.undelivered_queue.flush()
 
     async def create_session(
         self,
@@ -164,6 +175,9 @@ class InboundTransportManager:
             client_info=client_info,
             close_handler=self.closed_session,
             inbound_handler=self.receive_inbound,
+            response_cleared_handler=(
+                self.process_undelivered if accept_undelivered else None
+            ),
             session_id=str(uuid.uuid4()),
             transport_type=transport_type,
             wire_format=wire_format,
@@ -234,10 +248,15 @@ class InboundTransportManager:
                 for (
                     undelivered_message
                 ) in self.undelivered_queue.inspect_all_messages_for_key(key):
-                    if session.accept_response(undelivered_message):
+                    result = session.accept_response(undelivered_message)
+                    if result:
                         LOGGER.debug(
                             "Sending previously undelivered message via inbound session"
                         )
                         self.undelivered_queue.remove_message_for_key(
                             key, undelivered_message
                         )
+                    if result or result.retry:
+                        # the session holds one message at a time: the next is
+                        # taken once this one is delivered
+                        return
@@ -27,6 +27,7 @@ class MessageReceipt:
         sender_verkey: str = None,
         thread_id: str = None,
         parent_thread_id: str = None,
+        raw_forward: str = None,
     ):
         """Initialize the message delivery instance."""
         self._connection_id = connection_id
@@ -40,6 +41,7 @@ class MessageReceipt:
         self._sender_verkey = sender_verkey
         self._thread_id = thread_id
         self._parent_thread_id = parent_thread_id
+        self._raw_forward = raw_forward
 
     @property
     def connection_id(self) -> str:
@@ -269,6 +271,26 @@ class MessageReceipt:
         """
         self._parent_thread_id = thread
 
+    @property
+    def raw_forward(self) -> Optional[str]:
+        """Accessor for the original text of the message carried by a forward.
+
+        Returns:
+            The forwarded message text, if the message is a forward
+
+        """
+        return self._raw_forward
+
+    @raw_forward.setter
+    def raw_forward(self, message: Optional[str]):
+        """Setter for the original text of the message carried by a forward.
+
+        Args:
+            message: The new forwarded message text
+
+        """
+        self._raw_forward = message
+
     def __repr__(self) -> str:
         """Provide a human readable representation of this object.
 
@@ -49,6 +49,7 @@ class InboundSession:
         reply_mode: str = None,
         reply_thread_ids: Sequence[str] = None,
         reply_verkeys: Sequence[str] = None,
+        response_cleared_handler: Callable = None,
         transport_type: str = None,
     ):
         """Initialize the inbound session."""
@@ -61,6 +62,7 @@ class InboundSession:
         self.client_info = client_info
         self.close_handler = close_handler
         self.response_buffer: OutboundMessage = None
+        self.response_cleared_handler = response_cleared_handler
         self.response_event = asyncio.Event()
         self.transport_type = transport_type
 
@@ -289,6 +291,9 @@ class InboundSession:
         """Handle when the buffered response message has been delivered."""
         self.response_buffer = None
         self.response_event.set()
+        if self.response_cleared_handler:
+            # allow the next pending message to be buffered
+            self.response_cleared_handler(self)
 
     async def wait_response(self) -> Union[str, bytes]:
         """Wait for a response to be buffered and pack it."""
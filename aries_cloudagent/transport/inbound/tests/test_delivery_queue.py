@@ -1,6 +1,11 @@
 from unittest import IsolatedAsyncioTestCase
 
 from ....connections.models.connection_target import ConnectionTarget
+from ....core.in_memory import InMemoryProfile
+from ....storage.base import BaseStorage
+from ....storage.error import StorageError
+from ....storage.in_memory import InMemoryStorage
+from ....tests import mock
 from ....transport.outbound.message import OutboundMessage
 
 from ..delivery_queue import DeliveryQueue
@@ -60,3 +65,92 @@ class TestDeliveryQueue(IsolatedAsyncioTestCase):
     async def test_count_zero_with_no_items(self):
         queue = DeliveryQueue()
         assert queue.message_count_for_key("aaa") == 0
+
+    async def test_message_limits(self):
+        queue = DeliveryQueue(max_messages=2, max_bytes=10)
+
+        t = ConnectionTarget(recipient_keys=["aaa"])
+        msgs = [OutboundMessage(payload=f"msg{i}", target=t) for i in range(3)]
+        for msg in msgs:
+            queue.add_message(msg)
+        assert list(queue.inspect_all_messages_for_key("aaa")) == msgs[1:]
+
+        large = OutboundMessage(payload="x" * 8, target=t)
+        queue.add_message(large)
+        assert list(queue.inspect_all_messages_for_key("aaa")) == [large]
+
+    async def test_message_ttl_removed(self):
+        queue = DeliveryQueue()
+
+        t = ConnectionTarget(recipient_keys=["aaa", "bbb"])
+        first = OutboundMessage(payload="x", target=t)
+        second = OutboundMessage(payload="y", reply_to_verkey="aaa")
+        queue.add_message(first)
+        queue.add_message(second)
+        assert queue.get_one_message_for_key("aaa") == first
+        assert queue.message_count_for_key("aaa") == 1
+        queue.expire_messages(ttl=-10)
+        assert not queue.queue_by_key
+        assert not queue._arrivals
+
+    async def test_persist_load(self):
+        profile = InMemoryProfile.test_profile()
+        queue = DeliveryQueue(profile)
+
+        t = ConnectionTarget(
+            endpoint="http://localhost", recipient_keys=["aaa"], routing_keys=["ccc"]
+        )
+        kept = OutboundMessage(payload="x", target=t, reply_to_verkey="bbb")
+        packed = OutboundMessage(
+            payload=None, enc_payload=b"\x00packed", reply_to_verkey="aaa"
+        )
+        removed = OutboundMessage(payload="y", reply_to_verkey="bbb")
+        queue.add_message(kept)
+        queue.add_message(packed)
+        queue.add_message(removed)
+        # removed within the same write as it was added
+        queue.remove_message_for_key("bbb", removed)
+        await queue.flush()
+        assert queue.get_one_message_for_key("aaa") == kept
+        await queue.flush()
+
+        restored = DeliveryQueue(profile)
+        await restored.load()
+        assert restored.message_count_for_key("aaa") == 1
+        assert restored.get_one_message_for_key("aaa").enc_payload == b"\x00packed"
+        (message,) = restored.inspect_all_messages_for_key("bbb")
+        assert message.payload == "x"
+        assert message.target.endpoint == "http://localhost"
+        assert message.target.routing_keys == ["ccc"]
+        await restored.flush()
+
+        async with profile.session() as session:
+            records = await session.inject(BaseStorage).find_all_records(
+                DeliveryQueue.RECORD_TYPE
+            )
+        assert [record.tags["recipient_key"] for record in records] == ["bbb"]
+
+    async def test_persist_retry(self):
+        profile = InMemoryProfile.test_profile()
+        queue = DeliveryQueue(profile)
+        kept = OutboundMessage(payload="x", reply_to_verkey="aaa")
+        removed = OutboundMessage(payload="y", reply_to_verkey="aaa")
+
+        with mock.patch.object(
+            InMemoryStorage,
+            "add_records",
+            mock.CoroutineMock(side_effect=StorageError()),
+        ):
+            queue.add_message(kept)
+            queue.add_message(removed)
+            await queue.flush()
+        # the failed batch is written along with the next change
+        queue.remove_message_for_key("aaa", removed)
+        await queue.flush()
+
+        async with profile.session() as session:
+            records = await session.inject(BaseStorage).find_all_records(
+                DeliveryQueue.RECORD_TYPE
+            )
+        assert len(records) == 1
+        assert queue.message_count_for_key("aaa") == 1
@@ -8,6 +8,7 @@ from ...outbound.message import OutboundMessage
 from ...wire_format import BaseWireFormat
 from ..base import InboundTransportConfiguration, InboundTransportRegistrationError
 from ..manager import InboundTransportManager
+from ..receipt import MessageReceipt
 
 
 class TestInboundTransportManager(IsolatedAsyncioTestCase):
@@ -187,6 +188,52 @@ class TestInboundTransportManager(IsolatedAsyncioTestCase):
             mock_accept.assert_called_once_with(test_outbound)
         assert not mgr.undelivered_queue.has_message_for_key(test_verkey)
 
+    async def test_process_undelivered_in_turn(self):
+        self.profile.context.update_settings(
+            {
+                "transport.enable_undelivered_queue": True,
+                "transport.undelivered_queue_persist": True,
+                "transport.undelivered_queue_max_messages": 5,
+            }
+        )
+        test_verkey = "test-verkey"
+        mgr = InboundTransportManager(self.profile, None)
+        await mgr.setup()
+        assert mgr.undelivered_queue.profile is self.profile
+        assert mgr.undelivered_queue.max_messages == 5
+
+        outbound = [
+            OutboundMessage(payload=f"{i}", reply_to_verkey=test_verkey)
+            for i in range(3)
+        ]
+        for msg in outbound:
+            mgr.return_undelivered(msg)
+
+        session = await mgr.create_session(
+            "ws",
+            accept_undelivered=True,
+            can_respond=True,
+            wire_format=mock.MagicMock(),
+        )
+        session.add_reply_verkeys(test_verkey)
+        session.reply_mode = MessageReceipt.REPLY_MODE_ALL
+        mgr.process_undelivered(session)
+        assert session.response_buffer is outbound[0]
+        assert mgr.undelivered_queue.message_count_for_key(test_verkey) == 2
+
+        # delivering the buffered response takes up the next message
+        session.clear_response()
+        assert session.response_buffer is outbound[1]
+        session.clear_response()
+        session.clear_response()
+        assert session.response_buffer is None
+        assert not mgr.undelivered_queue.has_message_for_key(test_verkey)
+
+        await mgr.stop()
+        restored = InboundTransportManager(self.profile, None)
+        await restored.setup()
+        assert not restored.undelivered_queue.has_message_for_key(test_verkey)
+
     async def test_return_undelivered_false(self):
         self.profile.context.update_settings(
             {"transport.enable_undelivered_queue": False}
@@ -43,6 +43,8 @@ class QueuedOutboundMessage:
         self.transport_id: str = transport_id
         self.metadata: dict = None
         self.api_key: str = None
+        self.queue_id: str = None
+        self.store_task: asyncio.Task = None
 
 
 class BaseOutboundTransport(ABC):
@@ -1,9 +1,14 @@
 """Http outbound transport."""
 
+import asyncio
 import logging
-from typing import Union
+import time
+from contextlib import asynccontextmanager
+from fnmatch import fnmatchcase
+from typing import Dict, List, Mapping, Union
+from urllib.parse import urlsplit
 
-from aiohttp import ClientSession, DummyCookieJar, TCPConnector
+from aiohttp import ClientError, ClientSession, DummyCookieJar, TCPConnector
 
 from ...core.profile import Profile
 
@@ -12,6 +17,137 @@ from ..wire_format import DIDCOMM_V0_MIME_TYPE, DIDCOMM_V1_MIME_TYPE
 
 from .base import BaseOutboundTransport, OutboundTransportError
 
+LOGGER = logging.getLogger(__name__)
+
+
+class CircuitOpenError(OutboundTransportError):
+    """Delivery was not attempted because the endpoint host is failing."""
+
+
+class HttpStatusError(OutboundTransportError):
+    """The endpoint returned an unsuccessful response status."""
+
+    def __init__(self, status: int, reason: str):
+        """Initialize an `HttpStatusError` instance."""
+        super().__init__(f"Unexpected response status {status}, caused by: {reason}")
+        self.status = status
+
+
+class HostCircuit:
+    """Circuit breaker state for a single host."""
+
+    __slots__ = ("failures", "open_until", "cooldown", "probing")
+
+    def __init__(self):
+        """Initialize a closed circuit."""
+        self.failures = 0
+        self.open_until: float = None
+        self.cooldown: float = None
+        self.probing = False
+
+
+class HostCircuitBreaker:
+    """Track consecutive delivery failures per host and stop sending to failing hosts.
+
+    After `threshold` consecutive failures the circuit for a host opens, and
+    deliveries fail immediately until the cooldown has passed. A single trial
+    delivery is then allowed: success closes the circuit, while failure opens
+    it again with the cooldown doubled, up to `max_cooldown`.
+    """
+
+    def __init__(self, threshold: int, cooldown: float, max_cooldown: float = None):
+        """Initialize a `HostCircuitBreaker` instance."""
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown or cooldown * 10
+        self._hosts: Dict[str, HostCircuit] = {}
+
+    def check(self, host: str):
+        """Check that a delivery to a host may be attempted.
+
+        Raises:
+            CircuitOpenError: if the circuit for the host is open
+
+        """
+        circuit = self._hosts.get(host)
+        if not circuit or circuit.open_until is None:
+            return
+        if circuit.probing or time.monotonic() < circuit.open_until:
+            raise CircuitOpenError(f"Circuit open for failing endpoint host: {host}")
+        circuit.probing = True
+
+    def release(self, host: str):
+        """Allow another trial delivery to a host after an unrecorded attempt."""
+        circuit = self._hosts.get(host)
+        if circuit:
+            circuit.probing = False
+
+    def success(self, host: str):
+        """Record a successful delivery to a host."""
+        self._hosts.pop(host, None)
+
+    def failure(self, host: str):
+        """Record a failed delivery to a host."""
+        circuit = self._hosts.setdefault(host, HostCircuit())
+        circuit.failures += 1
+        circuit.probing = False
+        if circuit.failures >= self.threshold:
+            circuit.cooldown = (
+                self.cooldown
+                if circuit.cooldown is None
+                else min(circuit.cooldown * 2, self.max_cooldown)
+            )
+            circuit.open_until = time.monotonic() + circuit.cooldown
+            LOGGER.warning(
+                "Circuit opened for endpoint host %s for %.1fs after %d failures",
+                host,
+                circuit.cooldown,
+                circuit.failures,
+            )
+
+
+class HostLimiter:
+    """Limit concurrent requests per host, with limits chosen by host pattern."""
+
+    def __init__(self, default_limit: int, limits: Mapping[str, int]):
+        """Initialize a `HostLimiter` instance.
+
+        Args:
+            default_limit: the limit for hosts matching no pattern, or 0 for none
+            limits: a mapping of host patterns, as in `*.example.com`, to limits
+
+        """
+        self.default_limit = default_limit
+        self.limits = dict(limits)
+        # looks like { host: [semaphore, users] }
+        self._hosts: Dict[str, List] = {}
+
+    def limit_for(self, hostname: str) -> int:
+        """Find the request limit for a host name."""
+        for pattern, limit in self.limits.items():
+            if fnmatchcase(hostname, pattern):
+                return limit
+        return self.default_limit
+
+    @asynccontextmanager
+    async def acquire(self, host: str, hostname: str):
+        """Hold a request slot for a host while the context is active."""
+        entry = self._hosts.get(host)
+        if not entry:
+            limit = self.limit_for(hostname)
+            if not limit:
+                yield
+                return
+            entry = self._hosts[host] = [asyncio.Semaphore(limit), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._hosts[host]
+
 
 class HttpTransport(BaseOutboundTransport):
     """Http outbound transport class."""
@@ -19,16 +155,37 @@ class HttpTransport(BaseOutboundTransport):
     schemes = ("http", "https")
     is_external = False
 
+    DEFAULT_POOL_LIMIT = 200
+    DEFAULT_POOL_LIMIT_PER_HOST = 50
+
     def __init__(self, **kwargs) -> None:
         """Initialize an `HttpTransport` instance."""
         super().__init__(**kwargs)
         self.client_session: ClientSession = None
         self.connector: TCPConnector = None
+        self.circuit_breaker: HostCircuitBreaker = None
+        self.host_limiter: HostLimiter = None
         self.logger = logging.getLogger(__name__)
 
     async def start(self):
         """Start the transport."""
-        self.connector = TCPConnector(limit=200, limit_per_host=50)
+        settings = self.root_profile.settings if self.root_profile else {}
+        limit = settings.get("transport.http_pool_limit")
+        limit_per_host = settings.get("transport.http_pool_limit_per_host")
+        limit = self.DEFAULT_POOL_LIMIT if limit is None else limit
+        if limit_per_host is None:
+            limit_per_host = self.DEFAULT_POOL_LIMIT_PER_HOST
+        host_limits = settings.get("transport.http_host_limits")
+        if host_limits:
+            # per-host limits are applied by host pattern, not by the connector
+            self.host_limiter = HostLimiter(limit_per_host, host_limits)
+            limit_per_host = 0
+        self.connector = TCPConnector(limit=limit, limit_per_host=limit_per_host)
+        threshold = settings.get("transport.http_breaker_threshold")
+        if threshold:
+            self.circuit_breaker = HostCircuitBreaker(
+                threshold, settings.get("transport.http_breaker_cooldown") or 30
+            )
         session_args = {
             "cookie_jar": DummyCookieJar(),
             "connector": self.connector,
@@ -77,13 +234,43 @@ class HttpTransport(BaseOutboundTransport):
         self.logger.debug(
             "Posting to %s; Data: %s; Headers: %s", endpoint, payload, headers
         )
+        if not (self.circuit_breaker or self.host_limiter):
+            await self._post(payload, endpoint, headers)
+            return
+
+        parts = urlsplit(endpoint)
+        host = f"{parts.scheme}://{parts.netloc}"
+        if self.circuit_breaker:
+            self.circuit_breaker.check(host)
+        try:
+            if self.host_limiter:
+                async with self.host_limiter.acquire(host, parts.hostname or ""):
+                    await self._post(payload, endpoint, headers)
+            else:
+                await self._post(payload, endpoint, headers)
+        except (ClientError, OSError, asyncio.TimeoutError):
+            if self.circuit_breaker:
+                self.circuit_breaker.failure(host)
+            raise
+        except HttpStatusError as err:
+            if self.circuit_breaker:
+                if err.status >= 500:
+                    self.circuit_breaker.failure(host)
+                else:
+                    self.circuit_breaker.success(host)
+            raise
+        finally:
+            # the trial delivery may end without a result being recorded,
+            # for instance when cancelled
+            if self.circuit_breaker:
+                self.circuit_breaker.release(host)
+        if self.circuit_breaker:
+            self.circuit_breaker.success(host)
+
+    async def _post(self, payload: Union[str, bytes], endpoint: str, headers: dict):
+        """Post the payload, raising an error for an unsuccessful response."""
         async with self.client_session.post(
             endpoint, data=payload, headers=headers
         ) as response:
             if response.status < 200 or response.status > 299:
-                raise OutboundTransportError(
-                    (
-                        f"Unexpected response status {response.status}, "
-                        f"caused by: {response.reason}"
-                    )
-                )
+                raise HttpStatusError(response.status, response.reason)
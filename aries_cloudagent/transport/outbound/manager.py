@@ -1,15 +1,19 @@
 """Outbound transport manager."""
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
 import time
 
-from typing import Callable, Type
+from collections import deque
+from typing import Callable, Deque, Dict, List, Set, Tuple, Type
 from urllib.parse import urlparse
 
 from ...connections.models.connection_target import ConnectionTarget
 from ...core.profile import Profile
+from ...storage.error import StorageError
 from ...utils.classloader import ClassLoader, ModuleLoadError, ClassNotFoundError
 from ...utils.stats import Collector
 from ...utils.task_queue import CompletedTask, TaskQueue, task_exc_info
@@ -25,6 +29,8 @@ from .base import (
     QueuedOutboundMessage,
 )
 from .message import OutboundMessage
+from .queue_store import BaseOutboundQueueStore, StorageOutboundQueueStore
+from .webhook_batcher import WebhookBatcher
 
 LOGGER = logging.getLogger(__name__)
 MODULE_BASE_PATH = "aries_cloudagent.transport.outbound"
@@ -46,9 +52,14 @@ class OutboundTransportManager:
         self.root_profile = profile
         self.loop = asyncio.get_event_loop()
         self.handle_not_delivered = handle_not_delivered
-        self.outbound_buffer = []
         self.outbound_event = asyncio.Event()
         self.outbound_new = []
+        self.outbound_pending: Deque[QueuedOutboundMessage] = deque()
+        self.outbound_active: Set[QueuedOutboundMessage] = set()
+        self.outbound_retry: List[Tuple[float, int, QueuedOutboundMessage]] = []
+        self._retry_seq = itertools.count()
+        self._endpoint_active: Dict[str, int] = {}
+        self._endpoint_waiting: Dict[str, Deque[QueuedOutboundMessage]] = {}
         self.registered_schemes = {}
         self.registered_transports = {}
         self.running_transports = {}
@@ -58,6 +69,25 @@ class OutboundTransportManager:
             self.MAX_RETRY_COUNT = self.root_profile.settings[
                 "transport.max_outbound_retry"
             ]
+        self.max_per_endpoint = self.root_profile.settings.get_int(
+            "transport.max_outbound_per_endpoint"
+        )
+        self.queue_store = self.root_profile.inject_or(BaseOutboundQueueStore)
+        if not self.queue_store and self.root_profile.settings.get(
+            "transport.persist_outbound_queue"
+        ):
+            self.queue_store = StorageOutboundQueueStore(self.root_profile)
+        self.webhook_batcher = None
+        batch_size = self.root_profile.settings.get_int("admin.webhook_batch_size")
+        if batch_size:
+            linger = self.root_profile.settings.get_int("admin.webhook_batch_linger")
+            self.webhook_batcher = WebhookBatcher(
+                self.get_transport_for_endpoint,
+                batch_size,
+                linger=(100 if linger is None else linger) / 1000,
+                spool_dir=self.root_profile.settings.get("admin.webhook_spool_dir"),
+                max_attempts=self.MAX_RETRY_COUNT + 1,
+            )
 
     async def setup(self):
         """Perform setup operations."""
@@ -151,13 +181,58 @@ class OutboundTransportManager:
 
     async def start(self):
         """Start all transports and feed messages from the queue."""
-        for transport_id in self.registered_transports:
+        started = [
             self.task_queue.run(self.start_transport(transport_id))
+            for transport_id in self.registered_transports
+        ]
+        if self.queue_store:
+            self.task_queue.run(self.restore_queued(started))
+        if self.webhook_batcher:
+            self.task_queue.run(self.restore_webhooks(started))
+
+    async def restore_webhooks(self, started: List[asyncio.Task] = None):
+        """Resume delivery of spooled webhook batches.
+
+        Args:
+            started: Transport start tasks to wait for before resuming
+        """
+        if started:
+            await asyncio.wait(started)
+        await self.webhook_batcher.restore()
+
+    async def restore_queued(self, started: List[asyncio.Task] = None):
+        """Re-queue the messages left undelivered by a previous run.
+
+        Args:
+            started: Transport start tasks to wait for before re-queueing
+        """
+        if started:
+            await asyncio.wait(started)
+        restored = await self.queue_store.load(self.root_profile)
+        for queued in restored:
+            try:
+                queued.transport_id = self.get_running_transport_for_endpoint(
+                    queued.endpoint
+                )
+            except OutboundDeliveryError as err:
+                LOGGER.warning(
+                    "Discarding stored outbound message for %s: %s",
+                    queued.endpoint,
+                    err,
+                )
+                await self.queue_store.remove(queued)
+                continue
+            self.outbound_new.append(queued)
+        if restored:
+            LOGGER.info("Restored %d queued outbound message(s)", len(restored))
+            self.process_queued()
 
     async def stop(self, wait: bool = True):
         """Stop all running transports."""
         if self._process_task and not self._process_task.done():
             self._process_task.cancel()
+        if self.webhook_batcher:
+            await self.webhook_batcher.stop()
         await self.task_queue.complete(None if wait else 0)
         for transport in self.running_transports.values():
             await transport.stop()
@@ -217,6 +292,12 @@ class OutboundTransportManager:
         """Get an instance of a running transport by ID."""
         return self.running_transports[transport_id]
 
+    def get_transport_for_endpoint(self, endpoint: str) -> BaseOutboundTransport:
+        """Get the running transport instance to use for a given endpoint."""
+        return self.get_transport_instance(
+            self.get_running_transport_for_endpoint(endpoint)
+        )
+
     async def enqueue_message(self, profile: Profile, outbound: OutboundMessage):
         """Add an outbound message to the queue.
 
@@ -249,6 +330,10 @@ class OutboundTransportManager:
         else:
             queued = QueuedOutboundMessage(profile, outbound, target, transport_id)
             queued.retries = self.MAX_RETRY_COUNT
+            if self.queue_store and outbound.enc_payload:
+                queued.payload = outbound.enc_payload
+                queued.state = QueuedOutboundMessage.STATE_PENDING
+                await self.store_queued(queued)
             self.outbound_new.append(queued)
             self.process_queued()
 
@@ -282,6 +367,9 @@ class OutboundTransportManager:
     ):
         """Add a webhook to the queue.
 
+        When webhook batching is enabled, the webhook is instead added to the
+        next batch for the endpoint, and `max_attempts` is not applied.
+
         Args:
             topic: The webhook topic
             payload: The webhook payload
@@ -293,6 +381,12 @@ class OutboundTransportManager:
             OutboundDeliveryError: if the associated transport is not running
 
         """
+        if self.webhook_batcher:
+            endpoint, _, api_key = endpoint.partition("#")
+            self.webhook_batcher.add(
+                topic, payload, endpoint, api_key or None, metadata
+            )
+            return
         transport_id = self.get_running_transport_for_endpoint(endpoint)
         queued = QueuedOutboundMessage(None, None, None, transport_id)
         if len(endpoint.split("#")) > 1:
@@ -305,6 +399,23 @@ class OutboundTransportManager:
         queued.payload = json.dumps(payload)
         queued.state = QueuedOutboundMessage.STATE_PENDING
         queued.retries = 4 if max_attempts is None else max_attempts - 1
+        if self.queue_store:
+            self.task_queue.run(self._store_and_queue(queued))
+        else:
+            self.outbound_new.append(queued)
+            self.process_queued()
+
+    async def store_queued(self, queued: QueuedOutboundMessage):
+        """Add an encoded message to the outbound queue store, if enabled."""
+        if self.queue_store and not queued.queue_id:
+            try:
+                await self.queue_store.save(queued)
+            except StorageError:
+                LOGGER.exception("Error storing outbound message, delivering anyway")
+
+    async def _store_and_queue(self, queued: QueuedOutboundMessage):
+        """Store a pending message before adding it to the queue."""
+        await self.store_queued(queued)
         self.outbound_new.append(queued)
         self.process_queued()
 
@@ -316,7 +427,12 @@ class OutboundTransportManager:
         """
         if self._process_task and not self._process_task.done():
             self.outbound_event.set()
-        elif self.outbound_new or self.outbound_buffer:
+        elif (
+            self.outbound_new
+            or self.outbound_pending
+            or self.outbound_active
+            or self.outbound_retry
+        ):
             self._process_task = self.loop.create_task(self._process_loop())
             self._process_task.add_done_callback(lambda task: self._process_done(task))
         return self._process_task
@@ -336,55 +452,20 @@ class OutboundTransportManager:
         # Note: this method should not call async methods apart from
         # waiting for the updated event, to avoid yielding to other queue methods
 
+        # Messages move between the new list, the pending queue, the active set
+        # (encoding or delivering) and the retry schedule; each pass only visits
+        # the messages which have changed state since the last pass.
         while True:
             self.outbound_event.clear()
             loop_time = get_timer()
-            upd_buffer = []
-            retry_count = 0
-
-            for queued in self.outbound_buffer:
-                if queued.state == QueuedOutboundMessage.STATE_DONE:
-                    if queued.error:
-                        LOGGER.exception(
-                            "Outbound message could not be delivered to %s",
-                            queued.endpoint,
-                            exc_info=queued.error,
-                        )
-                        if self.handle_not_delivered and queued.message:
-                            self.handle_not_delivered(queued.profile, queued.message)
-                    continue  # remove from buffer
 
-                deliver = False
+            # retries are ordered by due time: only the due entries are visited
+            while self.outbound_retry and self.outbound_retry[0][0] < loop_time:
+                queued = heapq.heappop(self.outbound_retry)[2]
+                queued.retry_at = None
+                queued.state = QueuedOutboundMessage.STATE_PENDING
+                self.outbound_pending.append(queued)
 
-                if queued.state == QueuedOutboundMessage.STATE_PENDING:
-                    deliver = True
-                elif queued.state == QueuedOutboundMessage.STATE_RETRY:
-                    if queued.retry_at < loop_time:
-                        queued.retry_at = None
-                        deliver = True
-                    else:
-                        retry_count += 1
-
-                if deliver:
-                    queued.state = QueuedOutboundMessage.STATE_DELIVER
-                    p_time = trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.START."
-                        + queued.endpoint,
-                    )
-                    self.deliver_queued_message(queued)
-                    trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.END."
-                        + queued.endpoint,
-                        perf_counter=p_time,
-                    )
-
-                upd_buffer.append(queued)
-
-            new_pending = 0
             new_messages = self.outbound_new
             self.outbound_new = []
 
@@ -393,9 +474,10 @@ class OutboundTransportManager:
                     if queued.message and queued.message.enc_payload:
                         queued.payload = queued.message.enc_payload
                         queued.state = QueuedOutboundMessage.STATE_PENDING
-                        new_pending += 1
+                        self.outbound_pending.append(queued)
                     else:
                         queued.state = QueuedOutboundMessage.STATE_ENCODE
+                        self.outbound_active.add(queued)
                         p_time = trace_event(
                             self.root_profile.settings,
                             queued.message if queued.message else queued.payload,
@@ -408,20 +490,95 @@ class OutboundTransportManager:
                             outcome="OutboundTransportManager.ENCODE.END",
                             perf_counter=p_time,
                         )
+                elif queued.state == QueuedOutboundMessage.STATE_RETRY:
+                    self.schedule_retry(queued)
+                elif queued.state == QueuedOutboundMessage.STATE_DONE:
+                    self._handle_done(queued)
                 else:
-                    new_pending += 1
+                    self.outbound_pending.append(queued)
+
+            while self.outbound_pending:
+                queued = self.outbound_pending.popleft()
+                if self._acquire_endpoint(queued):
+                    self._start_delivery(queued)
+
+            if self.outbound_active or self.outbound_retry:
+                # sleep until notified, or until the next retry is due
+                timeout = None
+                if self.outbound_retry:
+                    timeout = max(self.outbound_retry[0][0] - get_timer(), 0)
+                try:
+                    await asyncio.wait_for(self.outbound_event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            elif not self.outbound_new:
+                break
 
-                upd_buffer.append(queued)
+    def schedule_retry(self, queued: QueuedOutboundMessage):
+        """Add a message awaiting retry to the retry schedule."""
+        if queued.retry_at is None:
+            queued.retry_at = get_timer()
+        heapq.heappush(
+            self.outbound_retry, (queued.retry_at, next(self._retry_seq), queued)
+        )
 
-            self.outbound_buffer = upd_buffer
-            if self.outbound_buffer:
-                if (not new_pending) and (not retry_count):
-                    await self.outbound_event.wait()
-                elif retry_count:
-                    # only retries - yield here so we don't hog resources
-                    await asyncio.sleep(0.05)
-            else:
-                break
+    def _acquire_endpoint(self, queued: QueuedOutboundMessage) -> bool:
+        """Reserve a delivery slot for the message endpoint, if limited.
+
+        Returns:
+            False if the message has been held until a delivery to the same
+            endpoint completes
+
+        """
+        if not self.max_per_endpoint:
+            return True
+        active = self._endpoint_active.get(queued.endpoint, 0)
+        if active >= self.max_per_endpoint:
+            self._endpoint_waiting.setdefault(queued.endpoint, deque()).append(queued)
+            return False
+        self._endpoint_active[queued.endpoint] = active + 1
+        return True
+
+    def _release_endpoint(self, queued: QueuedOutboundMessage):
+        """Release the delivery slot for the message endpoint, if limited."""
+        if not self.max_per_endpoint:
+            return
+        active = self._endpoint_active.pop(queued.endpoint, 0) - 1
+        if active > 0:
+            self._endpoint_active[queued.endpoint] = active
+        waiting = self._endpoint_waiting.get(queued.endpoint)
+        if waiting:
+            self.outbound_pending.append(waiting.popleft())
+            if not waiting:
+                del self._endpoint_waiting[queued.endpoint]
+
+    def _handle_done(self, queued: QueuedOutboundMessage):
+        """Report a message which has finished processing."""
+        if queued.error:
+            LOGGER.exception(
+                "Outbound message could not be delivered to %s",
+                queued.endpoint,
+                exc_info=queued.error,
+            )
+            if self.handle_not_delivered and queued.message:
+                self.handle_not_delivered(queued.profile, queued.message)
+
+    def _start_delivery(self, queued: QueuedOutboundMessage):
+        """Move a message to the delivery state and kick off delivery."""
+        queued.state = QueuedOutboundMessage.STATE_DELIVER
+        self.outbound_active.add(queued)
+        p_time = trace_event(
+            self.root_profile.settings,
+            queued.message if queued.message else queued.payload,
+            outcome="OutboundTransportManager.DELIVER.START." + queued.endpoint,
+        )
+        self.deliver_queued_message(queued)
+        trace_event(
+            self.root_profile.settings,
+            queued.message if queued.message else queued.payload,
+            outcome="OutboundTransportManager.DELIVER.END." + queued.endpoint,
+            perf_counter=p_time,
+        )
 
     def encode_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
         """Kick off encoding of a queued message."""
@@ -429,11 +586,18 @@ class OutboundTransportManager:
         transport = self.get_transport_instance(queued.transport_id)
 
         queued.task = self.task_queue.run(
-            self.perform_encode(queued, transport.wire_format),
+            self._encode_and_store(queued, transport.wire_format),
             lambda completed: self.finished_encode(queued, completed),
         )
         return queued.task
 
+    async def _encode_and_store(
+        self, queued: QueuedOutboundMessage, wire_format: BaseWireFormat = None
+    ):
+        """Encode a queued message and store it before it becomes pending."""
+        await self.perform_encode(queued, wire_format)
+        await self.store_queued(queued)
+
     async def perform_encode(
         self, queued: QueuedOutboundMessage, wire_format: BaseWireFormat = None
     ):
@@ -451,11 +615,14 @@ class OutboundTransportManager:
 
     def finished_encode(self, queued: QueuedOutboundMessage, completed: CompletedTask):
         """Handle completion of queued message encoding."""
+        self.outbound_active.discard(queued)
         if completed.exc_info:
             queued.error = completed.exc_info
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self._handle_done(queued)
         else:
             queued.state = QueuedOutboundMessage.STATE_PENDING
+            self.outbound_pending.append(queued)
         queued.task = None
         self.process_queued()
 
@@ -474,8 +641,40 @@ class OutboundTransportManager:
         )
         return queued.task
 
+    def _update_stored(self, queued: QueuedOutboundMessage):
+        """Record a change in delivery state in the outbound queue store.
+
+        The updates for a message are applied in the order they are made, so a
+        message which is done cannot be stored again by an earlier update.
+        """
+        if not (self.queue_store and queued.queue_id):
+            return
+        queued.store_task = self.task_queue.run(
+            self._apply_stored(
+                queued,
+                queued.state == QueuedOutboundMessage.STATE_DONE,
+                queued.store_task,
+            )
+        )
+
+    async def _apply_stored(
+        self,
+        queued: QueuedOutboundMessage,
+        remove: bool,
+        previous: asyncio.Task = None,
+    ):
+        """Apply an update to the outbound queue store after the previous one."""
+        if previous and not previous.done():
+            await asyncio.wait([previous])
+        if remove:
+            await self.queue_store.remove(queued)
+        else:
+            await self.queue_store.save(queued)
+
     def finished_deliver(self, queued: QueuedOutboundMessage, completed: CompletedTask):
         """Handle completion of queued message delivery."""
+        self.outbound_active.discard(queued)
+        self._release_endpoint(queued)
         if completed.exc_info:
             queued.error = completed.exc_info
 
@@ -503,6 +702,7 @@ class OutboundTransportManager:
                 queued.retries -= 1
                 queued.state = QueuedOutboundMessage.STATE_RETRY
                 queued.retry_at = time.perf_counter() + 10
+                self.schedule_retry(queued)
             else:
                 LOGGER.exception(
                     ">>> Outbound message failed to deliver, NOT Re-queued.",
@@ -512,7 +712,10 @@ class OutboundTransportManager:
         else:
             queued.error = None
             queued.state = QueuedOutboundMessage.STATE_DONE
+        if queued.state == QueuedOutboundMessage.STATE_DONE:
+            self._handle_done(queued)
         queued.task = None
+        self._update_stored(queued)
         self.process_queued()
 
     async def flush(self):
@@ -0,0 +1,157 @@
+"""Durable storage for outbound messages awaiting delivery."""
+
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from base64 import b64decode, b64encode
+from typing import Sequence
+
+from ...core.profile import Profile
+from ...storage.base import BaseStorage
+from ...storage.error import StorageError, StorageNotFoundError
+from ...storage.record import StorageRecord
+from ...utils.tracing import get_timer
+from .base import QueuedOutboundMessage
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BaseOutboundQueueStore(ABC):
+    """Abstract store for outbound messages which are pending or awaiting retry.
+
+    Only encoded messages are stored: a restored message is delivered as-is to
+    its endpoint, so the originating profile and message are not required.
+    """
+
+    @abstractmethod
+    async def save(self, queued: QueuedOutboundMessage):
+        """Add or update a queued message in the store.
+
+        Args:
+            queued: The queued message, with its payload already encoded
+        """
+
+    @abstractmethod
+    async def remove(self, queued: QueuedOutboundMessage):
+        """Remove a queued message from the store, if present.
+
+        Args:
+            queued: The queued message
+        """
+
+    @abstractmethod
+    async def load(self, profile: Profile) -> Sequence[QueuedOutboundMessage]:
+        """Load all stored messages.
+
+        Args:
+            profile: The profile to associate with the restored messages
+
+        Returns:
+            The restored messages, in the pending or retry state
+
+        """
+
+
+class StorageOutboundQueueStore(BaseOutboundQueueStore):
+    """Outbound queue store backed by the non-secrets storage of a profile."""
+
+    RECORD_TYPE = "outbound_queue"
+
+    def __init__(self, profile: Profile):
+        """Initialize a `StorageOutboundQueueStore` instance.
+
+        Args:
+            profile: The profile (normally the root profile) to store records in
+        """
+        self._profile = profile
+
+    @staticmethod
+    def serialize(queued: QueuedOutboundMessage) -> dict:
+        """Serialize the deliverable state of a queued message."""
+        payload = queued.payload
+        if isinstance(payload, bytes):
+            payload = {"b64": b64encode(payload).decode("ascii")}
+        retry_at = None
+        if queued.retry_at is not None:
+            # retry times are tracked by a monotonic timer: store as wall clock
+            retry_at = time.time() + max(0.0, queued.retry_at - get_timer())
+        return {
+            "endpoint": queued.endpoint,
+            "payload": payload,
+            "transport_id": queued.transport_id,
+            "metadata": queued.metadata,
+            "api_key": queued.api_key,
+            "retries": queued.retries,
+            "retry_at": retry_at,
+        }
+
+    @staticmethod
+    def deserialize(
+        profile: Profile, record_id: str, value: dict
+    ) -> QueuedOutboundMessage:
+        """Restore a queued message from its serialized state."""
+        queued = QueuedOutboundMessage(profile, None, None, value.get("transport_id"))
+        queued.queue_id = record_id
+        queued.endpoint = value["endpoint"]
+        payload = value["payload"]
+        if isinstance(payload, dict):
+            payload = b64decode(payload["b64"])
+        queued.payload = payload
+        queued.metadata = value.get("metadata")
+        queued.api_key = value.get("api_key")
+        queued.retries = value.get("retries")
+        if value.get("retry_at") is not None:
+            queued.retry_at = get_timer() + max(0.0, value["retry_at"] - time.time())
+            queued.state = QueuedOutboundMessage.STATE_RETRY
+        else:
+            queued.state = QueuedOutboundMessage.STATE_PENDING
+        return queued
+
+    async def save(self, queued: QueuedOutboundMessage):
+        """Add or update a queued message in the store."""
+        value = json.dumps(self.serialize(queued))
+        async with self._profile.session() as session:
+            storage = session.inject(BaseStorage)
+            if queued.queue_id:
+                record = StorageRecord(self.RECORD_TYPE, value, {}, queued.queue_id)
+                await storage.update_record(record, value, {})
+            else:
+                record = StorageRecord(self.RECORD_TYPE, value, {}, uuid.uuid4().hex)
+                await storage.add_record(record)
+                queued.queue_id = record.id
+
+    async def remove(self, queued: QueuedOutboundMessage):
+        """Remove a queued message from the store, if present."""
+        if not queued.queue_id:
+            return
+        async with self._profile.session() as session:
+            storage = session.inject(BaseStorage)
+            try:
+                await storage.delete_record(
+                    StorageRecord(self.RECORD_TYPE, None, {}, queued.queue_id)
+                )
+            except StorageNotFoundError:
+                pass
+        queued.queue_id = None
+
+    async def load(self, profile: Profile) -> Sequence[QueuedOutboundMessage]:
+        """Load all stored messages."""
+        results = []
+        async with self._profile.session() as session:
+            storage = session.inject(BaseStorage)
+            rows = await storage.find_all_records(
+                self.RECORD_TYPE, options={"retrieveTags": False}
+            )
+        for row in rows:
+            try:
+                results.append(self.deserialize(profile, row.id, json.loads(row.value)))
+            except (KeyError, TypeError, ValueError) as err:
+                LOGGER.warning("Discarding invalid outbound queue record: %s", err)
+                try:
+                    async with self._profile.session() as session:
+                        await session.inject(BaseStorage).delete_record(row)
+                except StorageError:
+                    pass
+        return results
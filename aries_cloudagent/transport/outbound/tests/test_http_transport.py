@@ -11,7 +11,12 @@ from ....utils.stats import Collector
 from ...wire_format import JsonWireFormat
 
 from ..base import OutboundTransportError
-from ..http import HttpTransport
+from ..http import (
+    CircuitOpenError,
+    HostCircuitBreaker,
+    HttpStatusError,
+    HttpTransport,
+)
 
 
 class TestHttpTransport(AioHTTPTestCase):
@@ -27,12 +32,21 @@ class TestHttpTransport(AioHTTPTestCase):
         self.message_results.append(payload)
         raise web.HTTPOk()
 
+    async def fail_message(self, request):
+        self.message_results.append("fail")
+        raise web.HTTPServiceUnavailable()
+
     async def get_application(self):
         """
         Override the get_app method to return your application.
         """
         app = web.Application()
-        app.add_routes([web.post("/", self.receive_message)])
+        app.add_routes(
+            [
+                web.post("/", self.receive_message),
+                web.post("/fail", self.fail_message),
+            ]
+        )
         return app
 
     async def test_handle_message_no_api_key(self):
@@ -115,9 +129,134 @@ class TestHttpTransport(AioHTTPTestCase):
         assert results["count"] == {
             "outbound-http:dns_resolve": 1,
             "outbound-http:connect": 1,
+            "outbound-http:acquire_new": 1,
             "outbound-http:POST": 1,
         }
 
+    async def test_stats_reuse(self):
+        server_addr = f"http://localhost:{self.server.port}"
+        transport = HttpTransport()
+        transport.collector = Collector()
+        async with transport:
+            for _ in range(3):
+                await transport.handle_message(self.profile, "{}", server_addr)
+
+        results = transport.collector.extract()
+        assert results["count"]["outbound-http:acquire_new"] == 1
+        assert results["count"]["outbound-http:acquire_reused"] == 2
+        assert sum(results["histogram"]["outbound-http:POST"].values()) == 3
+
+    async def test_pool_settings(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.http_pool_limit": 10,
+                "transport.http_pool_limit_per_host": 2,
+            }
+        )
+        transport = HttpTransport(root_profile=profile)
+        await transport.start()
+        assert transport.connector.limit == 10
+        assert transport.connector.limit_per_host == 2
+        assert transport.host_limiter is None
+        await transport.stop()
+
+        profile.settings["transport.http_host_limits"] = {"local*": 1}
+        transport = HttpTransport(root_profile=profile)
+        await transport.start()
+        assert transport.connector.limit_per_host == 0
+        assert transport.host_limiter.limit_for("localhost") == 1
+        assert transport.host_limiter.limit_for("other") == 2
+        await transport.stop()
+
+    async def test_host_limit(self):
+        server_addr = f"http://localhost:{self.server.port}"
+        profile = InMemoryProfile.test_profile(
+            {"transport.http_host_limits": {"localhost": 1}}
+        )
+        transport = HttpTransport(root_profile=profile)
+        active = []
+        max_active = 0
+
+        async def post(*args, **kwargs):
+            nonlocal max_active
+            active.append(1)
+            max_active = max(max_active, len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+
+        async with transport:
+            with mock.patch.object(transport, "_post", post):
+                await asyncio.gather(
+                    *(
+                        transport.handle_message(self.profile, "{}", server_addr)
+                        for _ in range(3)
+                    )
+                )
+        assert max_active == 1
+        assert not transport.host_limiter._hosts
+
+    async def test_circuit_breaker(self):
+        server_addr = f"http://localhost:{self.server.port}"
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.http_breaker_threshold": 2,
+                "transport.http_breaker_cooldown": 1,
+            }
+        )
+        transport = HttpTransport(root_profile=profile)
+        async with transport:
+            for _ in range(2):
+                with pytest.raises(HttpStatusError):
+                    await transport.handle_message(
+                        self.profile, "{}", server_addr + "/fail"
+                    )
+            # circuit is open: no request is made
+            with pytest.raises(CircuitOpenError):
+                await transport.handle_message(self.profile, "{}", server_addr)
+            assert self.message_results == ["fail", "fail"]
+
+            # after the cooldown, one trial request is allowed
+            circuit = transport.circuit_breaker._hosts[server_addr]
+            circuit.open_until = 0
+            await transport.handle_message(self.profile, "{}", server_addr)
+            assert server_addr not in transport.circuit_breaker._hosts
+
+    async def test_circuit_breaker_reopen(self):
+        breaker = HostCircuitBreaker(1, 1, 3)
+        breaker.failure("host")
+        with pytest.raises(CircuitOpenError):
+            breaker.check("host")
+        breaker._hosts["host"].open_until = 0
+        breaker.check("host")
+        # only one trial request at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.check("host")
+        breaker.failure("host")
+        assert breaker._hosts["host"].cooldown == 2
+        breaker._hosts["host"].open_until = 0
+        breaker.check("host")
+        breaker.failure("host")
+        assert breaker._hosts["host"].cooldown == 3
+
+    async def test_circuit_breaker_trial_cancelled(self):
+        server_addr = f"http://localhost:{self.server.port}"
+        profile = InMemoryProfile.test_profile({"transport.http_breaker_threshold": 1})
+        transport = HttpTransport(root_profile=profile)
+        async with transport:
+            transport.circuit_breaker.failure(server_addr)
+            transport.circuit_breaker._hosts[server_addr].open_until = 0
+            with mock.patch.object(
+                transport,
+                "_post",
+                mock.CoroutineMock(side_effect=[asyncio.CancelledError(), None]),
+            ):
+                with pytest.raises(asyncio.CancelledError):
+                    await transport.handle_message(self.profile, "{}", server_addr)
+                # the cancelled trial does not hold the circuit open
+                assert not transport.circuit_breaker._hosts[server_addr].probing
+                await transport.handle_message(self.profile, "{}", server_addr)
+            assert server_addr not in transport.circuit_breaker._hosts
+
     async def test_transport_coverage(self):
         transport = HttpTransport()
         assert transport.wire_format is None
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from aries_cloudagent.tests import mock
@@ -120,6 +121,242 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         assert mgr.get_running_transport_for_scheme("http") is None
         transport.stop.assert_awaited_once_with()
 
+    async def test_persist_queue(self):
+        profile = InMemoryProfile.test_profile(
+            {"transport.persist_outbound_queue": True}
+        )
+        mgr = OutboundTransportManager(profile)
+        assert isinstance(mgr.queue_store, test_module.StorageOutboundQueueStore)
+
+        queue_store = mock.MagicMock(
+            save=mock.CoroutineMock(), remove=mock.CoroutineMock()
+        )
+        profile = InMemoryProfile.test_profile(
+            bind={test_module.BaseOutboundQueueStore: queue_store}
+        )
+        mgr = OutboundTransportManager(profile)
+        assert mgr.queue_store is queue_store
+
+        transport = mock.MagicMock(
+            handle_message=mock.CoroutineMock(side_effect=[KeyError(), None])
+        )
+        transport.wire_format.encode_message = mock.CoroutineMock(
+            return_value=b"packed"
+        )
+        mgr.running_transports = {"transport_cls": transport}
+
+        def save(queued):
+            queued.queue_id = "queue-id"
+
+        queue_store.save.side_effect = save
+        target = ConnectionTarget(recipient_keys=[], endpoint="http://localhost")
+        queued = QueuedOutboundMessage(
+            profile, OutboundMessage(payload="{}"), target, "transport_cls"
+        )
+        queued.retries = 1
+
+        with mock.patch.object(mgr, "process_queued", mock.MagicMock()):
+            mgr.encode_queued_message(queued)
+            await mgr.task_queue
+            # stored once encoded, before it is pending delivery
+            queue_store.save.assert_awaited_once_with(queued)
+            assert queued.state == QueuedOutboundMessage.STATE_PENDING
+            transport.handle_message.assert_not_awaited()
+
+            mgr.deliver_queued_message(queued)
+            await mgr.task_queue
+            # updated for the retry
+            assert queue_store.save.await_count == 2
+            assert queued.state == QueuedOutboundMessage.STATE_RETRY
+
+            mgr.deliver_queued_message(queued)
+            await mgr.task_queue
+            assert queue_store.save.await_count == 2
+            assert queued.state == QueuedOutboundMessage.STATE_DONE
+            queue_store.remove.assert_awaited_once_with(queued)
+
+    async def test_persist_queue_ordered(self):
+        calls = []
+        saving = asyncio.Event()
+
+        async def save(queued):
+            await saving.wait()
+            calls.append("save")
+
+        async def remove(queued):
+            calls.append("remove")
+
+        queue_store = mock.MagicMock(
+            save=mock.CoroutineMock(side_effect=save),
+            remove=mock.CoroutineMock(side_effect=remove),
+        )
+        profile = InMemoryProfile.test_profile(
+            bind={test_module.BaseOutboundQueueStore: queue_store}
+        )
+        mgr = OutboundTransportManager(profile)
+        target = ConnectionTarget(recipient_keys=[], endpoint="http://localhost")
+        queued = QueuedOutboundMessage(
+            profile, OutboundMessage(payload="{}"), target, "transport_cls"
+        )
+        queued.queue_id = "queue-id"
+
+        queued.state = QueuedOutboundMessage.STATE_RETRY
+        mgr._update_stored(queued)
+        queued.state = QueuedOutboundMessage.STATE_DONE
+        mgr._update_stored(queued)
+        await asyncio.sleep(0)
+        assert not calls
+
+        saving.set()
+        await mgr.task_queue
+        assert calls == ["save", "remove"]
+
+    async def test_persist_queue_enqueue(self):
+        queue_store = mock.MagicMock(save=mock.CoroutineMock())
+        profile = InMemoryProfile.test_profile(
+            bind={test_module.BaseOutboundQueueStore: queue_store}
+        )
+        mgr = OutboundTransportManager(profile)
+        transport = mock.MagicMock(is_external=False, schemes=["http"])
+        mgr.running_transports = {"transport_cls": transport}
+        target = ConnectionTarget(recipient_keys=[], endpoint="http://localhost")
+
+        with mock.patch.object(mgr, "process_queued", mock.MagicMock()) as mock_proc:
+            await mgr.enqueue_message(
+                profile,
+                OutboundMessage(payload="{}", enc_payload=b"packed", target=target),
+            )
+            queued = mgr.outbound_new[0]
+            queue_store.save.assert_awaited_once_with(queued)
+            assert queued.payload == b"packed"
+            assert queued.state == QueuedOutboundMessage.STATE_PENDING
+
+            mgr.enqueue_webhook("topic", {}, "http://localhost", 1)
+            assert len(mgr.outbound_new) == 1
+            await mgr.task_queue
+            assert len(mgr.outbound_new) == 2
+            queue_store.save.assert_awaited_with(mgr.outbound_new[1])
+            assert mock_proc.call_count == 2
+
+    async def test_persist_queue_x(self):
+        queue_store = mock.MagicMock(
+            save=mock.CoroutineMock(side_effect=test_module.StorageError())
+        )
+        profile = InMemoryProfile.test_profile(
+            bind={test_module.BaseOutboundQueueStore: queue_store}
+        )
+        mgr = OutboundTransportManager(profile)
+        queued = QueuedOutboundMessage(profile, None, None, "transport_cls")
+        queued.payload = b"packed"
+
+        with mock.patch.object(test_module.LOGGER, "exception") as mock_log:
+            await mgr.store_queued(queued)
+            mock_log.assert_called_once()
+        assert not queued.queue_id
+
+    async def test_restore_queued(self):
+        profile = InMemoryProfile.test_profile()
+        mgr = OutboundTransportManager(profile)
+        mgr.queue_store = test_module.StorageOutboundQueueStore(profile)
+
+        transport_cls = mock.MagicMock()
+        transport_cls.schemes = ["http"]
+        transport_cls.return_value = mock.MagicMock(
+            schemes=["http"],
+            start=mock.CoroutineMock(),
+            is_external=False,
+            handle_message=mock.CoroutineMock(),
+        )
+        mgr.register_class(transport_cls, "transport_cls")
+
+        for endpoint in ("http://localhost", "xmpp://localhost"):
+            queued = QueuedOutboundMessage(profile, None, None, "old_transport_id")
+            queued.endpoint = endpoint
+            queued.payload = b"packed"
+            queued.retries = 2
+            await mgr.queue_store.save(queued)
+
+        with mock.patch.object(mgr, "process_queued", mock.MagicMock()) as mock_proc:
+            await mgr.start()
+            await mgr.task_queue
+            mock_proc.assert_called_once_with()
+        assert len(mgr.outbound_new) == 1
+        assert mgr.outbound_new[0].endpoint == "http://localhost"
+        assert mgr.outbound_new[0].transport_id == "transport_cls"
+        assert mgr.outbound_new[0].state == QueuedOutboundMessage.STATE_PENDING
+        # the message for an unsupported endpoint is discarded
+        assert len(await mgr.queue_store.load(profile)) == 1
+
+        await mgr.flush()
+        transport_cls.return_value.handle_message.assert_awaited_once_with(
+            profile, b"packed", "http://localhost", None, None
+        )
+        await mgr.task_queue
+        assert not await mgr.queue_store.load(profile)
+
+    async def test_max_per_endpoint(self):
+        profile = InMemoryProfile.test_profile(
+            {"transport.max_outbound_per_endpoint": 2}
+        )
+        mgr = OutboundTransportManager(profile)
+        assert mgr.max_per_endpoint == 2
+
+        blocked = {}
+
+        async def handle_message(profile, payload, endpoint, metadata, api_key):
+            blocked.setdefault(endpoint, []).append(payload)
+            await release.wait()
+
+        release = asyncio.Event()
+        transport = mock.MagicMock(
+            handle_message=mock.CoroutineMock(side_effect=handle_message)
+        )
+        mgr.running_transports = {"transport_cls": transport}
+
+        for endpoint in ("http://slow", "http://slow", "http://slow", "http://fast"):
+            queued = QueuedOutboundMessage(profile, None, None, "transport_cls")
+            queued.endpoint = endpoint
+            queued.payload = endpoint
+            queued.state = QueuedOutboundMessage.STATE_PENDING
+            mgr.outbound_new.append(queued)
+        mgr.process_queued()
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert len(blocked["http://slow"]) == 2
+        assert len(blocked["http://fast"]) == 1
+        assert len(mgr._endpoint_waiting["http://slow"]) == 1
+        assert len(mgr.outbound_active) == 3
+
+        release.set()
+        await mgr.flush()
+        assert len(blocked["http://slow"]) == 3
+        assert not mgr.outbound_active
+        assert not mgr._endpoint_active
+        assert not mgr._endpoint_waiting
+
+    async def test_process_loop_skips_active(self):
+        profile = InMemoryProfile.test_profile()
+        mgr = OutboundTransportManager(profile)
+        active = [
+            mock.MagicMock(state=QueuedOutboundMessage.STATE_DELIVER) for _ in range(3)
+        ]
+        mgr.outbound_active.update(active)
+        queued = mock.MagicMock(state=QueuedOutboundMessage.STATE_PENDING)
+        mgr.outbound_new.append(queued)
+
+        with mock.patch.object(
+            mgr, "_start_delivery", mock.MagicMock()
+        ) as mock_start, mock.patch.object(
+            mgr.outbound_event, "wait", mock.CoroutineMock(side_effect=KeyError())
+        ):
+            with self.assertRaises(KeyError):
+                await mgr._process_loop()
+            mock_start.assert_called_once_with(queued)
+        assert all(
+            message.state == QueuedOutboundMessage.STATE_DELIVER for message in active
+        )
+
     async def test_stop_cancel(self):
         profile = InMemoryProfile.test_profile({"transport.outbound_configs": ["http"]})
         mgr = OutboundTransportManager(profile)
@@ -164,6 +401,42 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
             assert queued.retries == test_attempts - 1
             assert queued.state == QueuedOutboundMessage.STATE_PENDING
 
+    async def test_enqueue_webhook_batched(self):
+        profile = InMemoryProfile.test_profile(
+            {"admin.webhook_batch_size": 2, "admin.webhook_batch_linger": 0}
+        )
+        mgr = OutboundTransportManager(profile)
+        assert mgr.webhook_batcher.max_size == 2
+        assert mgr.webhook_batcher.linger == 0
+
+        transport_cls = mock.MagicMock()
+        transport_cls.schemes = ["http"]
+        transport_cls.return_value = mock.MagicMock()
+        transport_cls.return_value.schemes = ["http"]
+        transport_cls.return_value.start = mock.CoroutineMock()
+        transport_cls.return_value.stop = mock.CoroutineMock()
+        transport_cls.return_value.handle_message = mock.CoroutineMock()
+        tid = mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start_transport(tid)
+
+        mgr.enqueue_webhook("topic1", {"a": 1}, "http://example#abc123")
+        mgr.enqueue_webhook("topic2", {"b": 2}, "http://example#abc123")
+        assert not mgr.outbound_new
+        await asyncio.sleep(0.01)
+        await mgr.stop()
+        transport_cls.return_value.handle_message.assert_awaited_once_with(
+            None,
+            json.dumps(
+                [
+                    {"topic": "topic1", "payload": {"a": 1}},
+                    {"topic": "topic2", "payload": {"b": 2}},
+                ]
+            ),
+            "http://example/batch/",
+            None,
+            "abc123",
+        )
+
     async def test_process_done_x(self):
         mock_task = mock.MagicMock(
             done=mock.MagicMock(return_value=True),
@@ -202,7 +475,7 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.schedule_retry(mock_queued)
 
         with mock.patch.object(
             test_module, "trace_event", mock.MagicMock()
@@ -221,15 +494,19 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.schedule_retry(mock_queued)
 
         with mock.patch.object(
-            test_module.asyncio, "sleep", mock.CoroutineMock()
-        ) as mock_sleep_x:
-            mock_sleep_x.side_effect = KeyError()
+            test_module.asyncio, "wait_for", mock.CoroutineMock()
+        ) as mock_wait_for_x:
+            mock_wait_for_x.side_effect = KeyError()
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is not None
+            assert mgr.outbound_retry[0][2] is mock_queued
+            # wait until the retry is due
+            assert 3500 < mock_wait_for_x.call_args[0][1] <= 3600
+            mock_wait_for_x.call_args[0][0].close()
 
     async def test_process_loop_new(self):
         profile = InMemoryProfile.test_profile()
@@ -288,9 +565,12 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_new.append(mock_queued)
 
         await mgr._process_loop()
+        mock_handle_not_delivered.assert_called_once_with(
+            mock_queued.profile, mock_queued.message
+        )
 
     async def test_finished_deliver_x_log_debug(self):
         mock_queued = mock.MagicMock(state=QueuedOutboundMessage.STATE_DONE, retries=1)
@@ -299,7 +579,7 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_active.add(mock_queued)
         with mock.patch.object(
             test_module.LOGGER, "exception", mock.MagicMock()
         ) as mock_logger_exception, mock.patch.object(
@@ -0,0 +1,88 @@
+from unittest import IsolatedAsyncioTestCase
+
+from aries_cloudagent.tests import mock
+
+from ....core.in_memory import InMemoryProfile
+from ....storage.base import BaseStorage
+from ....storage.error import StorageNotFoundError
+from ....utils.tracing import get_timer
+from ..base import QueuedOutboundMessage
+from ..queue_store import StorageOutboundQueueStore
+
+
+class TestStorageOutboundQueueStore(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.store = StorageOutboundQueueStore(self.profile)
+
+    def make_queued(self, payload=b"packed") -> QueuedOutboundMessage:
+        queued = QueuedOutboundMessage(self.profile, None, None, "transport")
+        queued.endpoint = "http://localhost/"
+        queued.payload = payload
+        queued.metadata = {"x": "y"}
+        queued.api_key = "key"
+        queued.retries = 3
+        queued.state = QueuedOutboundMessage.STATE_PENDING
+        return queued
+
+    async def test_save_load_remove(self):
+        queued = self.make_queued()
+        await self.store.save(queued)
+        assert queued.queue_id
+
+        restored = await self.store.load(self.profile)
+        assert len(restored) == 1
+        assert restored[0].queue_id == queued.queue_id
+        assert restored[0].payload == b"packed"
+        assert restored[0].endpoint == queued.endpoint
+        assert restored[0].metadata == queued.metadata
+        assert restored[0].api_key == queued.api_key
+        assert restored[0].retries == 3
+        assert restored[0].retry_at is None
+        assert restored[0].state == QueuedOutboundMessage.STATE_PENDING
+
+        queued.retries = 2
+        queued.retry_at = get_timer() + 10
+        await self.store.save(queued)
+        (restored,) = await self.store.load(self.profile)
+        assert restored.retries == 2
+        assert restored.state == QueuedOutboundMessage.STATE_RETRY
+        assert 0 < restored.retry_at - get_timer() <= 10
+
+        await self.store.remove(queued)
+        assert queued.queue_id is None
+        assert not await self.store.load(self.profile)
+
+        # already removed
+        queued.queue_id = restored.queue_id
+        await self.store.remove(queued)
+
+    async def test_save_str_payload(self):
+        await self.store.save(self.make_queued(payload='{"webhook": true}'))
+        (restored,) = await self.store.load(self.profile)
+        assert restored.payload == '{"webhook": true}'
+
+    async def test_remove_not_stored(self):
+        queued = self.make_queued()
+        with mock.patch.object(
+            self.profile, "session", mock.MagicMock()
+        ) as mock_session:
+            await self.store.remove(queued)
+            mock_session.assert_not_called()
+
+    async def test_load_invalid(self):
+        queued = self.make_queued()
+        await self.store.save(queued)
+        async with self.profile.session() as session:
+            storage = session.inject(BaseStorage)
+            record = await storage.get_record(
+                StorageOutboundQueueStore.RECORD_TYPE, queued.queue_id
+            )
+            await storage.update_record(record, '{"payload": "x"}', {})
+
+        assert not await self.store.load(self.profile)
+        async with self.profile.session() as session:
+            with self.assertRaises(StorageNotFoundError):
+                await session.inject(BaseStorage).get_record(
+                    StorageOutboundQueueStore.RECORD_TYPE, queued.queue_id
+                )
@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase
+
+from aries_cloudagent.tests import mock
+
+from ..base import OutboundDeliveryError, OutboundTransportError
+from ..webhook_batcher import WebhookBatcher
+
+
+class TestWebhookBatcher(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.posted = []
+        self.fail = False
+        self.transport = mock.MagicMock(handle_message=self.handle_message)
+
+    async def handle_message(self, profile, payload, endpoint, metadata, api_key):
+        if self.fail:
+            raise OutboundTransportError("Unreachable")
+        self.posted.append((endpoint, json.loads(payload), metadata, api_key))
+
+    def get_transport(self, endpoint):
+        if not endpoint.startswith("http"):
+            raise OutboundDeliveryError("No transport")
+        return self.transport
+
+    async def wait_for(self, cond):
+        for _ in range(100):
+            if cond():
+                return
+            await asyncio.sleep(0.01)
+
+    async def wait_idle(self, batcher: WebhookBatcher):
+        await self.wait_for(lambda: not batcher.targets)
+
+    async def test_batch_size(self):
+        batcher = WebhookBatcher(self.get_transport, 2, linger=10)
+        for i in range(5):
+            batcher.add("topic", {"n": i}, "http://host", "key", {"x-wallet-id": "w"})
+        await asyncio.sleep(0.01)
+        assert [len(batch) for _, batch, _, _ in self.posted] == [2, 2]
+        assert self.posted[0] == (
+            "http://host/batch/",
+            [
+                {"topic": "topic", "payload": {"n": 0}},
+                {"topic": "topic", "payload": {"n": 1}},
+            ],
+            {"x-wallet-id": "w"},
+            "key",
+        )
+        await batcher.stop()
+        assert not batcher.targets
+
+    async def test_linger_and_targets(self):
+        batcher = WebhookBatcher(self.get_transport, 10, linger=0.01)
+        batcher.add("a", {"n": 1}, "http://one")
+        batcher.add("b", {"n": 2}, "http://two")
+        batcher.add("c", {"n": 3}, "http://one")
+        await self.wait_idle(batcher)
+        assert sorted((e, [ev["topic"] for ev in b]) for e, b, _, _ in self.posted) == [
+            ("http://one/batch/", ["a", "c"]),
+            ("http://two/batch/", ["b"]),
+        ]
+        with self.assertRaises(OutboundDeliveryError):
+            batcher.add("a", {}, "ws2://nope")
+
+    async def test_retry_then_discard(self):
+        batcher = WebhookBatcher(
+            self.get_transport, 1, max_attempts=2, retry_interval=0.01
+        )
+        self.fail = True
+        batcher.add("a", {"n": 1}, "http://host")
+        await self.wait_idle(batcher)
+        assert not self.posted
+        self.fail = False
+        batcher.add("a", {"n": 2}, "http://host")
+        await self.wait_idle(batcher)
+        assert [b[0]["payload"]["n"] for _, b, _, _ in self.posted] == [2]
+
+    async def test_spool_in_order(self):
+        with TemporaryDirectory() as spool_dir:
+            batcher = WebhookBatcher(
+                self.get_transport,
+                1,
+                spool_dir=spool_dir,
+                max_attempts=1,
+                retry_interval=0.02,
+            )
+            self.fail = True
+            for i in range(3):
+                batcher.add("a", {"n": i}, "http://host")
+            await self.wait_for(lambda: os.listdir(spool_dir))
+            assert len(os.listdir(spool_dir)) == 1
+            self.fail = False
+            batcher.add("a", {"n": 3}, "http://host")
+            await self.wait_idle(batcher)
+            assert [b[0]["payload"]["n"] for _, b, _, _ in self.posted] == [0, 1, 2, 3]
+            assert not os.listdir(spool_dir)
+
+    async def test_spool_restore(self):
+        with TemporaryDirectory() as spool_dir:
+            batcher = WebhookBatcher(
+                self.get_transport, 10, linger=10, spool_dir=spool_dir
+            )
+            batcher.add("a", {"n": 1}, "http://host", "key")
+            batcher.add("b", {"n": 2}, "http://host", "key")
+            await batcher.stop()
+            assert len(os.listdir(spool_dir)) == 1
+            with open(os.path.join(spool_dir, "bad.jsonl"), "w") as bad:
+                bad.write("not json\n")
+
+            batcher = WebhookBatcher(self.get_transport, 10, spool_dir=spool_dir)
+            await batcher.restore()
+            await self.wait_idle(batcher)
+            assert self.posted == [
+                (
+                    "http://host/batch/",
+                    [
+                        {"topic": "a", "payload": {"n": 1}},
+                        {"topic": "b", "payload": {"n": 2}},
+                    ],
+                    None,
+                    "key",
+                )
+            ]
+            assert not os.listdir(spool_dir)
+
+    async def test_stop_compacts_spool(self):
+        with TemporaryDirectory() as spool_dir:
+            batcher = WebhookBatcher(
+                self.get_transport,
+                1,
+                spool_dir=spool_dir,
+                max_attempts=1,
+                retry_interval=10,
+            )
+            self.fail = True
+            batcher.add("a", {"n": 1}, "http://host")
+            batcher.add("a", {"n": 2}, "http://host")
+            (target,) = batcher.targets.values()
+            await self.wait_for(lambda: target.spooled)
+            # simulate the first spooled batch having been delivered
+            batcher._spool_head(target)
+            batcher._spool_advance(target)
+            await batcher.stop()
+            (name,) = os.listdir(spool_dir)
+            with open(os.path.join(spool_dir, name)) as spool:
+                lines = [json.loads(line) for line in spool]
+            assert [line["events"][0]["payload"]["n"] for line in lines] == [2]
@@ -0,0 +1,296 @@
+"""Batched webhook delivery with an optional on-disk spool."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from .base import BaseOutboundTransport, OutboundDeliveryError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class WebhookTarget:
+    """Webhook events and batches awaiting delivery to a single target."""
+
+    def __init__(self, endpoint: str, api_key: str = None, metadata: dict = None):
+        """Initialize a `WebhookTarget` instance."""
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.metadata = metadata
+        self.events: List[dict] = []
+        self.batches: Deque[List[dict]] = deque()
+        self.linger: asyncio.TimerHandle = None
+        self.task: asyncio.Task = None
+        self.sending: List[dict] = None
+        self.spooled = False
+        self.spool_offset = 0
+        self.spool_line = 0
+
+    @property
+    def key(self) -> Tuple[str, Optional[str], str]:
+        """Accessor for the key identifying this target."""
+        return (
+            self.endpoint,
+            self.api_key,
+            json.dumps(self.metadata, sort_keys=True),
+        )
+
+    @property
+    def url(self) -> str:
+        """Accessor for the URL receiving batches."""
+        return f"{self.endpoint}/batch/"
+
+
+class WebhookBatcher:
+    """Collect webhooks into batches, delivered in order to each target.
+
+    Each batch is posted as a JSON array of `{"topic": ..., "payload": ...}`
+    objects to `<webhook url>/batch/`. A batch is sent once it reaches the
+    maximum size or the linger time has passed since its first event, and
+    only one batch per target is in flight at a time.
+
+    When a spool directory is configured, batches which cannot be delivered
+    after retrying are appended to a file for the target, along with any later
+    batches, and sent in order once the target is reachable again. Delivery
+    from the spool is at-least-once across restarts.
+    """
+
+    def __init__(
+        self,
+        get_transport: Callable[[str], BaseOutboundTransport],
+        max_size: int,
+        linger: float = 0.1,
+        spool_dir: str = None,
+        max_attempts: int = 5,
+        retry_interval: float = 10.0,
+    ):
+        """Initialize a `WebhookBatcher` instance.
+
+        Args:
+            get_transport: callable returning the running transport for a URL
+            max_size: the maximum number of events in a batch
+            linger: the maximum time in seconds to wait for a batch to fill
+            spool_dir: the directory for batches awaiting redelivery, if any
+            max_attempts: the number of delivery attempts before spooling
+                (or discarding) a batch
+            retry_interval: the time in seconds between delivery attempts
+
+        """
+        self.get_transport = get_transport
+        self.max_size = max_size
+        self.linger = linger
+        self.spool_dir = spool_dir
+        self.max_attempts = max_attempts
+        self.retry_interval = retry_interval
+        self.targets: Dict[Tuple[str, Optional[str], str], WebhookTarget] = {}
+        if spool_dir:
+            os.makedirs(spool_dir, exist_ok=True)
+
+    def add(
+        self,
+        topic: str,
+        payload: dict,
+        endpoint: str,
+        api_key: str = None,
+        metadata: dict = None,
+    ):
+        """Add a webhook event to the batch for its target.
+
+        Raises:
+            OutboundDeliveryError: if no transport is running for the endpoint
+
+        """
+        self.get_transport(endpoint)
+        target = WebhookTarget(endpoint, api_key, metadata)
+        target = self.targets.setdefault(target.key, target)
+        target.events.append({"topic": topic, "payload": payload})
+        if len(target.events) >= self.max_size:
+            self._seal(target)
+        elif not target.linger:
+            target.linger = asyncio.get_event_loop().call_later(
+                self.linger, self._seal, target
+            )
+
+    def _seal(self, target: WebhookTarget):
+        """Close the current batch for a target and start delivery."""
+        if target.linger:
+            target.linger.cancel()
+            target.linger = None
+        if target.events:
+            target.batches.append(target.events)
+            target.events = []
+        self._start(target)
+
+    def _start(self, target: WebhookTarget):
+        if (target.batches or target.spooled) and not (
+            target.task and not target.task.done()
+        ):
+            target.task = asyncio.get_event_loop().create_task(self._run(target))
+
+    async def _run(self, target: WebhookTarget):
+        """Deliver the batches for a target in order."""
+        loop = asyncio.get_event_loop()
+        while target.batches or target.spooled:
+            if target.spooled:
+                batch = await loop.run_in_executor(None, self._spool_head, target)
+                if batch is None:
+                    continue
+            else:
+                batch = target.sending = target.batches.popleft()
+            delivered = await self._deliver(target, batch)
+            target.sending = None
+            if delivered:
+                if target.spooled:
+                    await loop.run_in_executor(None, self._spool_advance, target)
+                continue
+            if self.spool_dir:
+                pending = [] if target.spooled else [batch]
+                pending.extend(target.batches)
+                target.batches.clear()
+                await loop.run_in_executor(None, self._spool_append, target, pending)
+                await asyncio.sleep(self.retry_interval)
+            else:
+                LOGGER.warning(
+                    "Discarding %d webhook(s) for %s after %d attempts",
+                    len(batch),
+                    target.endpoint,
+                    self.max_attempts,
+                )
+        if not (target.events or target.batches):
+            self.targets.pop(target.key, None)
+
+    async def _deliver(self, target: WebhookTarget, batch: List[dict]) -> bool:
+        """Post a batch to its target, retrying on failure."""
+        payload = json.dumps(batch)
+        for attempt in range(self.max_attempts):
+            if attempt:
+                await asyncio.sleep(self.retry_interval)
+            try:
+                transport = self.get_transport(target.endpoint)
+                await transport.handle_message(
+                    None,
+                    payload,
+                    target.url,
+                    dict(target.metadata) if target.metadata else None,
+                    target.api_key,
+                )
+                return True
+            except Exception as err:
+                LOGGER.error(
+                    ">>> Error when posting webhook batch to: %s; Error: %s",
+                    target.url,
+                    err,
+                )
+        return False
+
+    def _spool_path(self, target: WebhookTarget) -> str:
+        digest = hashlib.sha256(json.dumps(target.key).encode("utf-8")).hexdigest()
+        return os.path.join(self.spool_dir, f"{digest}.jsonl")
+
+    def _spool_append(self, target: WebhookTarget, batches: List[List[dict]]):
+        """Append batches to the spool file for a target."""
+        with open(self._spool_path(target), "a", encoding="utf-8") as spool:
+            for batch in batches:
+                line = {
+                    "endpoint": target.endpoint,
+                    "api_key": target.api_key,
+                    "metadata": target.metadata,
+                    "events": batch,
+                }
+                spool.write(json.dumps(line) + "\n")
+        target.spooled = True
+
+    def _spool_head(self, target: WebhookTarget) -> Optional[List[dict]]:
+        """Read the oldest undelivered batch from the spool for a target.
+
+        The spool file is removed once all of its batches are delivered.
+        """
+        path = self._spool_path(target)
+        try:
+            with open(path, "rb") as spool:
+                spool.seek(target.spool_offset)
+                line = spool.readline()
+        except FileNotFoundError:
+            line = b""
+        if not line:
+            if os.path.exists(path):
+                os.remove(path)
+            target.spooled = False
+            target.spool_offset = 0
+            return None
+        target.spool_line = len(line)
+        return json.loads(line)["events"]
+
+    def _spool_advance(self, target: WebhookTarget):
+        target.spool_offset += target.spool_line
+
+    def _spool_compact(self, target: WebhookTarget):
+        """Drop the delivered batches from the start of the spool for a target."""
+        path = self._spool_path(target)
+        with open(path, "rb") as spool:
+            spool.seek(target.spool_offset)
+            remaining = spool.read()
+        with open(path + ".tmp", "wb") as spool:
+            spool.write(remaining)
+        os.replace(path + ".tmp", path)
+        target.spool_offset = 0
+
+    async def restore(self):
+        """Resume delivery of the batches left in the spool by a previous run."""
+        if not self.spool_dir:
+            return
+        for name in sorted(os.listdir(self.spool_dir)):
+            if not name.endswith(".jsonl"):
+                continue
+            path = os.path.join(self.spool_dir, name)
+            try:
+                with open(path, "rb") as spool:
+                    first = json.loads(spool.readline())
+                target = WebhookTarget(
+                    first["endpoint"], first.get("api_key"), first.get("metadata")
+                )
+                self.get_transport(target.endpoint)
+            except (OSError, KeyError, ValueError, OutboundDeliveryError) as err:
+                LOGGER.warning("Discarding webhook spool file %s: %s", name, err)
+                os.remove(path)
+                continue
+            if self._spool_path(target) != path:
+                os.rename(path, self._spool_path(target))
+            target = self.targets.setdefault(target.key, target)
+            target.spooled = True
+            self._start(target)
+
+    async def stop(self):
+        """Stop delivery, spooling any undelivered batches if enabled."""
+        for target in list(self.targets.values()):
+            if target.linger:
+                target.linger.cancel()
+                target.linger = None
+            if target.events:
+                target.batches.append(target.events)
+                target.events = []
+            if target.task and not target.task.done():
+                target.task.cancel()
+                try:
+                    await target.task
+                except asyncio.CancelledError:
+                    pass
+            if target.sending:
+                target.batches.appendleft(target.sending)
+                target.sending = None
+            if target.spooled and target.spool_offset:
+                self._spool_compact(target)
+            if target.batches:
+                if self.spool_dir:
+                    self._spool_append(target, list(target.batches))
+                else:
+                    LOGGER.warning(
+                        "Discarding %d undelivered webhook batch(es) for %s",
+                        len(target.batches),
+                        target.endpoint,
+                    )
+        self.targets = {}
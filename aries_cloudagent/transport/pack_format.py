@@ -2,7 +2,8 @@
 
 import json
 import logging
-from typing import List, Sequence, Tuple, Union
+import re
+from typing import List, Optional, Sequence, Tuple, Union
 
 from ..core.profile import ProfileSession
 
@@ -20,6 +21,59 @@ from .wire_format import BaseWireFormat
 
 LOGGER = logging.getLogger(__name__)
 
+FORWARD_TYPE_SUFFIX = "/" + Forward.Meta.message_type
+JSON_DECODER = json.JSONDecoder()
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def parse_forward(message_json: str) -> Optional[Tuple[dict, str]]:
+    """Parse a JSON object, keeping the original text of its `msg` value.
+
+    Each top-level value is decoded once, so this costs about as much as
+    `json.loads`, while the message carried by a forward can be relayed
+    as received instead of being serialized again.
+
+    Returns:
+        A tuple of the parsed object and the `msg` text, if any, or `None`
+        if the text is not a JSON object
+
+    """
+    skip = JSON_WHITESPACE.match
+    decode = JSON_DECODER.raw_decode
+    parsed = {}
+    raw_msg = None
+    try:
+        idx = skip(message_json, 0).end()
+        if message_json[idx : idx + 1] != "{":
+            return None
+        idx = skip(message_json, idx + 1).end()
+        if message_json[idx : idx + 1] == "}":
+            idx += 1
+        else:
+            while True:
+                key, idx = decode(message_json, idx)
+                if not isinstance(key, str):
+                    return None
+                idx = skip(message_json, idx).end()
+                if message_json[idx : idx + 1] != ":":
+                    return None
+                start = skip(message_json, idx + 1).end()
+                parsed[key], idx = decode(message_json, start)
+                if key == "msg":
+                    raw_msg = message_json[start:idx]
+                idx = skip(message_json, idx).end()
+                delim = message_json[idx : idx + 1]
+                idx = skip(message_json, idx + 1).end()
+                if delim == "}":
+                    break
+                if delim != ",":
+                    return None
+    except ValueError:
+        return None
+    if skip(message_json, idx).end() != len(message_json):
+        return None
+    return parsed, raw_msg
+
 
 class PackWireFormat(BaseWireFormat):
     """Standard DIDComm message parser and serializer."""
@@ -77,12 +131,7 @@ class PackWireFormat(BaseWireFormat):
                 LOGGER.debug("Message unpack failed, falling back to JSON")
             else:
                 receipt.raw_message = message_json
-                try:
-                    message_dict = json.loads(message_json)
-                except ValueError:
-                    raise WireFormatParseError("Message JSON parsing failed")
-                if not isinstance(message_dict, dict):
-                    raise WireFormatParseError("Message JSON result is not an object")
+                message_dict = self.parse_unpacked(message_json, receipt)
 
         # parse thread ID
         thread_dec = message_dict.get("~thread")
@@ -100,6 +149,45 @@ class PackWireFormat(BaseWireFormat):
 
         return message_dict, receipt
 
+    def parse_unpacked(
+        self, message_json: Union[str, bytes], receipt: MessageReceipt
+    ) -> dict:
+        """Parse an unpacked message.
+
+        For a forward message, the original text of the message it carries is
+        kept in the receipt, so that it can be relayed without being parsed
+        into a message instance and serialized again.
+
+        Raises:
+            WireFormatParseError: If the JSON parsing failed
+
+        """
+        if isinstance(message_json, bytes):
+            try:
+                message_json = message_json.decode("utf-8")
+            except UnicodeDecodeError:
+                raise WireFormatParseError("Message JSON parsing failed")
+        if FORWARD_TYPE_SUFFIX in message_json:
+            forward = parse_forward(message_json)
+            if forward:
+                message_dict, raw_msg = forward
+                message_type = message_dict.get("@type")
+                if (
+                    raw_msg
+                    and raw_msg[0] == "{"
+                    and isinstance(message_type, str)
+                    and message_type.endswith(FORWARD_TYPE_SUFFIX)
+                ):
+                    receipt.raw_forward = raw_msg
+                return message_dict
+        try:
+            message_dict = json.loads(message_json)
+        except ValueError:
+            raise WireFormatParseError("Message JSON parsing failed")
+        if not isinstance(message_dict, dict):
+            raise WireFormatParseError("Message JSON result is not an object")
+        return message_dict
+
     async def unpack(
         self,
         session: ProfileSession,
@@ -2,7 +2,7 @@
 
 import aiohttp
 
-from ..utils.stats import Collector
+from ..utils.stats import Collector, Timer
 
 
 class StatsTracer(aiohttp.TraceConfig):
@@ -22,12 +22,15 @@ class StatsTracer(aiohttp.TraceConfig):
         self.on_dns_cache_hit.append(self.socket_connect_start)  # restart timer
         self.on_dns_cache_miss.append(self.socket_connect_start)  # restart timer
         self.on_connection_reuseconn.append(self.connection_ready)
+        self.on_connection_reuseconn.append(self.connection_reused)
         self.on_connection_create_end.append(self.connection_ready)
+        self.on_connection_create_end.append(self.connection_created)
         self.on_request_end.append(self.request_end)
 
     async def request_start(self, session, context, params):
         """Handle the start of a request."""
         context.method, context.url = params.method, params.url
+        context.start_time = Timer.now()
 
     async def connection_queued_start(self, session, context, params):
         """Handle the start of a queued connection."""
@@ -57,6 +60,22 @@ class StatsTracer(aiohttp.TraceConfig):
             pass
         context.fetch_timer = self.collector.timer(self.prefix + context.method).start()
 
+    async def connection_reused(self, session, context, params):
+        """Record the time taken to acquire a pooled connection."""
+        self.collector.log(
+            self.prefix + "acquire_reused",
+            Timer.now() - context.start_time,
+            context.start_time,
+        )
+
+    async def connection_created(self, session, context, params):
+        """Record the time taken to acquire a new connection."""
+        self.collector.log(
+            self.prefix + "acquire_new",
+            Timer.now() - context.start_time,
+            context.start_time,
+        )
+
     async def request_end(self, session, context, params):
         """Handle the end of request."""
         context.fetch_timer.stop()
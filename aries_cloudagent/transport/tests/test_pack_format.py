@@ -196,6 +196,45 @@ class TestPackWireFormat(IsolatedAsyncioTestCase):
         assert message_dict["@type"] == DIDCommPrefix.qualify_current(FORWARD)
         assert delivery.recipient_verkey == router_did.verkey
         assert delivery.sender_verkey is None
+        assert json.loads(delivery.raw_forward) == message_dict["msg"]
+
+        # the inner message is relayed as received
+        inner, inner_delivery = await serializer.parse_message(
+            self.session, delivery.raw_forward
+        )
+        assert inner == self.test_message
+        assert inner_delivery.raw_forward is None
+
+    def test_parse_forward(self):
+        inner = ' {"protected": "abc", "ciphertext": "d\\u00e9f"} '
+        text = (
+            '\n{ "@type" : "https://didcomm.org/routing/1.0/forward",'
+            f'"to":"key","msg":{inner}, "n": [1, {{}}] }}  '
+        )
+        parsed, raw_msg = test_module.parse_forward(text)
+        assert parsed == json.loads(text)
+        assert raw_msg == inner.strip()
+
+        assert test_module.parse_forward("{}") == ({}, None)
+        for bad in ("[]", "{1: 2}", '{"a" 1}', '{"a": 1,}', '{"a": 1} x', '{"a": 1'):
+            assert test_module.parse_forward(bad) is None
+
+    async def test_forward_msg_not_object(self):
+        serializer = PackWireFormat()
+        serializer.task_queue = None
+        forward = {
+            "@type": DIDCommPrefix.qualify_current(FORWARD),
+            "to": "key",
+            "msg": json.dumps({"protected": "abc"}),
+        }
+        with mock.patch.object(
+            serializer, "unpack", mock.CoroutineMock(return_value=json.dumps(forward))
+        ):
+            message_dict, delivery = await serializer.parse_message(
+                self.session, json.dumps({"protected": "xyz"})
+            )
+        assert message_dict == forward
+        assert delivery.raw_forward is None
 
     async def test_get_recipient_keys(self):
         recip_keys = ["kid1", "kid2", "kid3"]
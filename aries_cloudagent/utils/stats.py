@@ -3,18 +3,23 @@
 import functools
 import inspect
 import time
+from bisect import bisect_left
 from typing import Sequence, TextIO, Union
 
 
 class Stats:
     """A collection of statistics."""
 
+    # upper bounds in seconds of the duration histogram buckets
+    HISTOGRAM_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
     def __init__(self):
         """Initialize the Stats instance."""
         self.counts = {}
         self.max_time = {}
         self.min_time = {}
         self.total_time = {}
+        self.histogram = {}
 
     def log(self, name: str, duration: float):
         """Log an entry in the stats."""
@@ -28,6 +33,8 @@ class Stats:
             self.max_time[name] = duration
             self.min_time[name] = duration
             self.total_time[name] = duration
+            self.histogram[name] = [0] * (len(self.HISTOGRAM_BUCKETS) + 1)
+        self.histogram[name][bisect_left(self.HISTOGRAM_BUCKETS, duration)] += 1
 
     def extract(self, names: Sequence[str] = None) -> dict:
         """Summarize the stats in a dictionary."""
@@ -49,12 +56,16 @@ class Stats:
                 name: val for (name, val) in self.total_time.items() if name in names
             }
 
+        labels = [str(bound) for bound in self.HISTOGRAM_BUCKETS] + ["+Inf"]
         return {
             "avg": {name: totals[name] / counts[name] for name in names},
             "count": counts,
             "max": maxes,
             "min": mins,
             "total": totals,
+            "histogram": {
+                name: dict(zip(labels, self.histogram[name])) for name in names
+            },
         }
 
 
@@ -97,3 +97,15 @@ class TestStats(IsolatedAsyncioTestCase):
 
         stats.reset()
         assert not stats.results["avg"]
+
+    async def test_histogram(self):
+        stats = Collector()
+        stats.log("test", 0.0005)
+        stats.log("test", 0.003)
+        stats.log("test", 0.005)
+        stats.log("test", 60)
+        histogram = stats.results["histogram"]["test"]
+        assert histogram["0.001"] == 1
+        assert histogram["0.005"] == 2
+        assert histogram["+Inf"] == 1
+        assert sum(histogram.values()) == stats.results["count"]["test"]
@@ -23,6 +23,7 @@ from .crypto import (
 from .document_loader import (
     DocumentLoader,
     DocumentLoaderMethod,
+    run_jsonld,
 )
 from .error import LinkedDataProofException
 from .validation_result import DocumentVerificationResult, ProofResult, PurposeResult
@@ -53,6 +54,7 @@ __all__ = [
     # Document Loaders
     "DocumentLoaderMethod",
     "DocumentLoader",
+    "run_jsonld",
     # Exceptions
     "LinkedDataProofException",
     # Validation results
@@ -0,0 +1,171 @@
+"""Cache of canonicalization results for linked data proofs."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Union
+from uuid import uuid4
+from weakref import WeakKeyDictionary
+
+from pyld import jsonld
+
+from .document_loader import DocumentLoaderMethod
+
+
+def cache_key(*parts: Any) -> str:
+    """Derive a cache key from the content of JSON documents.
+
+    Documents which differ only in the order of their keys share a key.
+    """
+    return hashlib.sha256(
+        json.dumps(
+            parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+# identifiers of the document loaders in use, released along with the loaders
+_LOADER_SCOPES: "WeakKeyDictionary[Any, str]" = WeakKeyDictionary()
+_LOADER_SCOPES_LOCK = threading.Lock()
+
+
+def loader_scope(document_loader: Optional[DocumentLoaderMethod]) -> Optional[str]:
+    """Identify a document loader, so that results are not shared between loaders.
+
+    Returns:
+        An identifier unique to the loader, or `None` if the loader cannot be
+        identified and results obtained with it should not be cached
+
+    """
+    if document_loader is None:
+        return ""
+    # bound methods are created on each access: identify their instance
+    loader = getattr(document_loader, "__self__", document_loader)
+    with _LOADER_SCOPES_LOCK:
+        try:
+            scope = _LOADER_SCOPES.get(loader)
+            if scope is None:
+                scope = _LOADER_SCOPES[loader] = uuid4().hex
+        except TypeError:
+            return None
+    return scope
+
+
+def scoped_cache_key(
+    namespace: str, document_loader: Optional[DocumentLoaderMethod], *parts: Any
+) -> Optional[str]:
+    """Derive a cache key for a result obtained using a document loader.
+
+    Returns:
+        The cache key, or `None` if the result should not be cached
+
+    """
+    scope = loader_scope(document_loader)
+    if scope is None:
+        return None
+    return cache_key(namespace, scope, *parts)
+
+
+class CanonizationCache:
+    """Thread-safe cache of canonicalized documents and verify data.
+
+    Entries are addressed by the hash of their input documents and kept in
+    least-recently-used order, bounded by a number of entries and a total
+    size in bytes.
+
+    The JSON-LD contexts referenced by a document are resolved by a document
+    loader, so keys for results obtained with a loader include its identity,
+    see `scoped_cache_key`.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 16 * 1024 * 1024):
+        """Initialize a `CanonizationCache` instance.
+
+        Args:
+            max_entries: the maximum number of cached results
+            max_bytes: the maximum total size of cached results
+
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Union[str, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Optional[str]) -> Optional[Union[str, bytes]]:
+        """Get a cached result, or `None` if it is not present or not cacheable."""
+        if key is None:
+            return None
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Optional[str], value: Union[str, bytes]):
+        """Add a result to the cache, dropping the least recently used."""
+        size = len(value)
+        if key is None or size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            while self._entries and (
+                len(self._entries) >= self.max_entries
+                or self._bytes + size > self.max_bytes
+            ):
+                self._bytes -= len(self._entries.popitem(last=False)[1])
+            self._entries[key] = value
+            self._bytes += size
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Return the cache size and hit counts."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+CANONIZATION_CACHE = CanonizationCache()
+
+
+def canonize(input: dict, document_loader: DocumentLoaderMethod = None) -> str:
+    """Canonize a document using the URDNA2015 algorithm, caching the result.
+
+    Terms missing from the context are dropped without error; the results
+    are kept apart from those of linked data proof suites, which reject them.
+    """
+    key = scoped_cache_key("c14n", document_loader, input)
+    nquads = CANONIZATION_CACHE.get(key)
+    if nquads is None:
+        options = {"algorithm": "URDNA2015", "format": "application/n-quads"}
+        if document_loader:
+            options["documentLoader"] = document_loader
+        nquads = jsonld.normalize(input, options)
+        CANONIZATION_CACHE.set(key, nquads)
+    return nquads
+
+
+__all__ = [
+    "CanonizationCache",
+    "CANONIZATION_CACHE",
+    "cache_key",
+    "canonize",
+    "loader_scope",
+    "scoped_cache_key",
+]
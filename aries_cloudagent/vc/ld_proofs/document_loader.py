@@ -2,8 +2,11 @@
 
 import asyncio
 import concurrent.futures
+import functools
+import threading
+import time
 
-from typing import Callable
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
 
 from pydid.did_url import DIDUrl
 from pyld.documentloader import requests
@@ -19,9 +22,35 @@ import nest_asyncio
 
 nest_asyncio.apply()
 
+# pyld is pure Python and its shared context caches are not thread-safe, so
+# JSON-LD operations are run one at a time, but off the event loop
+_executor: concurrent.futures.ThreadPoolExecutor = None
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    if not _executor:
+        _executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="jsonld"
+        )
+    return _executor
+
 
 class DocumentLoader:
-    """JSON-LD document loader."""
+    """JSON-LD document loader.
+
+    Operations passed to `run` are processed on a worker thread. Documents
+    they load do not block the event loop: contexts are fetched by the worker
+    itself, while DIDs are resolved on the event loop. Loaded documents are
+    held in a thread-safe cache until they expire.
+
+    Contexts loaded over http(s) are tagged as static, so that pyld keeps them
+    resolved in its shared cache along with the active contexts processed
+    from them. Documents using the same contexts are then expanded without
+    processing their contexts again.
+    """
+
+    DOCUMENT_CACHE_SIZE = 1000
 
     def __init__(self, profile: Profile, cache_ttl: int = 300) -> None:
         """Initialize new DocumentLoader instance.
@@ -36,9 +65,26 @@ class DocumentLoader:
         self.cache = profile.inject_or(BaseCache)
         self.online_request_loader = requests.requests_document_loader()
         self.requests_loader = StaticCacheJsonLdDownloader().load
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.cache_ttl = cache_ttl
         self._event_loop = asyncio.get_event_loop()
+        self._documents: Dict[str, Tuple[float, dict]] = {}
+        self._documents_lock = threading.Lock()
+
+    def _get_cached(self, url: str) -> Optional[dict]:
+        with self._documents_lock:
+            entry = self._documents.get(url)
+            if entry:
+                if entry[0] > time.monotonic():
+                    return entry[1]
+                del self._documents[url]
+        return None
+
+    def _set_cached(self, url: str, document: dict):
+        with self._documents_lock:
+            self._documents.pop(url, None)
+            while len(self._documents) >= self.DOCUMENT_CACHE_SIZE:
+                del self._documents[next(iter(self._documents))]
+            self._documents[url] = (time.monotonic() + self.cache_ttl, document)
 
     async def _load_did_document(self, did: str, options: dict):
         # Resolver expects plain did without path, query, etc...
@@ -60,7 +106,8 @@ class DocumentLoader:
     def _load_http_document(self, url: str, options: dict):
         document = self.requests_loader(url, options)
 
-        return document
+        # keep the resolved context in the shared pyld cache
+        return {**document, "tag": "static"}
 
     # Async document loader can use await for cache and did resolver
     async def _load_async(self, url: str, options: dict):
@@ -87,12 +134,17 @@ class DocumentLoader:
         Document loading is processed in separate thread to deal with
         async to sync transformation.
         """
+        document = self._get_cached(url)
+        if document:
+            return document
+
         cache_key = f"json_ld_document_resolver::{url}"
 
         # Try to get from cache
         if self.cache:
             document = await self.cache.get(cache_key)
             if document:
+                self._set_cached(url, document)
                 return document
 
         document = await self._load_async(url, options)
@@ -100,19 +152,92 @@ class DocumentLoader:
         # Cache document, if cache is available
         if self.cache:
             await self.cache.set(cache_key, document, self.cache_ttl)
+        self._set_cached(url, document)
 
         return document
 
+    async def prefetch(self, urls: Iterable[str], concurrency: int = 10):
+        """Load the documents for DID URLs ahead of the operations using them.
+
+        Each DID is resolved once, however many of its URLs are given, and
+        the document is cached for each of those URLs. Errors are ignored:
+        they are raised again by the operation loading the document.
+
+        Args:
+            urls: the DID URLs to load
+            concurrency: the maximum number of DIDs resolved at a time
+
+        """
+        by_did: Dict[str, Set[str]] = {}
+        for url in urls:
+            if url and url.startswith("did:"):
+                did = DIDUrl.parse(url).did if DIDUrl.is_valid(url) else url
+                by_did.setdefault(did, set()).add(url)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(did: str, did_urls: Set[str]):
+            async with semaphore:
+                try:
+                    document = await self.load_document(did, {})
+                except Exception:
+                    return
+            for url in did_urls:
+                self._set_cached(url, document)
+
+        await asyncio.gather(*(load(did, urls) for did, urls in by_did.items()))
+
     def __call__(self, url: str, options: dict):
         """Load JSON-LD Document."""
 
+        document = self._get_cached(url)
+        if document:
+            return document
+
+        try:
+            asyncio.get_running_loop()
+            on_loop = True
+        except RuntimeError:
+            on_loop = False
+
         loop = self._event_loop
-        coroutine = self.load_document(url, options)
-        document = loop.run_until_complete(coroutine)
+        if on_loop or not loop.is_running():
+            # called directly rather than through `run`: load synchronously
+            return loop.run_until_complete(self.load_document(url, options))
 
-        return document
+        if url.startswith("http://") or url.startswith("https://"):
+            document = self._load_http_document(url, options)
+            self._set_cached(url, document)
+            return document
+
+        return asyncio.run_coroutine_threadsafe(
+            self.load_document(url, options), loop
+        ).result()
+
+    async def run(self, operation: Callable, /, *args, **kwargs) -> Any:
+        """Run a JSON-LD operation on a worker thread and return the result.
+
+        The operation may use this loader to load documents.
+        """
+        self._event_loop = asyncio.get_running_loop()
+        return await self._event_loop.run_in_executor(
+            _get_executor(), functools.partial(operation, *args, **kwargs)
+        )
 
 
 DocumentLoaderMethod = Callable[[str, dict], dict]
 
-__all__ = ["DocumentLoaderMethod", "DocumentLoader"]
+
+async def run_jsonld(
+    document_loader: DocumentLoaderMethod, operation: Callable, /, *args, **kwargs
+) -> Any:
+    """Run a JSON-LD operation using a document loader.
+
+    The operation runs on a worker thread for a `DocumentLoader`, and directly
+    for other document loader methods.
+    """
+    if isinstance(document_loader, DocumentLoader):
+        return await document_loader.run(operation, *args, **kwargs)
+    return operation(*args, **kwargs)
+
+
+__all__ = ["DocumentLoaderMethod", "DocumentLoader", "run_jsonld"]
@@ -27,7 +27,7 @@ from ....wallet.util import b64_to_bytes, bytes_to_b64
 from ..crypto import _KeyPair as KeyPair
 from ..error import LinkedDataProofException
 from ..validation_result import ProofResult
-from ..document_loader import DocumentLoaderMethod
+from ..document_loader import DocumentLoaderMethod, run_jsonld
 from ..purposes import _ProofPurpose as ProofPurpose
 
 from .bbs_bls_signature_2020 import BbsBlsSignature2020
@@ -68,6 +68,25 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
         nonce: bytes = None,
     ):
         """Derive proof for document, return dict with derived document and proof."""
+        return await run_jsonld(
+            document_loader,
+            self._derive_proof,
+            proof=proof,
+            document=document,
+            reveal_document=reveal_document,
+            document_loader=document_loader,
+            nonce=nonce,
+        )
+
+    def _derive_proof(
+        self,
+        *,
+        proof: dict,
+        document: dict,
+        reveal_document: dict,
+        document_loader: DocumentLoaderMethod,
+        nonce: bytes = None,
+    ):
         assert_ursa_bbs_signatures_installed()
 
         # Validate that the input proof document has a proof compatible with this suite
@@ -226,6 +245,23 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
         document_loader: DocumentLoaderMethod,
     ) -> ProofResult:
         """Verify proof against document and proof purpose."""
+        return await run_jsonld(
+            document_loader,
+            self._verify_proof,
+            proof=proof,
+            document=document,
+            purpose=purpose,
+            document_loader=document_loader,
+        )
+
+    def _verify_proof(
+        self,
+        *,
+        proof: dict,
+        document: dict,
+        purpose: ProofPurpose,
+        document_loader: DocumentLoaderMethod,
+    ) -> ProofResult:
         assert_ursa_bbs_signatures_installed()
         try:
             proof["type"] = self.mapped_derived_proof_type
@@ -6,6 +6,7 @@ from typing import ClassVar, List, Optional, Union
 from pyld import jsonld
 from typing_extensions import TypedDict
 
+from ..canonization import CANONIZATION_CACHE, scoped_cache_key
 from ..check import get_properties_without_context
 from ..constants import SECURITY_CONTEXT_URL
 from ..document_loader import DocumentLoaderMethod
@@ -109,8 +110,17 @@ class LinkedDataProof(ABC):
         )
 
     def _canonize(self, *, input, document_loader: DocumentLoaderMethod) -> str:
-        """Canonize input document using URDNA2015 algorithm."""
-        # application/n-quads format always returns str
+        """Canonize input document using URDNA2015 algorithm.
+
+        Results are cached by document content and document loader, and only
+        once the document has been checked for terms missing from its context,
+        so a document which has been canonized before is not processed again.
+        """
+        key = scoped_cache_key("c14n-checked", document_loader, input)
+        nquads = CANONIZATION_CACHE.get(key)
+        if nquads is not None:
+            return nquads
+
         missing_properties = get_properties_without_context(input, document_loader)
 
         if len(missing_properties) > 0:
@@ -119,7 +129,8 @@ class LinkedDataProof(ABC):
                 f"Provide definitions in context to correct. {missing_properties}"
             )
 
-        return jsonld.normalize(
+        # application/n-quads format always returns str
+        nquads = jsonld.normalize(
             input,
             {
                 "algorithm": "URDNA2015",
@@ -127,6 +138,8 @@ class LinkedDataProof(ABC):
                 "documentLoader": document_loader,
             },
         )
+        CANONIZATION_CACHE.set(key, nquads)
+        return nquads
 
     def _get_verification_method(
         self, *, proof: dict, document_loader: DocumentLoaderMethod
@@ -6,14 +6,18 @@ from hashlib import sha256
 from pytz import utc
 from typing import Optional, Union
 
+from ..canonization import CANONIZATION_CACHE, scoped_cache_key
 from ..constants import SECURITY_CONTEXT_URL
-from ..document_loader import DocumentLoaderMethod
+from ..document_loader import DocumentLoaderMethod, run_jsonld
 from ..error import LinkedDataProofException
 from ..purposes import _ProofPurpose as ProofPurpose
 from ..validation_result import ProofResult
 
 from .linked_data_proof import LinkedDataProof
 
+# proof properties holding the signature, which is not part of the signed data
+SIGNATURE_PROPERTIES = ("jws", "signatureValue", "proofValue")
+
 
 class LinkedDataSignature(LinkedDataProof, metaclass=ABCMeta):
     """Linked Data Signature class."""
@@ -108,8 +112,12 @@ class LinkedDataSignature(LinkedDataProof, metaclass=ABCMeta):
         proof = purpose.update(proof)
 
         # Create data to sign
-        verify_data = self._create_verify_data(
-            proof=proof, document=document, document_loader=document_loader
+        verify_data = await run_jsonld(
+            document_loader,
+            self._create_verify_data,
+            proof=proof,
+            document=document,
+            document_loader=document_loader,
         )
 
         # Sign data
@@ -128,13 +136,20 @@ class LinkedDataSignature(LinkedDataProof, metaclass=ABCMeta):
         """Verify proof against document and proof purpose."""
         try:
             # Create data to verify
-            verify_data = self._create_verify_data(
-                proof=proof, document=document, document_loader=document_loader
+            verify_data = await run_jsonld(
+                document_loader,
+                self._create_verify_data,
+                proof=proof,
+                document=document,
+                document_loader=document_loader,
             )
 
             # Fetch verification method
-            verification_method = self._get_verification_method(
-                proof=proof, document_loader=document_loader
+            verification_method = await run_jsonld(
+                document_loader,
+                self._get_verification_method,
+                proof=proof,
+                document_loader=document_loader,
             )
 
             # Verify signature on data
@@ -151,7 +166,9 @@ class LinkedDataSignature(LinkedDataProof, metaclass=ABCMeta):
                 )
 
             # Ensure proof was performed for a valid purpose
-            purpose_result = purpose.validate(
+            purpose_result = await run_jsonld(
+                document_loader,
+                purpose.validate,
                 proof=proof,
                 document=document,
                 suite=self,
@@ -174,6 +191,21 @@ class LinkedDataSignature(LinkedDataProof, metaclass=ABCMeta):
         self, *, proof: dict, document: dict, document_loader: DocumentLoaderMethod
     ) -> bytes:
         """Create signing or verification data."""
+        key = scoped_cache_key(
+            "verify_data",
+            document_loader,
+            self.signature_type,
+            {
+                name: value
+                for name, value in proof.items()
+                if name not in SIGNATURE_PROPERTIES
+            },
+            document,
+        )
+        verify_data = CANONIZATION_CACHE.get(key)
+        if verify_data is not None:
+            return verify_data
+
         c14n_proof_options = self._canonize_proof(
             proof=proof, document=document, document_loader=document_loader
         )
@@ -181,10 +213,12 @@ class LinkedDataSignature(LinkedDataProof, metaclass=ABCMeta):
 
         # TODO: detect any dropped properties using expand/contract step
 
-        return (
+        verify_data = (
             sha256(c14n_proof_options.encode("utf-8")).digest()
             + sha256(c14n_doc.encode("utf-8")).digest()
         )
+        CANONIZATION_CACHE.set(key, verify_data)
+        return verify_data
 
     def _canonize_proof(
         self, *, proof: dict, document: dict, document_loader: DocumentLoaderMethod
@@ -196,8 +230,7 @@ class LinkedDataSignature(LinkedDataProof, metaclass=ABCMeta):
             "@context": document.get("@context") or SECURITY_CONTEXT_URL,
         }
 
-        proof.pop("jws", None)
-        proof.pop("signatureValue", None)
-        proof.pop("proofValue", None)
+        for name in SIGNATURE_PROPERTIES:
+            proof.pop(name, None)
 
         return self._canonize(input=proof, document_loader=document_loader)
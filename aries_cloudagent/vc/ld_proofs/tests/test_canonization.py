@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from ....tests import mock
+from ...tests.document_loader import custom_document_loader
+from ..canonization import (
+    CANONIZATION_CACHE,
+    CanonizationCache,
+    cache_key,
+    canonize,
+    loader_scope,
+    scoped_cache_key,
+)
+from ..error import LinkedDataProofException
+from ..suites.ed25519_signature_2018 import Ed25519Signature2018
+from .test_doc import DOC_TEMPLATE
+
+
+class TestCanonizationCache(TestCase):
+    def test_cache_key(self):
+        assert cache_key({"a": 1, "b": 2}) == cache_key({"b": 2, "a": 1})
+        assert cache_key({"a": 1}) != cache_key({"a": 2})
+        assert cache_key("c14n", {"a": 1}) != cache_key("other", {"a": 1})
+
+    def test_get_set(self):
+        cache = CanonizationCache()
+        assert cache.get("key") is None
+        cache.set("key", "value")
+        cache.set("key", "other")
+        assert cache.get("key") == "other"
+        assert cache.stats() == {"entries": 1, "bytes": 5, "hits": 1, "misses": 1}
+        cache.clear()
+        assert cache.get("key") is None
+        assert cache.stats()["bytes"] == 0
+
+    def test_max_entries(self):
+        cache = CanonizationCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_max_bytes(self):
+        cache = CanonizationCache(max_bytes=10)
+        cache.set("a", "12345")
+        cache.set("b", "12345")
+        cache.set("c", "123")
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 8
+        cache.set("d", "12345678901")
+        assert cache.get("d") is None
+
+    def test_uncacheable_key(self):
+        cache = CanonizationCache()
+        cache.set(None, "value")
+        assert cache.get(None) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_loader_scope(self):
+        def other_loader(url, options):
+            return custom_document_loader(url, options)
+
+        scope = loader_scope(custom_document_loader)
+        assert scope and loader_scope(custom_document_loader) == scope
+        assert loader_scope(other_loader) != scope
+        assert loader_scope(None) == ""
+        # loaders which cannot be tracked are not cached
+        assert scoped_cache_key("c14n", {}.get, {}) is None
+        assert scoped_cache_key("c14n", custom_document_loader, {}) != (
+            scoped_cache_key("c14n", other_loader, {})
+        )
+
+    def test_canonize(self):
+        CANONIZATION_CACHE.clear()
+        nquads = canonize(DOC_TEMPLATE, custom_document_loader)
+        assert "<http://schema.org/name>" in nquads
+        with mock.patch("pyld.jsonld.normalize") as normalize:
+            assert canonize(dict(DOC_TEMPLATE), custom_document_loader) == nquads
+            normalize.assert_not_called()
+
+    def test_canonize_checked_separately(self):
+        CANONIZATION_CACHE.clear()
+        doc = {
+            "@context": {"name": "http://schema.org/name"},
+            "name": "a",
+            "undefinedProp": "x",
+        }
+        # terms missing from the context are dropped without error here
+        assert canonize(doc, custom_document_loader)
+        suite = Ed25519Signature2018(key_pair=mock.MagicMock())
+        with self.assertRaises(LinkedDataProofException):
+            suite._canonize(input=doc, document_loader=custom_document_loader)
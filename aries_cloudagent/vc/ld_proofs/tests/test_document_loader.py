@@ -0,0 +1,89 @@
+import threading
+from unittest import IsolatedAsyncioTestCase
+
+from pyld import jsonld
+
+from ....core.in_memory import InMemoryProfile
+from ....tests import mock
+from ....resolver.base import ResolverError
+from ....resolver.did_resolver import DIDResolver
+from ..document_loader import DocumentLoader, run_jsonld
+
+CREDENTIALS_CONTEXT = "https://www.w3.org/2018/credentials/v1"
+DID_DOC = {"@context": "https://www.w3.org/ns/did/v1", "id": "did:example:123"}
+
+
+class TestDocumentLoader(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.resolver = mock.MagicMock(DIDResolver, autospec=True)
+        self.resolver.resolve = mock.CoroutineMock(return_value=DID_DOC)
+        self.profile = InMemoryProfile.test_profile(bind={DIDResolver: self.resolver})
+        self.loader = DocumentLoader(self.profile)
+
+    async def test_load_http_document_static(self):
+        document = await self.loader.load_document(CREDENTIALS_CONTEXT, {})
+        assert document["tag"] == "static"
+        assert document["documentUrl"] == CREDENTIALS_CONTEXT
+        assert self.loader(CREDENTIALS_CONTEXT, {}) is document
+
+    async def test_cached_documents_expire(self):
+        self.loader._set_cached("did:example:123", {"document": {}})
+        assert self.loader._get_cached("did:example:123")
+        self.loader.cache_ttl = -1
+        self.loader._set_cached("did:example:123", {"document": {}})
+        assert self.loader._get_cached("did:example:123") is None
+        assert not self.loader._documents
+
+    async def test_cached_documents_limit(self):
+        with mock.patch.object(DocumentLoader, "DOCUMENT_CACHE_SIZE", 2):
+            for i in range(3):
+                self.loader._set_cached(f"did:example:{i}", {"document": {}})
+        assert list(self.loader._documents) == ["did:example:1", "did:example:2"]
+
+    async def test_run_on_worker(self):
+        threads = []
+
+        def operation(url):
+            threads.append(threading.current_thread())
+            return self.loader(url, {})
+
+        document = await self.loader.run(operation, "did:example:123")
+        assert document["document"] == DID_DOC
+        assert threads[0] is not threading.current_thread()
+        self.resolver.resolve.assert_awaited_once_with(self.profile, "did:example:123")
+
+    async def test_run_expand(self):
+        options = {"documentLoader": self.loader}
+        credential = {
+            "@context": [CREDENTIALS_CONTEXT],
+            "type": ["VerifiableCredential"],
+            "issuer": "did:example:123",
+        }
+        expanded = await run_jsonld(self.loader, jsonld.expand, credential, options)
+        assert expanded == jsonld.expand(credential, options)
+
+    async def test_run_jsonld_other_loader(self):
+        threads = []
+
+        def operation(value, *, document_loader):
+            threads.append(threading.current_thread())
+            return value
+
+        assert await run_jsonld(len, operation, 1, document_loader=len) == 1
+        assert threads == [threading.current_thread()]
+
+    async def test_prefetch(self):
+        self.resolver.resolve.side_effect = [DID_DOC, ResolverError("not found")]
+        await self.loader.prefetch(
+            [
+                "did:example:123#key-1",
+                "did:example:123",
+                "did:example:456#key-1",
+                "https://example.org/key",
+                None,
+            ]
+        )
+        assert self.resolver.resolve.await_count == 2
+        assert self.loader._get_cached("did:example:123#key-1")["document"] == DID_DOC
+        assert self.loader._get_cached("did:example:123")["document"] == DID_DOC
+        assert self.loader._get_cached("did:example:456#key-1") is None
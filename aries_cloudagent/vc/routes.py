@@ -1,10 +1,15 @@
 """VC-API Routes."""
 
+import asyncio
+import json
+from typing import Awaitable, Callable, Sequence
+
 from aiohttp import web
 from aiohttp_apispec import docs, request_schema, response_schema
 from marshmallow.exceptions import ValidationError
 import uuid
 from ..admin.request_context import AdminRequestContext
+from ..messaging.models.base import BaseModelError
 from ..storage.error import StorageError, StorageNotFoundError, StorageDuplicateError
 from ..wallet.error import WalletError
 from ..wallet.base import BaseWallet
@@ -238,6 +243,136 @@ async def verify_presentation_route(request: web.BaseRequest):
         return web.json_response({"message": str(err)}, status=400)
 
 
+BATCH_VERIFY_CONCURRENCY = 10
+
+BATCH_VERIFY_ERRORS = (
+    BaseModelError,
+    ValidationError,
+    VcLdpManagerError,
+    ResolverError,
+    ValueError,
+    WalletError,
+    InjectionError,
+)
+
+
+async def _verify_batch(
+    request: web.BaseRequest,
+    items: Sequence[dict],
+    verify: Callable[[dict], Awaitable[dict]],
+) -> web.StreamResponse:
+    """Verify the items of a batch concurrently, streaming results as NDJSON.
+
+    Each result is written as soon as it is ready, so results are not in
+    request order: each line holds the index of its item in the request.
+    """
+    response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+    await response.prepare(request)
+    semaphore = asyncio.Semaphore(BATCH_VERIFY_CONCURRENCY)
+
+    async def verify_item(index: int, item: dict) -> dict:
+        async with semaphore:
+            try:
+                result = await verify(item)
+            except BATCH_VERIFY_ERRORS as err:
+                result = {"verified": False, "message": str(err)}
+            except (KeyError, TypeError, AttributeError):
+                result = {"verified": False, "message": "Malformed batch item"}
+        return {"index": index, **result}
+
+    tasks = [
+        asyncio.ensure_future(verify_item(index, item))
+        for index, item in enumerate(items)
+    ]
+    try:
+        for task in asyncio.as_completed(tasks):
+            line = json.dumps(await task) + "\n"
+            await response.write(line.encode("utf-8"))
+    finally:
+        # stop verifying if the client has gone away
+        for task in tasks:
+            task.cancel()
+    await response.write_eof()
+    return response
+
+
+@docs(
+    tags=["vc-api"],
+    summary="Verify several credentials",
+    produces=["application/x-ndjson"],
+)
+@request_schema(web_schemas.VerifyCredentialBatchRequest())
+@response_schema(
+    web_schemas.VerifyBatchResult(),
+    200,
+    description="One verification result per line, in order of completion",
+)
+async def verify_credential_batch_route(request: web.BaseRequest):
+    """Request handler for verifying several credentials concurrently.
+
+    A failure to verify one credential is reported in its own result and
+    does not affect the others.
+
+    Args:
+        request: aiohttp request object
+
+    """
+    body = await request.json()
+    context: AdminRequestContext = request["context"]
+    manager = VcLdpManager(context.profile)
+    items = body["items"]
+
+    await manager.prefetch_verification_methods(
+        [item.get("verifiableCredential") for item in items], BATCH_VERIFY_CONCURRENCY
+    )
+
+    async def verify(item: dict) -> dict:
+        vc = VerifiableCredential.deserialize(item["verifiableCredential"])
+        result = await manager.verify_credential(vc)
+        return result.serialize()
+
+    return await _verify_batch(request, items, verify)
+
+
+@docs(
+    tags=["vc-api"],
+    summary="Verify several presentations",
+    produces=["application/x-ndjson"],
+)
+@request_schema(web_schemas.VerifyPresentationBatchRequest())
+@response_schema(
+    web_schemas.VerifyBatchResult(),
+    200,
+    description="One verification result per line, in order of completion",
+)
+async def verify_presentation_batch_route(request: web.BaseRequest):
+    """Request handler for verifying several presentations concurrently.
+
+    A failure to verify one presentation is reported in its own result and
+    does not affect the others.
+
+    Args:
+        request: aiohttp request object
+
+    """
+    body = await request.json()
+    context: AdminRequestContext = request["context"]
+    manager = VcLdpManager(context.profile)
+    items = body["items"]
+
+    await manager.prefetch_verification_methods(
+        [item.get("verifiablePresentation") for item in items], BATCH_VERIFY_CONCURRENCY
+    )
+
+    async def verify(item: dict) -> dict:
+        vp = VerifiablePresentation.deserialize(item["verifiablePresentation"])
+        options = LDProofVCOptions.deserialize(item.get("options") or {})
+        result = await manager.verify_presentation(vp, options)
+        return result.serialize()
+
+    return await _verify_batch(request, items, verify)
+
+
 async def register(app: web.Application):
     """Register routes."""
 
@@ -252,8 +387,10 @@ async def register(app: web.Application):
             web.post("/vc/credentials/issue", issue_credential_route),
             web.post("/vc/credentials/store", store_credential_route),
             web.post("/vc/credentials/verify", verify_credential_route),
+            web.post("/vc/credentials/verify-batch", verify_credential_batch_route),
             web.post("/vc/presentations/prove", prove_presentation_route),
             web.post("/vc/presentations/verify", verify_presentation_route),
+            web.post("/vc/presentations/verify-batch", verify_presentation_batch_route),
         ]
     )
 
@@ -0,0 +1,130 @@
+import json
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from ...admin.request_context import AdminRequestContext
+from ...core.in_memory import InMemoryProfile
+from ...resolver.base import ResolverError
+from ...tests import mock
+from .. import routes as test_module
+from ..ld_proofs.validation_result import DocumentVerificationResult
+from ..vc_ld.validation_result import PresentationVerificationResult
+
+CREDENTIAL = {
+    "@context": ["https://www.w3.org/2018/credentials/v1"],
+    "type": ["VerifiableCredential"],
+    "issuer": "did:example:issuer",
+    "issuanceDate": "2020-01-01T00:00:00Z",
+    "credentialSubject": {"id": "did:example:subject"},
+    "proof": {
+        "type": "Ed25519Signature2018",
+        "proofPurpose": "assertionMethod",
+        "verificationMethod": "did:example:issuer#key-1",
+        "created": "2020-01-01T00:00:00Z",
+        "jws": "eyJhbGciOiAiRWREU0EifQ..c2lnbmF0dXJl",
+    },
+}
+PRESENTATION = {
+    "@context": ["https://www.w3.org/2018/credentials/v1"],
+    "type": ["VerifiablePresentation"],
+    "verifiableCredential": [CREDENTIAL],
+    "proof": {
+        **CREDENTIAL["proof"],
+        "proofPurpose": "authentication",
+        "verificationMethod": "did:example:holder#key-1",
+        "challenge": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    },
+}
+
+
+class TestVcBatchRoutes(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.context = AdminRequestContext.test_context({}, self.profile)
+
+        @web.middleware
+        async def set_context(request, handler):
+            request["context"] = self.context
+            return await handler(request)
+
+        app = web.Application(middlewares=[set_context])
+        await test_module.register(app)
+        self.client = TestClient(TestServer(app))
+        await self.client.start_server()
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    async def post_lines(self, path: str, body: dict):
+        response = await self.client.post(path, json=body)
+        assert response.status == 200
+        assert response.content_type == "application/x-ndjson"
+        lines = (await response.text()).splitlines()
+        return sorted((json.loads(line) for line in lines), key=lambda r: r["index"])
+
+    async def test_verify_credential_batch(self):
+        with mock.patch.object(
+            test_module, "VcLdpManager", autospec=True
+        ) as mock_mgr_cls:
+            mock_mgr = mock_mgr_cls.return_value
+            mock_mgr.verify_credential = mock.CoroutineMock(
+                side_effect=[
+                    DocumentVerificationResult(verified=True),
+                    ResolverError("unable to resolve"),
+                ]
+            )
+            results = await self.post_lines(
+                "/vc/credentials/verify-batch",
+                {
+                    "items": [
+                        {"verifiableCredential": CREDENTIAL},
+                        {"verifiableCredential": CREDENTIAL},
+                        {"verifiableCredential": {"type": "not a credential"}},
+                        {"options": {}},
+                    ]
+                },
+            )
+            mock_mgr.prefetch_verification_methods.assert_awaited_once()
+
+        assert [result["index"] for result in results] == [0, 1, 2, 3]
+        assert results[0]["verified"] is True
+        assert results[1] == {
+            "index": 1,
+            "verified": False,
+            "message": "unable to resolve",
+        }
+        assert results[2]["verified"] is False
+        assert results[3] == {
+            "index": 3,
+            "verified": False,
+            "message": "Malformed batch item",
+        }
+
+    async def test_verify_presentation_batch(self):
+        with mock.patch.object(
+            test_module, "VcLdpManager", autospec=True
+        ) as mock_mgr_cls:
+            mock_mgr = mock_mgr_cls.return_value
+            mock_mgr.verify_presentation = mock.CoroutineMock(
+                return_value=PresentationVerificationResult(verified=True)
+            )
+            results = await self.post_lines(
+                "/vc/presentations/verify-batch",
+                {
+                    "items": [
+                        {
+                            "verifiablePresentation": PRESENTATION,
+                            "options": {"challenge": "challenge"},
+                        }
+                    ]
+                },
+            )
+            mock_mgr.prefetch_verification_methods.assert_awaited_once_with(
+                [PRESENTATION], test_module.BATCH_VERIFY_CONCURRENCY
+            )
+
+        assert results == [{"index": 0, "verified": True}]
+        options = mock_mgr.verify_presentation.call_args[0][1]
+        assert options.challenge == "challenge"
@@ -1,6 +1,6 @@
 """Manager for performing Linked Data Proof signatures over JSON-LD formatted W3C VCs."""
 
-from typing import Dict, List, Optional, Type, Union, cast
+from typing import Dict, Iterator, List, Optional, Sequence, Type, Union, cast
 
 from pyld import jsonld
 from pyld.jsonld import JsonLdProcessor
@@ -18,7 +18,7 @@ from ..ld_proofs.constants import (
     SECURITY_CONTEXT_ED25519_2020_URL,
 )
 from ..ld_proofs.crypto.wallet_key_pair import WalletKeyPair
-from ..ld_proofs.document_loader import DocumentLoader
+from ..ld_proofs.document_loader import DocumentLoader, run_jsonld
 from ..ld_proofs.purposes.authentication_proof_purpose import AuthenticationProofPurpose
 from ..ld_proofs.purposes.credential_issuance_purpose import CredentialIssuancePurpose
 from ..ld_proofs.purposes.proof_purpose import ProofPurpose
@@ -84,6 +84,21 @@ KEY_TYPE_SIGNATURE_TYPE_MAPPING = {
 }
 
 
+def _verification_method_urls(document: dict) -> Iterator[str]:
+    """Yield the verification methods of the proofs on a VC or VP."""
+    proofs = document.get("proof") or []
+    for proof in proofs if isinstance(proofs, list) else [proofs]:
+        method = proof.get("verificationMethod") if isinstance(proof, dict) else None
+        if isinstance(method, dict):
+            method = method.get("id")
+        if isinstance(method, str):
+            yield method
+    credentials = document.get("verifiableCredential") or []
+    for credential in credentials if isinstance(credentials, list) else [credentials]:
+        if isinstance(credential, dict):
+            yield from _verification_method_urls(credential)
+
+
 class VcLdpManagerError(Exception):
     """Generic VcLdpManager Error."""
 
@@ -413,8 +428,11 @@ class VcLdpManager:
 
         # Saving expanded type as a cred_tag
         document_loader = self.profile.inject(DocumentLoader)
-        expanded = jsonld.expand(
-            vc.serialize(), options={"documentLoader": document_loader}
+        expanded = await run_jsonld(
+            document_loader,
+            jsonld.expand,
+            vc.serialize(),
+            options={"documentLoader": document_loader},
         )
         types = JsonLdProcessor.get_values(
             expanded[0],
@@ -448,6 +466,25 @@ class VcLdpManager:
             document_loader=self.profile.inject(DocumentLoader),
         )
 
+    async def prefetch_verification_methods(
+        self, documents: Sequence[dict], concurrency: int = 10
+    ):
+        """Resolve the DIDs used to verify the proofs on several VCs or VPs.
+
+        Verifying the documents afterwards finds the DID documents already
+        loaded, rather than resolving them one at a time.
+        """
+        document_loader = self.profile.inject(DocumentLoader)
+        await document_loader.prefetch(
+            (
+                url
+                for document in documents
+                if isinstance(document, dict)
+                for url in _verification_method_urls(document)
+            ),
+            concurrency,
+        )
+
     async def prove(
         self, presentation: VerifiablePresentation, options: LDProofVCOptions
     ) -> VerifiablePresentation:
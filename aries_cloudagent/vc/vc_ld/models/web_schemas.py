@@ -1,6 +1,6 @@
 """VC-API routes web requests schemas."""
 
-from marshmallow import fields
+from marshmallow import fields, validate
 from ....messaging.models.openapi import OpenAPISchema
 
 from ..validation_result import (
@@ -79,3 +79,57 @@ class VerifyPresentationResponse(OpenAPISchema):
     """Request schema for verifying an LDP VP."""
 
     results = fields.Nested(PresentationVerificationResultSchema)
+
+
+BATCH_VERIFY_MAX = 1000
+
+
+class VerifyCredentialBatchRequest(OpenAPISchema):
+    """Request schema for verifying several credentials."""
+
+    items = fields.List(
+        # items are checked one at a time, so that one invalid item fails alone
+        fields.Dict(),
+        required=True,
+        validate=validate.Length(min=1, max=BATCH_VERIFY_MAX),
+        metadata={
+            "description": (
+                "Credentials to verify, each in the form of a request to verify "
+                "a single credential"
+            )
+        },
+    )
+
+
+class VerifyPresentationBatchRequest(OpenAPISchema):
+    """Request schema for verifying several presentations."""
+
+    items = fields.List(
+        # items are checked one at a time, so that one invalid item fails alone
+        fields.Dict(),
+        required=True,
+        validate=validate.Length(min=1, max=BATCH_VERIFY_MAX),
+        metadata={
+            "description": (
+                "Presentations to verify, each in the form of a request to verify "
+                "a single presentation"
+            )
+        },
+    )
+
+
+class VerifyBatchResult(OpenAPISchema):
+    """Result of verifying a single document in a batch, as a line of NDJSON."""
+
+    index = fields.Int(
+        required=True,
+        metadata={"description": "Position of the document in the request"},
+    )
+    verified = fields.Bool(
+        required=False,
+        metadata={"description": "Whether the document was verified"},
+    )
+    message = fields.Str(
+        required=False,
+        metadata={"description": "Reason the document could not be verified"},
+    )
@@ -393,3 +393,26 @@ async def test_store(
         holder = session.inject(VCHolder)
         record = await holder.retrieve_credential_by_id(record_id=TEST_UUID)
     assert record
+
+
+@pytest.mark.asyncio
+async def test_prefetch_verification_methods(manager: VcLdpManager):
+    presentation = {
+        "proof": {"verificationMethod": "did:example:holder#key-1"},
+        "verifiableCredential": [
+            {
+                "proof": [
+                    {"verificationMethod": {"id": "did:example:issuer#key-1"}},
+                    {"type": "no verification method"},
+                ]
+            }
+        ],
+    }
+    document_loader = manager.profile.inject(DocumentLoader)
+    with mock.patch.object(
+        document_loader, "prefetch", mock.CoroutineMock()
+    ) as mock_prefetch:
+        await manager.prefetch_verification_methods([presentation, None], 5)
+        urls, concurrency = mock_prefetch.call_args[0]
+        assert list(urls) == ["did:example:holder#key-1", "did:example:issuer#key-1"]
+        assert concurrency == 5